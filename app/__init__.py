@@ -28,9 +28,10 @@ def create_app(config_name: str | None = None) -> Flask:
     
     This is the main application factory that:
     - Loads configuration
-    - Initializes extensions (database, metrics)
+    - Initializes extensions (database and its SQLite profile, metrics,
+      profiling, task cache, events, group commit, idempotency keys)
     - Registers blueprints
-    - Registers error handlers
+    - Registers error handlers and CLI commands
     - Creates database tables if needed
     
     Args:
@@ -57,6 +58,9 @@ def create_app(config_name: str | None = None) -> Flask:
     
     # Security settings
     app.config.setdefault("SQLALCHEMY_TRACK_MODIFICATIONS", False)
+
+    # Size the connection pool for the worker model (DB_POOL_PROFILE)
+    _init_engine_options(app)
     
     # Log database connection status (without exposing secrets)
     app.logger.info(
@@ -64,15 +68,33 @@ def create_app(config_name: str | None = None) -> Flask:
     )
 
     # Initialize extensions
-    from app.extensions import db, metrics
+    from app.extensions import db, init_sqlite_pragmas
+    from app.utils.metrics import init_metrics
+    from app.utils.query_metrics import init_query_metrics
+    from app.utils.profiling import init_profiling
     db.init_app(app)
-    metrics.init_app(app)
+    init_sqlite_pragmas(app)
+    init_metrics(app)
+    init_query_metrics(app)
+    init_profiling(app)
+
+    from app.services.cache import init_task_cache
+    from app.services.events import init_event_broker
+    from app.services.group_commit import init_group_commit
+    from app.services.idempotency import init_idempotency
+    init_task_cache(app)
+    init_event_broker(app)
+    init_group_commit(app)
+    init_idempotency(app)
 
     # Register blueprints
     _register_blueprints(app)
     
     # Register error handlers
     _register_error_handlers(app)
+
+    # Register CLI commands
+    _register_cli(app)
     
     # Create database tables in non-production environments
     _init_database(app)
@@ -106,6 +128,21 @@ def _init_database_uri(app: Flask) -> None:
         app.config["SQLALCHEMY_DATABASE_URI"] = uri
 
 
+def _init_engine_options(app: Flask) -> None:
+    """Merge the pool profile's options into SQLALCHEMY_ENGINE_OPTIONS.
+    
+    Args:
+        app: Flask application instance
+    """
+    from app.utils.db_pool import engine_options
+
+    options = engine_options(app.config, app.config.get("SQLALCHEMY_DATABASE_URI", ""))
+    if options:
+        app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+            **app.config.get("SQLALCHEMY_ENGINE_OPTIONS", {}), **options
+        }
+
+
 def _get_normalized_db_uri() -> str:
     """Get database URI from environment and normalize it for SQLAlchemy.
     
@@ -136,10 +173,12 @@ def _register_blueprints(app: Flask) -> None:
     Args:
         app: Flask application instance
     """
+    from app.api.admin import bp as admin_bp
     from app.api.tasks import bp as tasks_bp
     from app.web.routes import bp as web_bp
 
     app.register_blueprint(tasks_bp, url_prefix="/api/v1")
+    app.register_blueprint(admin_bp)
     app.register_blueprint(web_bp)  # UI at "/"
 
 
@@ -158,6 +197,16 @@ def _register_error_handlers(app: Flask) -> None:
         return {"message": "pong"}, 200
 
 
+def _register_cli(app: Flask) -> None:
+    """Register the ``flask tasks`` command group.
+    
+    Args:
+        app: Flask application instance
+    """
+    from app.cli import tasks_cli
+    app.cli.add_command(tasks_cli)
+
+
 def _init_database(app: Flask) -> None:
     """Initialize database tables in non-production environments.
     
@@ -0,0 +1,75 @@
+"""Admin-only API routes (request profiles).
+
+Every route requires ``Authorization: Bearer <ADMIN_TOKEN>``. When no
+ADMIN_TOKEN is configured, or profiling is disabled, the routes answer
+404 as if they did not exist.
+"""
+import hmac
+from typing import Optional
+
+from flask import Blueprint, Response, current_app, request, send_file
+
+from app.utils.profiling import get_request_profiler
+from app.utils.response_builder import ResponseBuilder
+from app.utils.constants import (
+    HTTP_OK, HTTP_UNAUTHORIZED, ERR_PROFILE_NOT_FOUND, ERR_UNAUTHORIZED,
+)
+
+bp = Blueprint("admin", __name__, url_prefix="/api/v1/admin")
+
+
+@bp.before_request
+def _require_admin() -> Optional[tuple]:
+    """Reject requests without the admin bearer token."""
+    token = current_app.config.get("ADMIN_TOKEN", "")
+    if not token or get_request_profiler() is None:
+        return ResponseBuilder.not_found()
+    scheme, _, credentials = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(
+        credentials.encode(), token.encode()
+    ):
+        return ResponseBuilder.error(ERR_UNAUTHORIZED, HTTP_UNAUTHORIZED)
+    return None
+
+
+@bp.route("/profiles", methods=["GET"])
+def list_profiles():
+    """List the most recent request profiles, newest first.
+
+    Query parameters:
+        limit: Number of profiles returned (1-100, default 20)
+
+    Returns:
+        Profile descriptions (name, created_ms, method, duration_ms,
+        endpoint, size)
+    """
+    limit = min(max(request.args.get("limit", 20, type=int), 1), 100)
+    return ResponseBuilder.success(get_request_profiler().recent(limit), HTTP_OK)
+
+
+@bp.route("/profiles/<name>", methods=["GET"])
+def get_profile(name: str):
+    """Download one profile.
+
+    Query parameters:
+        format: ``pstats`` (default, binary file for pstats/snakeviz) or
+            ``text`` (top functions by cumulative time)
+
+    Args:
+        name: Profile name from the listing
+
+    Returns:
+        The profile, or 404 if it does not exist (or was rotated out)
+    """
+    profiler = get_request_profiler()
+    if profiler is None:
+        return ResponseBuilder.not_found()
+    if request.args.get("format") == "text":
+        summary = profiler.summary(name)
+        if summary is None:
+            return ResponseBuilder.not_found(ERR_PROFILE_NOT_FOUND)
+        return Response(summary, mimetype="text/plain")
+    path = profiler.path(name)
+    if path is None:
+        return ResponseBuilder.not_found(ERR_PROFILE_NOT_FOUND)
+    return send_file(path, mimetype="application/octet-stream", as_attachment=True)
@@ -1,15 +1,35 @@
 """API routes for tasks."""
-from flask import Blueprint, request
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from flask import Blueprint, Response, current_app, request, stream_with_context
 from pydantic import ValidationError
 from app.services.task_service import TaskService
-from app.schemas.task import TaskCreate, TaskUpdate
+from app.services.cache import get_task_cache
+from app.services.events import get_event_broker
+from app.services.idempotency import idempotent
+from app.schemas.task import (
+    TaskCreate, TaskUpdate, TaskListQuery, TaskBatchCreate,
+    TaskBulkUpdate, TaskBulkDelete, TaskExportQuery, TaskChangesQuery,
+    TaskFieldsQuery,
+)
+from app.models.task import Task, PUBLIC_FIELDS
+from app.utils.pagination import encode_sync_token, split_page
+from app.utils.conditional import (
+    collection_etag, if_match_versions, is_not_modified, not_modified,
+    task_etag, with_validators,
+)
 from app.utils.response_builder import ResponseBuilder
 from app.utils.constants import (
     HTTP_OK, HTTP_CREATED, HTTP_NO_CONTENT, 
     HTTP_UNPROCESSABLE_ENTITY, HTTP_NOT_FOUND, HTTP_INTERNAL_SERVER_ERROR,
-    ERR_TASK_NOT_FOUND, ERR_VALIDATION_FAILED, ERR_INTERNAL_ERROR
+    HTTP_PRECONDITION_FAILED, HTTP_SERVICE_UNAVAILABLE, HTTP_GONE,
+    ERR_TASK_NOT_FOUND, ERR_VALIDATION_FAILED, ERR_INTERNAL_ERROR,
+    ERR_PRECONDITION_FAILED, ERR_TOO_MANY_STREAMS, ERR_SYNC_TOKEN_EXPIRED,
+    ERR_STREAMS_UNAVAILABLE,
 )
-from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
+from app.utils.metrics import metrics_response
 
 bp = Blueprint("api", __name__, url_prefix="/api/v1")
 
@@ -30,6 +50,40 @@ def _parse_request_json(schema_class):
         return None, ResponseBuilder.validation_error(str(e))
 
 
+def _use_row_path() -> bool:
+    """Whether reads go through the column-tuple path (fast path or cache)."""
+    return bool(
+        current_app.config.get("TASKS_FAST_READ_PATH")
+        or get_task_cache().enabled
+    )
+
+
+def _parse_query_args(schema_class):
+    """Parse and validate query string arguments against schema.
+    
+    Args:
+        schema_class: Pydantic schema class for validation
+        
+    Returns:
+        Tuple of (parsed_data, error_response) where one will be None
+    """
+    try:
+        data = schema_class(**request.args.to_dict())
+        return data, None
+    except ValidationError as e:
+        return None, ResponseBuilder.validation_error(str(e))
+
+
+def _missing_or_precondition_failed(task_id: int, if_match):
+    """Explain why a conditional write matched no row (404 or 412).
+    
+    Only runs on the failure path, so successful writes stay one statement.
+    """
+    if if_match is not None and TaskService.task_exists(task_id):
+        return ResponseBuilder.error(ERR_PRECONDITION_FAILED, HTTP_PRECONDITION_FAILED)
+    return ResponseBuilder.not_found(f"{ERR_TASK_NOT_FOUND}: {task_id}")
+
+
 @bp.route("/health", methods=["GET"])
 def health_check():
     """Health check endpoint.
@@ -42,23 +96,240 @@ def health_check():
 
 @bp.route("/tasks", methods=["GET"])
 def get_tasks():
-    """Get all tasks.
+    """Get one page of tasks, newest first.
+    
+    Query parameters:
+        limit: Page size (default and maximum defined in constants)
+        cursor: Opaque cursor returned as ``next_cursor`` by the previous page
+        q: Full-text search; returns up to ``limit`` best matches, ranked,
+            in a single page (cannot be combined with ``cursor``)
+        completed: Only open (false) or completed (true) tasks
+        created_after / created_before / updated_after: ISO-8601 bounds
+        sort: created_at or updated_at, ``-`` prefix for descending
+            (default ``-created_at``)
+        fields: Comma-separated sparse fieldset, e.g. ``id,title,completed``
+    
+    Returns:
+        Page of tasks as JSON with a ``next_cursor`` (null on the last page)
+    """
+    try:
+        params, error_response = _parse_query_args(TaskListQuery)
+        if error_response:
+            return error_response
+
+        # Validate conditional requests before loading any row
+        version, last_modified, count = TaskService.get_collection_state()
+        etag = collection_etag(version, last_modified, count, params.model_dump_json())
+        if is_not_modified(etag, last_modified):
+            return not_modified(etag, last_modified)
+
+        # fields=None keeps the full column list; otherwise only the
+        # requested columns (never an unrequested description) are read
+        output = params.selected_fields
+        fields = output if params.fields else None
+        if params.q is not None:
+            rows = TaskService.search_tasks(
+                params.q, limit=params.limit, criteria=params, fields=fields
+            )
+            response, status = ResponseBuilder.fast_json(
+                {"data": [Task.row_to_raw_dict(row, output) for row in rows],
+                 "next_cursor": None},
+                HTTP_OK,
+            )
+        elif _use_row_path():
+            rows = TaskService.get_task_rows(
+                limit=params.limit + 1, after=params.after,
+                criteria=params, sort=params.sort, fields=fields,
+            )
+            page, next_cursor = split_page(
+                rows, params.limit,
+                key=lambda row: (getattr(row, params.sort_column), row.id),
+                scope=params.cursor_scope,
+            )
+            response, status = ResponseBuilder.fast_json(
+                {"data": [Task.row_to_raw_dict(row, output) for row in page],
+                 "next_cursor": next_cursor},
+                HTTP_OK,
+            )
+        else:
+            # Fetch one extra row to learn whether another page exists
+            tasks = TaskService.get_all_tasks(
+                limit=params.limit + 1, after=params.after,
+                criteria=params, sort=params.sort, fields=fields,
+            )
+            page, next_cursor = split_page(
+                tasks, params.limit,
+                key=lambda task: (getattr(task, params.sort_column), task.id),
+                scope=params.cursor_scope,
+            )
+            task_dicts = [task.to_dict(output) for task in page]
+            response, status = ResponseBuilder.paginated(task_dicts, next_cursor, HTTP_OK)
+        return with_validators(response, etag, last_modified), status
+    except Exception as e:
+        return ResponseBuilder.server_error(f"{ERR_INTERNAL_ERROR}: {str(e)}")
+
+
+@bp.route("/tasks/changes", methods=["GET"])
+def get_task_changes():
+    """Incremental change feed for clients that mirror the task list.
+    
+    Query parameters:
+        since: Sync token from a previous response (omit for a full sync)
+        limit: Maximum number of changes and of deletions per response
     
     Returns:
-        List of all tasks as JSON
+        Changed tasks, ids of deleted tasks, the next sync token and
+        whether more changes are pending (poll again immediately if so);
+        410 if the token is older than the deletion log retention
     """
     try:
-        tasks = TaskService.get_all_tasks()
-        task_dicts = [task.to_dict() for task in tasks]
-        return ResponseBuilder.success(task_dicts, HTTP_OK)
+        params, error_response = _parse_query_args(TaskChangesQuery)
+        if error_response:
+            return error_response
+
+        lag = current_app.config.get("TASK_CHANGES_SAFETY_LAG_SECONDS", 0)
+        retention = current_app.config.get("TASK_DELETIONS_RETENTION_DAYS", 0)
+        # Tombstones the token has not seen may have been pruned since
+        if retention and params.is_expired(
+            timedelta(days=retention) - timedelta(seconds=lag)
+        ):
+            return ResponseBuilder.error(ERR_SYNC_TOKEN_EXPIRED, HTTP_GONE)
+
+        changes, deletions, has_more, position = TaskService.get_changes(
+            params.position, params.limit, lag
+        )
+        return ResponseBuilder.success(
+            {
+                "changes": [Task.row_to_dict(row) for row in changes],
+                "deleted": [row.task_id for row in deletions],
+                "next_token": encode_sync_token(position, datetime.now(timezone.utc)),
+                "has_more": has_more,
+            },
+            HTTP_OK,
+        )
     except Exception as e:
         return ResponseBuilder.server_error(f"{ERR_INTERNAL_ERROR}: {str(e)}")
 
 
+@bp.route("/tasks/stats", methods=["GET"])
+def get_task_stats():
+    """Task totals for dashboards, read from incrementally kept counters.
+    
+    Returns:
+        JSON with ``total``, ``open`` and ``completed`` counts
+    """
+    try:
+        return ResponseBuilder.success(TaskService.get_stats(), HTTP_OK)
+    except Exception as e:
+        return ResponseBuilder.server_error(f"{ERR_INTERNAL_ERROR}: {str(e)}")
+
+
+@bp.route("/tasks/stream", methods=["GET"])
+def stream_task_events():
+    """Push task change events to the browser as Server-Sent Events.
+    
+    Events: ``task.created`` / ``task.updated`` (task data),
+    ``task.deleted`` (``{"id"}``), ``tasks.deleted`` (``{"ids"}``) and
+    ``tasks.invalidated`` (bulk change; reload the list). A ``resync``
+    event is sent before the stream closes if the client fell behind.
+    
+    Each stream holds a worker thread while open; single-threaded workers
+    refuse them.
+    
+    Returns:
+        ``text/event-stream`` response, or 503 when at capacity
+    """
+    broker = get_event_broker()
+    if broker.max_subscribers == 0:
+        return ResponseBuilder.error(ERR_STREAMS_UNAVAILABLE, HTTP_SERVICE_UNAVAILABLE)
+    subscription = broker.subscribe()
+    if subscription is None:
+        return ResponseBuilder.error(ERR_TOO_MANY_STREAMS, HTTP_SERVICE_UNAVAILABLE)
+    heartbeat = current_app.config.get("TASK_EVENTS_HEARTBEAT_SECONDS", 15)
+
+    def generate():
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                event = subscription.get(timeout=heartbeat)
+                if subscription.dropped:
+                    yield "event: resync\ndata: {}\n\n"
+                    return
+                if event is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                event_id, event_type, payload = event
+                yield f"id: {event_id}\nevent: {event_type}\ndata: {json.dumps(payload)}\n\n"
+        finally:
+            broker.unsubscribe(subscription)
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _ndjson_chunks(chunks):
+    """Render row chunks as newline-delimited JSON."""
+    for rows in chunks:
+        yield "".join(json.dumps(Task.row_to_dict(row)) + "\n" for row in rows)
+
+
+def _csv_chunks(chunks):
+    """Render row chunks as CSV, starting with a header line."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=PUBLIC_FIELDS)
+    writer.writeheader()
+    for rows in chunks:
+        writer.writerows(Task.row_to_dict(row) for row in rows)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+@bp.route("/tasks/export", methods=["GET"])
+def export_tasks():
+    """Stream every task as NDJSON or CSV.
+    
+    Query parameters:
+        format: ``ndjson`` (default) or ``csv``
+    
+    Rows are read from a server-side cursor and written out chunk by
+    chunk, so memory stays flat and the first bytes are sent immediately.
+    
+    Returns:
+        Streaming response with the exported tasks
+    """
+    params, error_response = _parse_query_args(TaskExportQuery)
+    if error_response:
+        return error_response
+
+    chunks = TaskService.stream_task_rows()
+    if params.format == "csv":
+        body, mimetype = _csv_chunks(chunks), "text/csv"
+    else:
+        body, mimetype = _ndjson_chunks(chunks), "application/x-ndjson"
+    return Response(
+        stream_with_context(body),
+        mimetype=mimetype,
+        headers={
+            "Content-Disposition": f"attachment; filename=tasks.{params.format}"
+        },
+    )
+
+
 @bp.route("/tasks", methods=["POST"])
+@idempotent
 def create_task():
     """Create a new task.
     
+    Send an ``Idempotency-Key`` header to make retries safe: a repeated
+    key returns the first response instead of creating another task
+    (this also applies to the other write endpoints).
+    
     Returns:
         Created task as JSON (201) or error response
     """
@@ -75,10 +346,98 @@ def create_task():
         return ResponseBuilder.server_error(f"{ERR_INTERNAL_ERROR}: {str(e)}")
 
 
+@bp.route("/tasks", methods=["PATCH"])
+@idempotent
+def bulk_update_tasks():
+    """Update all tasks matching an id list and/or filter.
+    
+    Expects ``{"ids": [...], "filter": {...}, "changes": {"completed": bool}}``
+    where at least one of ``ids`` or ``filter`` is given.
+    
+    Returns:
+        Number of updated tasks as JSON
+    """
+    try:
+        bulk, error_response = _parse_request_json(TaskBulkUpdate)
+        if error_response:
+            return error_response
+
+        affected = TaskService.bulk_update(bulk, bulk.changes)
+        return ResponseBuilder.success({"affected": affected}, HTTP_OK)
+    except Exception as e:
+        return ResponseBuilder.server_error(f"{ERR_INTERNAL_ERROR}: {str(e)}")
+
+
+@bp.route("/tasks", methods=["DELETE"])
+@idempotent
+def bulk_delete_tasks():
+    """Delete all tasks matching an id list and/or filter.
+    
+    Expects ``{"ids": [...], "filter": {...}}`` with at least one of them.
+    
+    Returns:
+        Number of deleted tasks as JSON
+    """
+    try:
+        bulk, error_response = _parse_request_json(TaskBulkDelete)
+        if error_response:
+            return error_response
+
+        affected = TaskService.bulk_delete(bulk)
+        return ResponseBuilder.success({"affected": affected}, HTTP_OK)
+    except Exception as e:
+        return ResponseBuilder.server_error(f"{ERR_INTERNAL_ERROR}: {str(e)}")
+
+
+@bp.route("/tasks/batch", methods=["POST"])
+@idempotent
+def create_tasks_batch():
+    """Create many tasks in one request.
+    
+    Expects ``{"tasks": [...]}`` with up to MAX_BATCH_SIZE items. Each
+    item is validated on its own; valid items are created in a single
+    transaction and invalid ones are reported without aborting the batch.
+    
+    Returns:
+        Per-item results (in request order) and a summary of counts
+    """
+    try:
+        batch, error_response = _parse_request_json(TaskBatchCreate)
+        if error_response:
+            return error_response
+
+        results = [None] * len(batch.tasks)
+        valid_items = []
+        for index, item in enumerate(batch.tasks):
+            try:
+                valid_items.append((index, TaskCreate(**item)))
+            except ValidationError as e:
+                results[index] = {"index": index, "status": "invalid", "error": str(e)}
+
+        created = TaskService.create_tasks([data for _, data in valid_items])
+        for (index, _), (row, is_new) in zip(valid_items, created):
+            results[index] = {
+                "index": index,
+                "status": "created" if is_new else "duplicate",
+                "data": Task.row_to_dict(row),
+            }
+
+        summary = {
+            status: sum(1 for result in results if result["status"] == status)
+            for status in ("created", "duplicate", "invalid")
+        }
+        return ResponseBuilder.success({"results": results, "summary": summary}, HTTP_OK)
+    except Exception as e:
+        return ResponseBuilder.server_error(f"{ERR_INTERNAL_ERROR}: {str(e)}")
+
+
 @bp.route("/tasks/<int:task_id>", methods=["GET"])
 def get_task(task_id: int):
     """Get a specific task by ID.
     
+    Query parameters:
+        fields: Comma-separated sparse fieldset, e.g. ``id,title,completed``
+    
     Args:
         task_id: Task ID
         
@@ -86,15 +445,42 @@ def get_task(task_id: int):
         Task as JSON or 404 error
     """
     try:
-        task = TaskService.get_task_by_id(task_id)
-        if not task:
-            return ResponseBuilder.not_found(f"{ERR_TASK_NOT_FOUND}: {task_id}")
-        return ResponseBuilder.success(task.to_dict(), HTTP_OK)
+        params, error_response = _parse_query_args(TaskFieldsQuery)
+        if error_response:
+            return error_response
+        output = params.selected_fields
+        fields = output if params.fields else None
+
+        # Answer conditional requests from updated_at alone
+        if request.if_none_match or request.if_modified_since:
+            stored_at = TaskService.get_task_updated_at(task_id)
+            if stored_at is not None:
+                etag = task_etag(task_id, stored_at)
+                if is_not_modified(etag, stored_at):
+                    return not_modified(etag, stored_at)
+
+        if _use_row_path():
+            row = TaskService.get_task_row(task_id, fields=fields)
+            if row is None:
+                return ResponseBuilder.not_found(f"{ERR_TASK_NOT_FOUND}: {task_id}")
+            response, status = ResponseBuilder.fast_json(
+                {"data": Task.row_to_raw_dict(row, output)}, HTTP_OK
+            )
+            updated_at = row.updated_at
+        else:
+            task = TaskService.get_task_by_id(task_id, fields=fields)
+            if not task:
+                return ResponseBuilder.not_found(f"{ERR_TASK_NOT_FOUND}: {task_id}")
+            response, status = ResponseBuilder.success(task.to_dict(output), HTTP_OK)
+            updated_at = task.updated_at
+        etag = task_etag(task_id, updated_at)
+        return with_validators(response, etag, updated_at), status
     except Exception as e:
         return ResponseBuilder.server_error(f"{ERR_INTERNAL_ERROR}: {str(e)}")
 
 
 @bp.route("/tasks/<int:task_id>", methods=["PUT"])
+@idempotent
 def update_task(task_id: int):
     """Update a specific task by ID.
     
@@ -105,24 +491,27 @@ def update_task(task_id: int):
         Updated task as JSON or error response
     """
     try:
-        # Check if task exists
-        task = TaskService.get_task_by_id(task_id)
-        if not task:
-            return ResponseBuilder.not_found(f"{ERR_TASK_NOT_FOUND}: {task_id}")
-        
         # Parse and validate request
         task_data, error_response = _parse_request_json(TaskUpdate)
         if error_response:
             return error_response
-            
-        # Update task
-        updated_task = TaskService.update_task(task, task_data)
-        return ResponseBuilder.success(updated_task.to_dict(), HTTP_OK)
+
+        # Update task; 404/412 are detected from the empty RETURNING result
+        if_match = if_match_versions(task_id)
+        updated_row = TaskService.update_task(task_id, task_data, if_match)
+        if updated_row is None:
+            return _missing_or_precondition_failed(task_id, if_match)
+        response, status = ResponseBuilder.success(
+            Task.row_to_dict(updated_row), HTTP_OK
+        )
+        etag = task_etag(task_id, updated_row.updated_at)
+        return with_validators(response, etag, updated_row.updated_at), status
     except Exception as e:
         return ResponseBuilder.server_error(f"{ERR_INTERNAL_ERROR}: {str(e)}")
 
 
 @bp.route("/tasks/<int:task_id>", methods=["DELETE"])
+@idempotent
 def delete_task(task_id: int):
     """Delete a specific task by ID.
     
@@ -133,10 +522,9 @@ def delete_task(task_id: int):
         Empty response (204) or error response
     """
     try:
-        task = TaskService.get_task_by_id(task_id)
-        if not task:
-            return ResponseBuilder.not_found(f"{ERR_TASK_NOT_FOUND}: {task_id}")
-        TaskService.delete_task(task)
+        if_match = if_match_versions(task_id)
+        if not TaskService.delete_task(task_id, if_match):
+            return _missing_or_precondition_failed(task_id, if_match)
         return "", HTTP_NO_CONTENT
     except Exception as e:
         return ResponseBuilder.server_error(f"{ERR_INTERNAL_ERROR}: {str(e)}")
@@ -144,9 +532,9 @@ def delete_task(task_id: int):
 
 @bp.route("/metrics", methods=["GET"])
 def metrics():
-    """Prometheus metrics endpoint.
+    """Prometheus metrics endpoint (all workers in multiprocess mode).
     
     Returns:
         Prometheus metrics in text format
     """
-    return generate_latest(), HTTP_OK, {"Content-Type": CONTENT_TYPE_LATEST}
+    return metrics_response()
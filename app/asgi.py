@@ -0,0 +1,495 @@
+"""ASGI entry point serving the task API on async SQLAlchemy.
+
+A gunicorn sync/gthread worker holds one thread per request for the whole
+database round-trip, so concurrency is capped at workers x threads. This
+module serves the core ``/api/v1/tasks`` contract from an event loop
+instead: handlers await an async engine (aiosqlite locally, asyncpg on
+PostgreSQL) through :class:`AsyncTaskService`, which executes the same
+statements as :class:`TaskService`.
+
+Served routes: health, ping, list/search/create tasks, stats, and
+get/update/delete of a single task, with the same query parameters,
+envelopes, validators (ETag, Last-Modified, If-Match) and status codes as
+the Flask app, and writes honour ``Idempotency-Key``. Everything else
+(batch and bulk writes, export, the change feed, event streams, metrics,
+admin, the web UI) is only served by ``create_app()``. The read cache is
+not used here, so collection ETags are computed with version 0.
+
+When this app and ``create_app()`` serve one database side by side, a
+write here bumps the Flask read cache's version if TASK_CACHE_BACKEND is
+shared (``sqlite:///``); with the per-worker ``local`` backend, Flask
+workers keep serving cached reads until the TTL. Event streams never see
+writes made here: they live in WSGI worker memory, so clients of a mixed
+deployment must catch up through ``/api/v1/tasks/changes``.
+
+Run with ``uvicorn asgi:app --workers N``.
+"""
+import json
+import logging
+import re
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from werkzeug.datastructures import ETags
+from werkzeug.http import parse_date, parse_etags
+
+from app.extensions import install_sqlite_pragmas, sqlite_pragma_statements
+from app.models.task import Task
+from app.schemas.task import TaskCreate, TaskFieldsQuery, TaskListQuery, TaskUpdate
+from app.services.async_task_service import AsyncTaskService
+from app.services.cache import create_version_backend
+from app.services.idempotency import (
+    IdempotencyStore, create_idempotency_store, request_fingerprint,
+)
+from app.utils.conditional import (
+    accepted_versions, collection_etag, evaluate_not_modified, task_etag,
+    validator_headers,
+)
+from app.utils.constants import (
+    HTTP_OK, HTTP_CREATED, HTTP_NO_CONTENT, HTTP_NOT_MODIFIED, HTTP_BAD_REQUEST,
+    HTTP_NOT_FOUND, HTTP_METHOD_NOT_ALLOWED, HTTP_PRECONDITION_FAILED,
+    HTTP_UNPROCESSABLE_ENTITY, HTTP_INTERNAL_SERVER_ERROR,
+    ERR_TASK_NOT_FOUND, ERR_PRECONDITION_FAILED, ERR_INVALID_JSON,
+    ERR_METHOD_NOT_ALLOWED, ERR_INTERNAL_ERROR,
+)
+from app.utils.db_pool import engine_options
+from app.utils.error_handlers import APIError
+from app.utils.pagination import split_page
+from app.utils.serialization import dumps
+from config.settings import config
+
+logger = logging.getLogger(__name__)
+
+# (status, headers, body) of a response
+AsyncResponse = Tuple[int, Dict[str, str], bytes]
+
+# Sync driver -> async driver of the same database
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgres": "postgresql+asyncpg",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+
+
+def async_database_uri(uri: str) -> str:
+    """Rewrite a sync SQLAlchemy URI to the matching async driver.
+
+    Args:
+        uri: Database URI as configured for the Flask app
+
+    Returns:
+        URI using aiosqlite or asyncpg (unchanged if already async)
+    """
+    scheme, separator, rest = uri.partition("://")
+    return _ASYNC_DRIVERS.get(scheme, scheme) + separator + rest
+
+
+class AsyncRequest:
+    """The parts of an ASGI HTTP request the handlers read.
+
+    Args:
+        scope: ASGI connection scope
+        body: Complete request body
+    """
+
+    def __init__(self, scope: Dict[str, Any], body: bytes) -> None:
+        self.method: str = scope["method"]
+        self.path: str = scope["path"]
+        self.body = body
+        self.query_string: str = scope.get("query_string", b"").decode("latin-1")
+        # First value wins for repeated parameters, like MultiDict.to_dict()
+        self.args: Dict[str, str] = {}
+        for name, value in parse_qsl(self.query_string, keep_blank_values=True):
+            self.args.setdefault(name, value)
+        self.headers: Dict[str, str] = {
+            name.decode("latin-1").lower(): value.decode("latin-1")
+            for name, value in scope.get("headers", [])
+        }
+
+    def json(self) -> Any:
+        """Decode the JSON body (an empty body reads as ``{}``).
+
+        Raises:
+            APIError: 400 if the body is not valid JSON
+        """
+        try:
+            return json.loads(self.body) if self.body else {}
+        except ValueError:
+            raise APIError(ERR_INVALID_JSON, HTTP_BAD_REQUEST) from None
+
+    @property
+    def if_match(self) -> ETags:
+        """Parsed If-Match header."""
+        return parse_etags(self.headers.get("if-match"))
+
+    @property
+    def if_none_match(self) -> ETags:
+        """Parsed If-None-Match header."""
+        return parse_etags(self.headers.get("if-none-match"))
+
+    @property
+    def if_modified_since(self) -> Any:
+        """Parsed If-Modified-Since header, or None."""
+        return parse_date(self.headers.get("if-modified-since"))
+
+
+def _json(
+    body: Dict[str, Any], status: int = HTTP_OK, headers: Optional[Dict[str, str]] = None
+) -> AsyncResponse:
+    """Build a JSON response (same encoder as ResponseBuilder.fast_json)."""
+    return status, {"Content-Type": "application/json", **(headers or {})}, dumps(body)
+
+
+def _error(message: str, status: int) -> AsyncResponse:
+    """Build an error response with the ResponseBuilder envelope."""
+    return _json({"error": message}, status)
+
+
+def _empty(status: int, headers: Optional[Dict[str, str]] = None) -> AsyncResponse:
+    """Build a response without a body (204, 304)."""
+    return status, headers or {}, b""
+
+
+def _parse(schema_class: Any, data: Any) -> Any:
+    """Validate ``data`` against a schema (ValidationError becomes a 422)."""
+    if not isinstance(data, dict):
+        data = {}
+    return schema_class(**data)
+
+
+async def _missing_or_precondition_failed(
+    session: AsyncSession, task_id: int, if_match: Any
+) -> AsyncResponse:
+    """Explain why a conditional write matched no row (404 or 412)."""
+    if if_match is not None and await AsyncTaskService.task_exists(session, task_id):
+        return _error(ERR_PRECONDITION_FAILED, HTTP_PRECONDITION_FAILED)
+    return _error(f"{ERR_TASK_NOT_FOUND}: {task_id}", HTTP_NOT_FOUND)
+
+
+async def health(request: AsyncRequest, session: AsyncSession) -> AsyncResponse:
+    """Health check endpoint."""
+    return _json({"data": {"status": "healthy"}})
+
+
+async def ping(request: AsyncRequest, session: AsyncSession) -> AsyncResponse:
+    """Simple ping endpoint for health checks."""
+    return _json({"message": "pong"})
+
+
+async def get_tasks(request: AsyncRequest, session: AsyncSession) -> AsyncResponse:
+    """Get one page of tasks, newest first (see the Flask ``get_tasks``)."""
+    params = _parse(TaskListQuery, request.args)
+
+    last_modified, count = await AsyncTaskService.get_collection_state(session)
+    etag = collection_etag(0, last_modified, count, params.model_dump_json())
+    validators = validator_headers(etag, last_modified)
+    if evaluate_not_modified(
+        request.if_none_match, request.if_modified_since, etag, last_modified
+    ):
+        return _empty(HTTP_NOT_MODIFIED, validators)
+
+    output = params.selected_fields
+    fields = output if params.fields else None
+    if params.q is not None:
+        page = await AsyncTaskService.search_tasks(
+            session, params.q, limit=params.limit, criteria=params, fields=fields
+        )
+        next_cursor = None
+    else:
+        rows = await AsyncTaskService.get_task_rows(
+            session, limit=params.limit + 1, after=params.after,
+            criteria=params, sort=params.sort, fields=fields,
+        )
+        page, next_cursor = split_page(
+            rows, params.limit,
+            key=lambda row: (getattr(row, params.sort_column), row.id),
+            scope=params.cursor_scope,
+        )
+    return _json(
+        {"data": [Task.row_to_raw_dict(row, output) for row in page],
+         "next_cursor": next_cursor},
+        headers=validators,
+    )
+
+
+async def create_task(request: AsyncRequest, session: AsyncSession) -> AsyncResponse:
+    """Create a new task."""
+    task_data = _parse(TaskCreate, request.json())
+    row = await AsyncTaskService.create_task(session, task_data)
+    return _json({"data": Task.row_to_raw_dict(row)}, HTTP_CREATED)
+
+
+async def get_task_stats(request: AsyncRequest, session: AsyncSession) -> AsyncResponse:
+    """Task totals read from the counters table."""
+    return _json({"data": await AsyncTaskService.get_stats(session)})
+
+
+async def get_task(
+    request: AsyncRequest, session: AsyncSession, task_id: int
+) -> AsyncResponse:
+    """Get a specific task by ID.
+
+    Conditional requests are answered from the same single SELECT, so a
+    304 costs no more than a 200.
+    """
+    params = _parse(TaskFieldsQuery, request.args)
+    output = params.selected_fields
+    fields = output if params.fields else None
+
+    row = await AsyncTaskService.get_task_row(session, task_id, fields=fields)
+    if row is None:
+        return _error(f"{ERR_TASK_NOT_FOUND}: {task_id}", HTTP_NOT_FOUND)
+    etag = task_etag(task_id, row.updated_at)
+    validators = validator_headers(etag, row.updated_at)
+    if evaluate_not_modified(
+        request.if_none_match, request.if_modified_since, etag, row.updated_at
+    ):
+        return _empty(HTTP_NOT_MODIFIED, validators)
+    return _json({"data": Task.row_to_raw_dict(row, output)}, headers=validators)
+
+
+async def update_task(
+    request: AsyncRequest, session: AsyncSession, task_id: int
+) -> AsyncResponse:
+    """Update a specific task by ID (If-Match aware)."""
+    task_data = _parse(TaskUpdate, request.json())
+    if_match = accepted_versions(request.if_match, task_id)
+    row = await AsyncTaskService.update_task(session, task_id, task_data, if_match)
+    if row is None:
+        return await _missing_or_precondition_failed(session, task_id, if_match)
+    etag = task_etag(task_id, row.updated_at)
+    return _json(
+        {"data": Task.row_to_raw_dict(row)},
+        headers=validator_headers(etag, row.updated_at),
+    )
+
+
+async def delete_task(
+    request: AsyncRequest, session: AsyncSession, task_id: int
+) -> AsyncResponse:
+    """Delete a specific task by ID (If-Match aware)."""
+    if_match = accepted_versions(request.if_match, task_id)
+    if not await AsyncTaskService.delete_task(session, task_id, if_match):
+        return await _missing_or_precondition_failed(session, task_id, if_match)
+    return _empty(HTTP_NO_CONTENT)
+
+
+Handler = Callable[..., Awaitable[AsyncResponse]]
+
+# Path pattern -> handler per method; integer path parameters only
+ROUTES: List[Tuple["re.Pattern[str]", Dict[str, Handler]]] = [
+    (re.compile(r"/api/v1/health"), {"GET": health}),
+    (re.compile(r"/api/v1/ping"), {"GET": ping}),
+    (re.compile(r"/api/v1/tasks"), {"GET": get_tasks, "POST": create_task}),
+    (re.compile(r"/api/v1/tasks/stats"), {"GET": get_task_stats}),
+    (
+        re.compile(r"/api/v1/tasks/(?P<task_id>\d+)"),
+        {"GET": get_task, "PUT": update_task, "DELETE": delete_task},
+    ),
+]
+
+
+class TaskASGIApp:
+    """ASGI application dispatching to the async task handlers.
+
+    Args:
+        engine: Async engine for the task database
+        create_tables: Create missing tables on startup (non-production)
+        idempotency: Store for Idempotency-Key responses (None disables it)
+        dedup_window: TASK_DEDUP_WINDOW_SECONDS for task creation
+        versions: Shared read-cache version backend bumped after every
+            write, so Flask workers drop cached reads (None skips it)
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        create_tables: bool = False,
+        idempotency: Optional[IdempotencyStore] = None,
+        dedup_window: float = 0,
+        versions: Any = None,
+    ) -> None:
+        self.engine = engine
+        self.sessions = async_sessionmaker(
+            engine, expire_on_commit=False, info={"dedup_window": dedup_window}
+        )
+        self.create_tables = create_tables
+        self.idempotency = idempotency
+        self.versions = versions
+
+    async def startup(self) -> None:
+        """Create the tables (and search index) if configured to."""
+        if self.create_tables:
+            from app.extensions import db
+
+            async with self.engine.begin() as connection:
+                await connection.run_sync(db.metadata.create_all)
+
+    async def shutdown(self) -> None:
+        """Close every pooled connection."""
+        await self.engine.dispose()
+
+    async def dispatch(self, request: AsyncRequest) -> AsyncResponse:
+        """Route a request and run its handler in a fresh session.
+
+        Writes carrying an Idempotency-Key are answered from the
+        idempotency store when the key was seen before. Store lookups are
+        synchronous; they hit memory or a local SQLite file.
+
+        Args:
+            request: Parsed request
+
+        Returns:
+            Response tuple
+        """
+        for pattern, methods in ROUTES:
+            match = pattern.fullmatch(request.path)
+            if match is None:
+                continue
+            handler = methods.get(request.method)
+            if handler is None:
+                status, headers, body = _error(ERR_METHOD_NOT_ALLOWED, HTTP_METHOD_NOT_ALLOWED)
+                headers["Allow"] = ", ".join(methods)
+                return status, headers, body
+            params = {name: int(value) for name, value in match.groupdict().items()}
+            key = request.headers.get("idempotency-key")
+            if self.idempotency is None or key is None or request.method == "GET":
+                return await self._run(handler, request, params)
+
+            fingerprint = request_fingerprint(
+                request.method, request.path, request.query_string, request.body
+            )
+            try:
+                stored = self.idempotency.begin(key, fingerprint)
+            except APIError as e:
+                return _json(e.to_dict(), e.status_code)
+            if stored is not None:
+                return stored
+            try:
+                response = await self._run(handler, request, params)
+            except BaseException:
+                self.idempotency.release(key)
+                raise
+            self.idempotency.finish(key, fingerprint, response)
+            return response
+        return _error("Resource not found", HTTP_NOT_FOUND)
+
+    async def _run(
+        self, handler: Handler, request: AsyncRequest, params: Dict[str, int]
+    ) -> AsyncResponse:
+        """Run a handler in a fresh session, turning errors into responses."""
+        try:
+            async with self.sessions() as session:
+                response = await handler(request, session, **params)
+            if self.versions is not None and request.method != "GET" and response[0] < 300:
+                # Synchronous like the idempotency store: a local SQLite file
+                self.versions.bump()
+            return response
+        except ValidationError as e:
+            return _error(str(e), HTTP_UNPROCESSABLE_ENTITY)
+        except APIError as e:
+            return _json(e.to_dict(), e.status_code)
+        except Exception as e:
+            logger.exception("Unhandled error in %s %s", request.method, request.path)
+            return _error(f"{ERR_INTERNAL_ERROR}: {str(e)}", HTTP_INTERNAL_SERVER_ERROR)
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body"):
+                break
+
+        status, headers, body = await self.dispatch(AsyncRequest(scope, b"".join(chunks)))
+        headers["Content-Length"] = str(len(body))
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (name.lower().encode("latin-1"), value.encode("latin-1"))
+                for name, value in headers.items()
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def _lifespan(self, receive: Any, send: Any) -> None:
+        """Handle the ASGI lifespan protocol."""
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await self.startup()
+                except Exception as e:
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+def create_asgi_app(
+    config_name: Optional[str] = None, database_uri: Optional[str] = None
+) -> TaskASGIApp:
+    """Create the ASGI application.
+
+    The database is the Flask app's (``SQLALCHEMY_DATABASE_URI`` from the
+    environment, else the config class) with its driver swapped for an
+    async one, unless ``ASYNC_DATABASE_URI`` overrides it.
+
+    Args:
+        config_name: Configuration name (development/testing/production).
+                    If None, determined from environment variables.
+        database_uri: Explicit async database URI (overrides everything)
+
+    Returns:
+        ASGI application
+    """
+    from app import _get_config_name, _get_normalized_db_uri
+
+    if config_name is None:
+        config_name = _get_config_name()
+    config_obj = config.get(config_name, config["development"])
+
+    uri = (
+        database_uri
+        or config_obj.ASYNC_DATABASE_URI
+        or async_database_uri(
+            _get_normalized_db_uri() or getattr(config_obj, "SQLALCHEMY_DATABASE_URI", "")
+        )
+    )
+    settings = {key: getattr(config_obj, key) for key in dir(config_obj) if key.isupper()}
+    # Always pooled: aiosqlite would otherwise open a connection (and its
+    # thread) per request, and let every pending request contend for the
+    # SQLite write lock
+    options = {
+        **settings.get("SQLALCHEMY_ENGINE_OPTIONS", {}),
+        **engine_options(settings, uri, asynchronous=True),
+    }
+    engine = create_async_engine(uri, **options)
+    install_sqlite_pragmas(engine.sync_engine, sqlite_pragma_statements(settings))
+    return TaskASGIApp(
+        engine,
+        create_tables=config_name != "production",
+        idempotency=create_idempotency_store(settings),
+        dedup_window=settings.get("TASK_DEDUP_WINDOW_SECONDS", 0),
+        versions=_shared_version_backend(settings.get("TASK_CACHE_BACKEND", "local")),
+    )
+
+
+def _shared_version_backend(spec: str) -> Any:
+    """The read-cache version backend Flask workers share, or None if per-worker."""
+    return None if spec == "local" else create_version_backend(spec)
@@ -0,0 +1,123 @@
+"""Flask CLI commands for task maintenance (``flask tasks ...``)."""
+import click
+from flask.cli import AppGroup
+
+tasks_cli = AppGroup("tasks", help="Task database maintenance commands.")
+
+
+@tasks_cli.command("migrate")
+@click.option(
+    "--batch-size",
+    default=1000,
+    show_default=True,
+    help="Rows updated per transaction while backfilling.",
+)
+def migrate_command(batch_size: int) -> None:
+    """Add missing columns and indexes, then backfill derived data."""
+    from app.migrations import upgrade
+
+    applied = upgrade(batch_size=batch_size)
+    for change in applied:
+        click.echo(change)
+    if not applied:
+        click.echo("Schema is up to date")
+
+
+@tasks_cli.command("reconcile")
+def reconcile_command() -> None:
+    """Rebuild the task counters from scratch and report any drift."""
+    from app.services.task_service import TaskService
+
+    drift = TaskService.reconcile_counters()
+    for name, (stored, actual) in drift.items():
+        click.echo(f"{name}: stored {stored}, actual {actual} (drift {stored - actual:+d})")
+    if not drift:
+        click.echo("Counters are accurate")
+
+
+@tasks_cli.command("prune")
+@click.option(
+    "--days",
+    type=float,
+    default=None,
+    help="Tombstone retention (default: TASK_DELETIONS_RETENTION_DAYS).",
+)
+def prune_command(days) -> None:
+    """Delete change-feed tombstones older than the retention window."""
+    from flask import current_app
+
+    from app.services.task_service import TaskService
+
+    if days is None:
+        days = current_app.config.get("TASK_DELETIONS_RETENTION_DAYS", 0)
+    if not days:
+        click.echo("Tombstone retention is disabled")
+        return
+    click.echo(f"Pruned {TaskService.prune_deletions(days)} tombstone(s)")
+
+
+@tasks_cli.command("profile-token")
+@click.option(
+    "--ttl",
+    default=300,
+    show_default=True,
+    help="Seconds the header stays valid.",
+)
+def profile_token_command(ttl: int) -> None:
+    """Print an X-Profile-Request header value that profiles a request."""
+    import time
+
+    from flask import current_app
+
+    from app.utils.profiling import PROFILE_HEADER, sign_profile_request
+
+    secret = current_app.config.get("PROFILING_SECRET")
+    if not secret:
+        raise click.ClickException("PROFILING_SECRET is not set")
+    value = sign_profile_request(secret, int(time.time()) + ttl)
+    click.echo(f"{PROFILE_HEADER}: {value}")
+
+
+@tasks_cli.command("seed")
+@click.option("--count", type=click.IntRange(min=1), required=True, help="Tasks to insert.")
+@click.option(
+    "--completed-ratio",
+    type=click.FloatRange(0, 1),
+    default=0.3,
+    show_default=True,
+    help="Fraction of tasks marked completed.",
+)
+@click.option(
+    "--description-size",
+    type=click.IntRange(min=0),
+    default=120,
+    show_default=True,
+    help="Approximate description length in characters (0 for none).",
+)
+@click.option("--seed", type=int, default=None, help="Random seed for reproducible data.")
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=10000,
+    show_default=True,
+    help="Rows generated and committed per transaction.",
+)
+def seed_command(
+    count: int, completed_ratio: float, description_size: int, seed, chunk_size: int
+) -> None:
+    """Insert synthetic tasks in bulk (COPY on PostgreSQL, executemany elsewhere)."""
+    from app.seeding import seed_tasks
+
+    with click.progressbar(length=count, label="Seeding tasks") as bar:
+        report = seed_tasks(
+            count,
+            completed_ratio=completed_ratio,
+            description_size=description_size,
+            seed=seed,
+            chunk_size=chunk_size,
+            progress=bar.update,
+        )
+    click.echo(
+        f"Inserted {report['rows']:,} tasks in {report['seconds']:.1f}s "
+        f"({report['rows_per_second']:,.0f} rows/s, {report['method']})"
+    )
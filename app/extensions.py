@@ -1,5 +1,93 @@
+"""Flask extensions and engine-level database settings.
+
+SQLite connections get a performance profile applied by a ``connect``
+event: WAL journaling lets readers proceed while one writer commits,
+``synchronous=NORMAL`` syncs the WAL at checkpoints instead of every
+commit, memory-mapped I/O and a larger page cache cut read syscalls,
+and ``busy_timeout`` makes writers queue for the lock instead of
+failing. Every pragma comes from the configuration (SQLITE_* settings).
+"""
+from typing import Any, List, Mapping
+
+from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
-from prometheus_flask_exporter import PrometheusMetrics
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 
 db = SQLAlchemy()
-metrics = PrometheusMetrics(None)
+
+# Config key -> pragma, in the order they are applied. busy_timeout comes
+# first so that switching the journal mode waits for a concurrent writer.
+SQLITE_PRAGMAS = (
+    ("SQLITE_BUSY_TIMEOUT_MS", "busy_timeout"),
+    ("SQLITE_JOURNAL_MODE", "journal_mode"),
+    ("SQLITE_SYNCHRONOUS", "synchronous"),
+    ("SQLITE_CACHE_SIZE", "cache_size"),
+    ("SQLITE_MMAP_SIZE", "mmap_size"),
+    ("SQLITE_TEMP_STORE", "temp_store"),
+)
+
+
+def sqlite_pragma_statements(config: Mapping[str, Any]) -> List[str]:
+    """Build the PRAGMA statements of the configured SQLite profile.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        Statements to run on every new connection (empty when the
+        profile is disabled); settings left empty are skipped
+
+    Raises:
+        ValueError: If a setting is not a plain keyword or integer
+    """
+    if not config.get("SQLITE_PRAGMAS_ENABLED"):
+        return []
+    statements = []
+    for key, pragma in SQLITE_PRAGMAS:
+        value = config.get(key)
+        # None and "" skip the pragma; 0 is a real value (mmap off)
+        value = "" if value is None else str(value).strip()
+        if not value:
+            continue
+        if not value.lstrip("-").isalnum():
+            raise ValueError(f"Invalid {key}: {value!r}")
+        statements.append(f"PRAGMA {pragma} = {value}")
+    return statements
+
+
+def install_sqlite_pragmas(engine: Engine, statements: List[str]) -> bool:
+    """Run ``statements`` on every connection ``engine`` opens.
+
+    Args:
+        engine: Engine (the ``sync_engine`` of an async engine)
+        statements: PRAGMA statements from :func:`sqlite_pragma_statements`
+
+    Returns:
+        True if the hook was installed (SQLite engines only)
+    """
+    if engine.dialect.name != "sqlite" or not statements:
+        return False
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+    return True
+
+
+def init_sqlite_pragmas(app: Flask) -> None:
+    """Apply the SQLite profile to the connections of ``app``'s engine.
+
+    Must run before the engine opens its first connection.
+
+    Args:
+        app: Flask application instance
+    """
+    with app.app_context():
+        install_sqlite_pragmas(db.engine, sqlite_pragma_statements(app.config))
@@ -0,0 +1,154 @@
+"""Idempotent schema upgrades for existing databases.
+
+``db.create_all()`` creates missing tables but never alters tables that
+already exist, so databases created by older releases miss columns and
+indexes added since. Every step below inspects the live schema first and
+is safe to run repeatedly (``flask tasks migrate``).
+"""
+from typing import List
+
+from sqlalchemy import bindparam, inspect, select, text, update
+
+from app.extensions import db
+from app.models.task import SQLITE_SECOND_TIMESTAMP_LENGTH, Task, install_search_index
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade(batch_size: int = BACKFILL_BATCH_SIZE) -> List[str]:
+    """Bring the database schema up to date with the models.
+
+    Args:
+        batch_size: Rows updated per transaction while backfilling
+
+    Returns:
+        Human-readable list of the changes that were applied
+    """
+    db.create_all()
+    applied: List[str] = []
+    applied += _add_missing_columns()
+    applied += _create_missing_indexes()
+    with db.engine.begin() as conn:
+        if install_search_index(conn):
+            applied.append("Created full-text search index")
+    backfilled = backfill_content_hashes(batch_size)
+    if backfilled:
+        applied.append(f"Backfilled content_hash for {backfilled} task(s)")
+    normalized = normalize_sqlite_timestamps(batch_size)
+    if normalized:
+        applied.append(f"Normalized timestamps of {normalized} task(s)")
+    # The counters table starts at zero when it is added to a populated
+    # database; rebuild it from the tasks table
+    from app.services.task_service import TaskService
+
+    if TaskService.reconcile_counters():
+        applied.append("Rebuilt task counters")
+    return applied
+
+
+def _add_missing_columns() -> List[str]:
+    """Add nullable model columns that are missing from the tasks table."""
+    table = Task.__table__
+    existing = {col["name"] for col in inspect(db.engine).get_columns(table.name)}
+    applied = []
+    with db.engine.begin() as conn:
+        for column in table.columns:
+            if column.name in existing or not column.nullable:
+                continue
+            col_type = column.type.compile(dialect=db.engine.dialect)
+            conn.execute(
+                text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {col_type}")
+            )
+            applied.append(f"Added column {table.name}.{column.name}")
+    return applied
+
+
+def _create_missing_indexes() -> List[str]:
+    """Create model indexes that are missing from the tasks table."""
+    table = Task.__table__
+    existing = {ix["name"] for ix in inspect(db.engine).get_indexes(table.name)}
+    applied = []
+    for index in table.indexes:
+        if index.name not in existing:
+            index.create(bind=db.engine)
+            applied.append(f"Created index {index.name}")
+    return applied
+
+
+def backfill_content_hashes(batch_size: int = BACKFILL_BATCH_SIZE) -> int:
+    """Compute content_hash for tasks written before the column existed.
+
+    Works in batches of ``batch_size`` rows, one transaction each, so a
+    large table never holds a long-running lock.
+
+    Args:
+        batch_size: Rows updated per transaction
+
+    Returns:
+        Number of tasks updated
+    """
+    table = Task.__table__
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam("_id"))
+        # Keep updated_at: a backfill is not a modification of the task
+        .values(content_hash=bindparam("_hash"), updated_at=table.c.updated_at)
+    )
+    total = 0
+    while True:
+        rows = db.session.execute(
+            select(table.c.id, table.c.title, table.c.description)
+            .where(table.c.content_hash.is_(None))
+            .order_by(table.c.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return total
+        db.session.execute(
+            stmt,
+            [
+                {"_id": row.id, "_hash": Task.compute_content_hash(row.title, row.description)}
+                for row in rows
+            ],
+        )
+        db.session.commit()
+        total += len(rows)
+
+
+def normalize_sqlite_timestamps(batch_size: int = BACKFILL_BATCH_SIZE) -> int:
+    """Give second-precision SQLite timestamps a microsecond part.
+
+    Older releases let SQLite fill ``created_at``/``updated_at`` with
+    CURRENT_TIMESTAMP (``YYYY-MM-DD HH:MM:SS``). SQLite compares the text,
+    so such a row sorts before the ``...SS.000000`` value a cursor or
+    If-Match binds for it: keyset pages repeat it forever and ETags never
+    match. Tables created by those releases keep that column default, so
+    raw inserts that omit the timestamps need this step again.
+
+    Args:
+        batch_size: Rows updated per transaction
+
+    Returns:
+        Number of tasks updated (always 0 on other databases)
+    """
+    if db.engine.dialect.name != "sqlite":
+        return 0
+    total = 0
+    while True:
+        # Connection.execute returns a CursorResult, which has rowcount
+        result = db.session.connection().execute(
+            text(
+                "UPDATE tasks SET "
+                "created_at = CASE WHEN length(created_at) = :short "
+                "THEN created_at || '.000000' ELSE created_at END, "
+                "updated_at = CASE WHEN length(updated_at) = :short "
+                "THEN updated_at || '.000000' ELSE updated_at END "
+                "WHERE id IN (SELECT id FROM tasks WHERE length(created_at) = :short "
+                "OR length(updated_at) = :short LIMIT :limit)"
+            ),
+            {"short": SQLITE_SECOND_TIMESTAMP_LENGTH, "limit": batch_size},
+        )
+        db.session.commit()
+        if not result.rowcount:
+            return total
+        total += result.rowcount
@@ -1,10 +1,57 @@
 """Database models for the application."""
-from datetime import datetime
-from typing import Optional, Dict, Any
+import hashlib
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, Sequence
+from sqlalchemy import DDL, event, text
+from sqlalchemy.orm.attributes import get_history
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql import func
+from sqlalchemy.sql.functions import FunctionElement
 from app.extensions import db
 
 
+# Fields exposed through the API, in serialization order
+PUBLIC_FIELDS = ("id", "title", "description", "completed", "created_at", "updated_at")
+
+
+def _utcnow() -> datetime:
+    """Return the current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
+def _isoformat(value: Any) -> Any:
+    """Format datetimes for JSON; other values pass through."""
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+class UtcTimestamp(FunctionElement):
+    """Server-side current time for rows inserted without timestamps.
+    
+    SQLite stores datetimes as text and compares them as text, so the
+    default must produce the same ``YYYY-MM-DD HH:MM:SS.ffffff`` form
+    SQLAlchemy writes; CURRENT_TIMESTAMP's ``YYYY-MM-DD HH:MM:SS`` sorts
+    before every bound value of the same second and breaks keyset seeks.
+    """
+
+    type = db.DateTime(timezone=True)
+    inherit_cache = True
+
+
+@compiles(UtcTimestamp)
+def _compile_utc_timestamp(element: Any, compiler: Any, **kw: Any) -> str:
+    return compiler.process(func.now(), **kw)
+
+
+@compiles(UtcTimestamp, "sqlite")
+def _compile_utc_timestamp_sqlite(element: Any, compiler: Any, **kw: Any) -> str:
+    # %f is seconds with milliseconds; pad to SQLAlchemy's microseconds
+    return "(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"
+
+
+# Length of a second-precision SQLite timestamp written by older releases
+SQLITE_SECOND_TIMESTAMP_LENGTH = 19
+
+
 class Task(db.Model):  # type: ignore[name-defined]
     """Task model representing a to-do item.
     
@@ -15,36 +62,334 @@ class Task(db.Model):  # type: ignore[name-defined]
         completed: Whether task is completed (default False)
         created_at: Creation timestamp (server-generated)
         updated_at: Last update timestamp (server-generated)
+        content_hash: SHA-256 of title and description, used for
+            indexed duplicate detection
     """
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Supports keyset pagination over (created_at, id) in both directions
+        db.Index("ix_tasks_created_at_id", "created_at", "id"),
+        # Turns the duplicate check into an index range probe
+        db.Index("ix_tasks_content_hash_created_at", "content_hash", "created_at"),
+        # Answers max(updated_at) for collection ETags and the change feed
+        db.Index("ix_tasks_updated_at_id", "updated_at", "id"),
+        # Per-status partial indexes: ?completed=false (the UI's hot query)
+        # and ?completed=true each read only their own rows, in list order
+        db.Index(
+            "ix_tasks_open_created_at",
+            "created_at",
+            "id",
+            sqlite_where=text("completed = 0"),
+            postgresql_where=text("completed = false"),
+        ),
+        db.Index(
+            "ix_tasks_done_created_at",
+            "created_at",
+            "id",
+            sqlite_where=text("completed = 1"),
+            postgresql_where=text("completed = true"),
+        ),
+        # Never reuse ids of deleted tasks; the change feed reports them
+        {"sqlite_autoincrement": True},
+    )
 
     id: int = db.Column(db.Integer, primary_key=True)
     title: str = db.Column(db.String(200), nullable=False)
     description: Optional[str] = db.Column(db.Text, nullable=True)
     completed: bool = db.Column(db.Boolean, default=False)
+    # Timestamps are generated client-side so they carry microsecond
+    # precision on every backend; the server default (for raw inserts)
+    # writes the same format (see UtcTimestamp).
     created_at: datetime = db.Column(
-        db.DateTime(timezone=True), server_default=func.now()
+        db.DateTime(timezone=True), default=_utcnow, server_default=UtcTimestamp()
     )
     updated_at: datetime = db.Column(
-        db.DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        db.DateTime(timezone=True),
+        default=_utcnow,
+        server_default=UtcTimestamp(),
+        onupdate=_utcnow,
     )
+    # Nullable so rows written before the column existed remain valid until
+    # ``flask tasks migrate`` backfills them
+    content_hash: Optional[str] = db.Column(db.String(64), nullable=True)
+
+    @staticmethod
+    def compute_content_hash(title: str, description: Optional[str]) -> str:
+        """Compute the content hash used for duplicate detection.
+        
+        Args:
+            title: Task title
+            description: Task description (None and "" hash differently)
+            
+        Returns:
+            Hex-encoded SHA-256 digest
+        """
+        # Length-prefix the title so ("ab", "c") and ("a", "bc") differ
+        parts = [str(len(title)), title]
+        if description is not None:
+            parts.append(description)
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, fields: Sequence[str] = PUBLIC_FIELDS) -> Dict[str, Any]:
         """Convert task to dictionary for JSON serialization.
         
+        Only the requested attributes are touched, so columns left
+        unloaded by a narrowed query are never lazy-loaded.
+        
+        Args:
+            fields: Public fields to include, in output order
+        
         Returns:
             Dictionary representation of the task with ISO-formatted timestamps
         """
-        return {
-            "id": self.id,
-            "title": self.title,
-            "description": self.description,
-            "completed": self.completed,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-        }
+        return {field: _isoformat(getattr(self, field)) for field in fields}
+
+    @staticmethod
+    def row_to_dict(row: Any, fields: Sequence[str] = PUBLIC_FIELDS) -> Dict[str, Any]:
+        """Serialize a Core result row of task columns like :meth:`to_dict`.
+        
+        Used by set-based code paths that never hydrate ORM objects.
+        
+        Args:
+            row: Result row (or mapping) with the task columns
+            fields: Public fields to include, in output order
+            
+        Returns:
+            Dictionary representation of the task with ISO-formatted timestamps
+        """
+        data = row._mapping if hasattr(row, "_mapping") else row
+        return {field: _isoformat(data[field]) for field in fields}
+
+    @staticmethod
+    def row_to_raw_dict(
+        row: Any, fields: Sequence[str] = PUBLIC_FIELDS
+    ) -> Dict[str, Any]:
+        """Map a Core result row to a dict, leaving datetimes unformatted.
+        
+        For the fast read path, where the JSON encoder formats datetimes
+        itself; the encoded output matches :meth:`to_dict`.
+        
+        Args:
+            row: Result row with the task columns
+            fields: Public fields to include, in output order
+            
+        Returns:
+            Dictionary with the requested public task fields
+        """
+        data = row._mapping
+        return {field: data[field] for field in fields}
 
     def __repr__(self) -> str:
         """String representation of the task."""
         return f"<Task {self.id}: {self.title}>"
+
+
+class TaskDeletion(db.Model):  # type: ignore[name-defined]
+    """Tombstone recorded for every deleted task.
+    
+    Feeds the change feed (``GET /tasks/changes``) so mirroring clients
+    learn about deletions. The auto-incrementing id is the log position
+    used by sync tokens.
+    
+    Attributes:
+        id: Log position (monotonically increasing)
+        task_id: ID of the deleted task
+        deleted_at: Deletion timestamp
+    """
+
+    __tablename__ = "task_deletions"
+    __table_args__ = ({"sqlite_autoincrement": True},)
+
+    id: int = db.Column(db.Integer, primary_key=True)
+    task_id: int = db.Column(db.Integer, nullable=False)
+    deleted_at: datetime = db.Column(
+        db.DateTime(timezone=True), default=_utcnow, server_default=UtcTimestamp()
+    )
+
+    def __repr__(self) -> str:
+        """String representation of the tombstone."""
+        return f"<TaskDeletion {self.id}: task {self.task_id}>"
+
+
+class TaskCounter(db.Model):  # type: ignore[name-defined]
+    """Incrementally maintained aggregate over the tasks table.
+    
+    One row per counter (``total``, ``completed``); every write path
+    adjusts them in the same transaction as the change itself, so
+    ``GET /tasks/stats`` reads two rows instead of counting the table.
+    ``flask tasks reconcile`` rebuilds them if they ever drift.
+    
+    Attributes:
+        name: Counter name
+        value: Current value
+    """
+
+    __tablename__ = "task_counters"
+
+    name: str = db.Column(db.String(32), primary_key=True)
+    value: int = db.Column(db.BigInteger, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        """String representation of the counter."""
+        return f"<TaskCounter {self.name}={self.value}>"
+
+
+COUNTER_TOTAL = "total"
+COUNTER_COMPLETED = "completed"
+COUNTER_NAMES = (COUNTER_TOTAL, COUNTER_COMPLETED)
+
+# A new database starts with zeroed counters (matching its empty tasks table)
+event.listen(
+    TaskCounter.__table__,
+    "after_create",
+    DDL(
+        "INSERT INTO task_counters (name, value) VALUES "
+        + ", ".join(f"('{name}', 0)" for name in COUNTER_NAMES)
+    ),
+)
+
+
+@event.listens_for(Task, "before_insert")
+def _set_content_hash_on_insert(mapper: Any, connection: Any, target: Task) -> None:
+    """Fill content_hash for tasks inserted through the ORM."""
+    if target.content_hash is None:
+        target.content_hash = Task.compute_content_hash(
+            target.title, target.description
+        )
+
+
+@event.listens_for(Task, "before_update")
+def _set_content_hash_on_update(mapper: Any, connection: Any, target: Task) -> None:
+    """Recompute content_hash when the title or description changes."""
+    if (
+        get_history(target, "title").has_changes()
+        or get_history(target, "description").has_changes()
+    ):
+        target.content_hash = Task.compute_content_hash(
+            target.title, target.description
+        )
+
+
+# Full-text search index over title and description.
+#
+# SQLite: an external-content FTS5 table (no second copy of the text) kept
+# in sync by triggers, so Core bulk statements are covered too. The update
+# trigger only fires when the text changes, not on completion toggles.
+SEARCH_FTS_TABLE = "tasks_fts"
+
+_SQLITE_SEARCH_DDL = (
+    f"CREATE VIRTUAL TABLE {SEARCH_FTS_TABLE} USING fts5("
+    "title, description, content='tasks', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER tasks_fts_ai AFTER INSERT ON tasks BEGIN "
+    f"INSERT INTO {SEARCH_FTS_TABLE}(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER tasks_fts_ad AFTER DELETE ON tasks BEGIN "
+    f"INSERT INTO {SEARCH_FTS_TABLE}({SEARCH_FTS_TABLE}, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER tasks_fts_au AFTER UPDATE OF title, description ON tasks BEGIN "
+    f"INSERT INTO {SEARCH_FTS_TABLE}({SEARCH_FTS_TABLE}, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    f"INSERT INTO {SEARCH_FTS_TABLE}(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+)
+
+# PostgreSQL: a generated tsvector column (title weighted above
+# description) with a GIN index. Not mapped on the model so the same
+# model keeps working on SQLite.
+_POSTGRES_SEARCH_DDL = (
+    "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    "GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+    ") STORED",
+    "CREATE INDEX IF NOT EXISTS ix_tasks_search_vector "
+    "ON tasks USING GIN (search_vector)",
+)
+
+for _statement in _SQLITE_SEARCH_DDL:
+    event.listen(
+        Task.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite")
+    )
+for _statement in _POSTGRES_SEARCH_DDL:
+    event.listen(
+        Task.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql")
+    )
+# The FTS5 table is not part of the metadata; drop it along with tasks
+event.listen(
+    Task.__table__,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {SEARCH_FTS_TABLE}").execute_if(dialect="sqlite"),
+)
+
+
+def drop_search_index(connection: Any) -> bool:
+    """Drop the SQLite full-text table and its triggers ahead of a bulk load.
+    
+    Loading rows and then rebuilding the index with
+    :func:`install_search_index` is several times faster than maintaining
+    it row by row. Search fails until the index is installed again.
+    
+    Args:
+        connection: Connection inside a transaction
+        
+    Returns:
+        True if an index was dropped (only SQLite's is, PostgreSQL's
+        generated column is left alone)
+    """
+    if connection.dialect.name != "sqlite":
+        return False
+    exists = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": SEARCH_FTS_TABLE},
+    ).first()
+    if not exists:
+        return False
+    for trigger in ("tasks_fts_ai", "tasks_fts_ad", "tasks_fts_au"):
+        connection.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+    connection.execute(text(f"DROP TABLE {SEARCH_FTS_TABLE}"))
+    return True
+
+
+def install_search_index(connection: Any) -> bool:
+    """Create the full-text index on a database created before it existed.
+    
+    On SQLite the FTS5 table is rebuilt from the tasks table after being
+    created. On PostgreSQL, adding the generated column rewrites the
+    table once.
+    
+    Args:
+        connection: Connection inside a transaction
+        
+    Returns:
+        True if the index was created, False if it already existed or the
+        dialect has no native full-text index
+    """
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        exists = connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": SEARCH_FTS_TABLE},
+        ).first()
+        if exists:
+            return False
+        for statement in _SQLITE_SEARCH_DDL:
+            connection.execute(text(statement))
+        connection.execute(
+            text(f"INSERT INTO {SEARCH_FTS_TABLE}({SEARCH_FTS_TABLE}) VALUES ('rebuild')")
+        )
+        return True
+    if dialect == "postgresql":
+        exists = connection.execute(
+            text(
+                "SELECT 1 FROM information_schema.columns "
+                "WHERE table_name = 'tasks' AND column_name = 'search_vector'"
+            )
+        ).first()
+        if exists:
+            return False
+        for statement in _POSTGRES_SEARCH_DDL:
+            connection.execute(text(statement))
+        return True
+    return False
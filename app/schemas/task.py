@@ -1,8 +1,22 @@
 """Task schemas for request/response validation."""
-from typing import Optional
-from datetime import datetime
+import hashlib
+from typing import Any, Dict, List, Literal, Optional, Tuple
+from datetime import datetime, timedelta, timezone
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from app.models.task import PUBLIC_FIELDS
+from app.utils.conditional import as_utc
+from app.utils.constants import (
+    DEFAULT_PAGE_SIZE, DEFAULT_TASK_SORT, ERR_SEARCH_WITH_CURSOR, MAX_BATCH_SIZE, MAX_PAGE_SIZE,
+    MAX_SEARCH_QUERY_LENGTH,
+)
+from app.utils.pagination import (
+    CursorKey, SyncToken, decode_cursor, decode_sync_token
+)
+
+# Sortable list columns; "-" prefix means descending
+TaskSort = Literal["-created_at", "created_at", "-updated_at", "updated_at"]
 
 
 class TaskBase(BaseModel):
@@ -18,6 +32,16 @@ class TaskCreate(TaskBase):
     pass
 
 
+class TaskBatchCreate(BaseModel):
+    """Schema for bulk task creation.
+    
+    Items are kept as raw dicts so each one can be validated against
+    TaskCreate individually and reported per item.
+    """
+
+    tasks: List[Dict[str, Any]] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
 class TaskUpdate(BaseModel):
     """Schema for task update."""
 
@@ -25,6 +49,101 @@ class TaskUpdate(BaseModel):
     description: Optional[str] = None
     completed: Optional[bool] = None
 
+    @field_validator("title", "completed")
+    @classmethod
+    def _reject_null(cls, value: Any) -> Any:
+        # Omitting a field leaves it unchanged; only description may be cleared
+        if value is None:
+            raise ValueError("may be omitted but not null")
+        return value
+
+
+class TaskChangesQuery(BaseModel):
+    """Schema for change feed query parameters."""
+
+    since: Optional[str] = None
+    limit: int = Field(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+
+    @field_validator("since")
+    @classmethod
+    def _validate_since(cls, value: Optional[str]) -> Optional[str]:
+        if value:
+            decode_sync_token(value)
+        return value or None
+
+    @property
+    def position(self) -> SyncToken:
+        """Decoded sync position; the start of history when ``since`` is absent."""
+        return decode_sync_token(self.since)[0] if self.since else (None, 0, 0)
+
+    def is_expired(self, max_age: timedelta) -> bool:
+        """Whether ``since`` was issued more than ``max_age`` ago.
+        
+        Tokens without an issue time (older releases) count as expired.
+        """
+        if not self.since:
+            return False
+        issued_at = decode_sync_token(self.since)[1]
+        return issued_at is None or issued_at < datetime.now(timezone.utc) - max_age
+
+
+class TaskExportQuery(BaseModel):
+    """Schema for task export query parameters."""
+
+    format: Literal["ndjson", "csv"] = "ndjson"
+
+
+class TaskFilter(BaseModel):
+    """Schema for filter criteria selecting a set of tasks."""
+
+    completed: Optional[bool] = None
+    created_before: Optional[datetime] = None
+    created_after: Optional[datetime] = None
+    updated_after: Optional[datetime] = None
+
+    @field_validator("created_before", "created_after", "updated_after")
+    @classmethod
+    def _normalize_datetimes(cls, value: Optional[datetime]) -> Optional[datetime]:
+        return as_utc(value) if value is not None else None
+
+
+class TaskBulkSelection(BaseModel):
+    """Schema for selecting tasks by id list and/or filter.
+    
+    At least one criterion is required so an empty body can never
+    update or delete the whole table by accident.
+    """
+
+    ids: Optional[List[int]] = Field(None, min_length=1, max_length=MAX_BATCH_SIZE)
+    filter: Optional[TaskFilter] = None
+
+    @model_validator(mode="after")
+    def _require_criteria(self) -> "TaskBulkSelection":
+        has_filter = self.filter is not None and bool(
+            self.filter.model_dump(exclude_none=True)
+        )
+        if not self.ids and not has_filter:
+            raise ValueError("Provide 'ids' or at least one 'filter' criterion")
+        return self
+
+
+class TaskBulkChanges(BaseModel):
+    """Schema for the fields a bulk update may set."""
+
+    completed: bool
+
+
+class TaskBulkUpdate(TaskBulkSelection):
+    """Schema for bulk task update."""
+
+    changes: TaskBulkChanges
+
+
+class TaskBulkDelete(TaskBulkSelection):
+    """Schema for bulk task deletion."""
+
+    pass
+
 
 class TaskInDB(TaskBase):
     """Schema for task in database."""
@@ -35,3 +154,86 @@ class TaskInDB(TaskBase):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class TaskFieldsQuery(BaseModel):
+    """Schema for the ``fields`` sparse-fieldset query parameter.
+    
+    ``fields=id,title,completed`` narrows both the response and the
+    columns selected from the database; ``id`` is always included.
+    """
+
+    fields: Optional[str] = None
+
+    @field_validator("fields")
+    @classmethod
+    def _validate_fields(cls, value: Optional[str]) -> Optional[str]:
+        if not value:
+            return None
+        requested = {name.strip() for name in value.split(",") if name.strip()}
+        unknown = requested - set(PUBLIC_FIELDS)
+        if unknown:
+            raise ValueError(
+                f"Unknown field(s): {', '.join(sorted(unknown))}; "
+                f"choose from {', '.join(PUBLIC_FIELDS)}"
+            )
+        return ",".join(name for name in PUBLIC_FIELDS if name in requested | {"id"})
+
+    @property
+    def selected_fields(self) -> Tuple[str, ...]:
+        """Requested public fields in output order (all when omitted)."""
+        return tuple(self.fields.split(",")) if self.fields else PUBLIC_FIELDS
+
+
+class TaskListQuery(TaskFilter, TaskFieldsQuery):
+    """Schema for task list query parameters.
+    
+    Inherits the filter criteria; cursors are only valid for the filter
+    and sort of the request that produced them.
+    """
+
+    limit: int = Field(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+    cursor: Optional[str] = None
+    q: Optional[str] = Field(None, max_length=MAX_SEARCH_QUERY_LENGTH)
+    sort: TaskSort = DEFAULT_TASK_SORT
+
+    @field_validator("cursor")
+    @classmethod
+    def _validate_cursor(cls, value: Optional[str]) -> Optional[str]:
+        if value:
+            decode_cursor(value)
+        return value or None
+
+    @field_validator("q")
+    @classmethod
+    def _normalize_query(cls, value: Optional[str]) -> Optional[str]:
+        value = value.strip() if value else None
+        return value or None
+
+    @model_validator(mode="after")
+    def _check_search_without_cursor(self) -> "TaskListQuery":
+        if self.q is not None and self.cursor is not None:
+            raise ValueError(ERR_SEARCH_WITH_CURSOR)
+        return self
+
+    @model_validator(mode="after")
+    def _check_cursor_scope(self) -> "TaskListQuery":
+        if self.cursor is not None:
+            decode_cursor(self.cursor, self.cursor_scope)
+        return self
+
+    @property
+    def cursor_scope(self) -> str:
+        """Digest of the sort and filter that cursors of this listing are bound to."""
+        scope = self.model_dump_json(include={"sort", *TaskFilter.model_fields})
+        return hashlib.sha256(scope.encode()).hexdigest()[:16]
+
+    @property
+    def after(self) -> Optional[CursorKey]:
+        """Decoded cursor key, or None for the first page."""
+        return decode_cursor(self.cursor) if self.cursor else None
+
+    @property
+    def sort_column(self) -> str:
+        """Name of the column the page is sorted by."""
+        return self.sort.lstrip("-")
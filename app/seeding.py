@@ -0,0 +1,194 @@
+"""Bulk generation of synthetic tasks (``flask tasks seed``).
+
+Rows are generated in chunks and written without the ORM: PostgreSQL
+(psycopg2) receives each chunk through ``COPY ... FROM STDIN``, every
+other database a Core executemany INSERT. A chunk is one transaction.
+Derived data is rebuilt once at the end instead of per row: the task
+counters, and on SQLite the FTS5 index, which is dropped for the load
+(search is unavailable meanwhile; ``flask tasks migrate`` restores the
+index should seeding be killed).
+
+With a seed, the same arguments always produce the same titles,
+descriptions, statuses and timestamp offsets.
+"""
+import csv
+import io
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.extensions import db
+from app.models.task import Task, drop_search_index, install_search_index
+
+SEED_CHUNK_SIZE = 10000
+
+_VERBS = (
+    "Review", "Update", "Call", "Email", "Fix", "Plan", "Book", "Write",
+    "Prepare", "Check", "Order", "Clean", "Schedule", "Submit", "Draft",
+    "Pay", "Renew", "Test", "Deploy", "Organize",
+)
+_OBJECTS = (
+    "quarterly report", "dentist appointment", "team offsite", "invoice",
+    "release notes", "grocery list", "car insurance", "budget", "slides",
+    "onboarding docs", "flight tickets", "garden shed", "tax return",
+    "database backup", "birthday gift", "project roadmap", "gym membership",
+    "kitchen sink", "design review", "customer feedback",
+)
+_WORDS = (
+    "the", "and", "before", "after", "meeting", "follow", "up", "with",
+    "client", "notes", "deadline", "friday", "monday", "draft", "final",
+    "version", "budget", "review", "team", "send", "copy", "check", "numbers",
+    "ask", "about", "details", "invoice", "office", "home", "urgent", "later",
+    "remember", "attach", "summary", "call", "back", "order", "confirm",
+)
+
+# Rows are written as these columns, in this order, by both writers
+_COLUMNS = ("title", "description", "completed", "content_hash", "created_at", "updated_at")
+
+
+class _RowFactory:
+    """Deterministic generator of synthetic task rows.
+
+    Args:
+        completed_ratio: Fraction of tasks marked completed
+        description_size: Approximate description length in characters
+            (0 leaves descriptions empty)
+        seed: Random seed (None for a different data set every run)
+        span: Period over which creation times are spread, ending at ``until``
+        until: Newest creation time
+        count: Total rows that will be generated (spaces the timestamps)
+    """
+
+    def __init__(
+        self, completed_ratio: float, description_size: int, seed: Optional[int],
+        span: timedelta, until: datetime, count: int,
+    ) -> None:
+        self._rng = random.Random(seed)
+        self._completed_ratio = completed_ratio
+        self._words = max(description_size // 6, 1) if description_size else 0
+        self._size = description_size
+        self._until = until
+        self._start = until - span
+        self._step = span / max(count, 1)
+
+    def rows(self, start: int, stop: int) -> List[Tuple[Any, ...]]:
+        """Build rows ``start`` to ``stop - 1``, oldest first."""
+        rng = self._rng
+        rows = []
+        for i in range(start, stop):
+            title = f"{rng.choice(_VERBS)} {rng.choice(_OBJECTS)} #{i + 1}"
+            description = None
+            if self._words:
+                description = " ".join(rng.choices(_WORDS, k=self._words))[: self._size]
+            completed = rng.random() < self._completed_ratio
+            created_at = self._start + self._step * i
+            updated_at = created_at
+            if completed:
+                # Completed some time after creation, never in the future
+                updated_at = min(created_at + timedelta(hours=rng.uniform(1, 240)), self._until)
+            rows.append((
+                title, description, completed,
+                Task.compute_content_hash(title, description), created_at, updated_at,
+            ))
+        return rows
+
+
+def _insert_rows(rows: List[Tuple[Any, ...]]) -> None:
+    """Write a chunk with one executemany INSERT."""
+    db.session.execute(
+        Task.__table__.insert(), [dict(zip(_COLUMNS, row)) for row in rows]
+    )
+
+
+def _copy_rows(rows: List[Tuple[Any, ...]]) -> None:
+    """Write a chunk with PostgreSQL ``COPY ... FROM STDIN`` (CSV)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # csv writes None as an unquoted empty field, which COPY reads as NULL
+    for title, description, completed, content_hash, created_at, updated_at in rows:
+        writer.writerow((
+            title,
+            description,
+            "t" if completed else "f",
+            content_hash,
+            created_at.isoformat(),
+            updated_at.isoformat(),
+        ))
+    buffer.seek(0)
+    cursor = db.session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {Task.__tablename__} ({', '.join(_COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+    finally:
+        cursor.close()
+
+
+def _writer() -> Callable[[List[Tuple[Any, ...]]], None]:
+    """Pick the fastest bulk writer for the bound database."""
+    dialect = db.engine.dialect
+    if dialect.name == "postgresql" and dialect.driver == "psycopg2":
+        return _copy_rows
+    return _insert_rows
+
+
+def seed_tasks(
+    count: int,
+    completed_ratio: float = 0.3,
+    description_size: int = 120,
+    seed: Optional[int] = None,
+    chunk_size: int = SEED_CHUNK_SIZE,
+    span_days: float = 365,
+    progress: Optional[Callable[[int], None]] = None,
+) -> Dict[str, Any]:
+    """Insert ``count`` synthetic tasks.
+
+    Args:
+        count: Number of tasks to insert
+        completed_ratio: Fraction of tasks marked completed
+        description_size: Approximate description length (0 for none)
+        seed: Random seed for reproducible data
+        chunk_size: Rows generated and committed per transaction
+        span_days: Creation times are spread over this many days up to now
+        progress: Called with the number of rows after each chunk
+
+    Returns:
+        Dictionary with ``rows``, ``seconds``, ``rows_per_second`` and
+        ``method`` (``copy`` or ``insert``)
+    """
+    write = _writer()
+    factory = _RowFactory(
+        completed_ratio, description_size, seed, timedelta(days=span_days),
+        datetime.now(timezone.utc), count,
+    )
+    started = time.perf_counter()
+    search_dropped = drop_search_index(db.session.connection())
+    db.session.commit()
+    try:
+        for start in range(0, count, chunk_size):
+            rows = factory.rows(start, min(start + chunk_size, count))
+            write(rows)
+            db.session.commit()
+            if progress is not None:
+                progress(len(rows))
+    finally:
+        db.session.rollback()
+        if search_dropped:
+            install_search_index(db.session.connection())
+            db.session.commit()
+
+    # Bulk writes bypass TaskService; bring counters and caches in line
+    from app.services.cache import get_task_cache
+    from app.services.task_service import TaskService
+
+    TaskService.reconcile_counters()
+    get_task_cache().invalidate()
+    seconds = time.perf_counter() - started
+    return {
+        "rows": count,
+        "seconds": seconds,
+        "rows_per_second": count / seconds if seconds else 0.0,
+        "method": "copy" if write is _copy_rows else "insert",
+    }
@@ -0,0 +1,193 @@
+"""Async task operations for the ASGI entry point (app/asgi.py).
+
+Mirrors the subset of :class:`TaskService` the ASGI app serves, executing
+the very same Core statements (built by TaskService's statement helpers)
+on an ``AsyncSession``, so both servers read and write identical SQL and
+keep the counters and deletion log consistent with each other.
+
+There is no read cache or event broker on this side: both live in the
+memory of a WSGI worker process.
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.task import Task, TaskDeletion
+from app.schemas.task import TaskCreate, TaskFilter, TaskUpdate
+from app.services.task_service import TaskService
+from app.utils.constants import DEFAULT_TASK_SORT
+from app.utils.pagination import CursorKey
+
+
+class AsyncTaskService:
+    """Async counterpart of TaskService (all methods take the session)."""
+
+    @staticmethod
+    async def get_task_rows(
+        session: AsyncSession,
+        limit: Optional[int] = None,
+        after: Optional[CursorKey] = None,
+        criteria: Optional[TaskFilter] = None,
+        sort: str = DEFAULT_TASK_SORT,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Any]:
+        """Get one keyset page of tasks as column tuples (see TaskService)."""
+        stmt = TaskService._list_statement(
+            Task.__table__, limit, after, criteria, sort, session.bind.dialect.name
+        )
+        if fields is not None:
+            stmt = stmt.with_only_columns(*TaskService._columns(fields, sort.lstrip("-")))
+        return (await session.execute(stmt)).all()
+
+    @staticmethod
+    async def search_tasks(
+        session: AsyncSession,
+        query: str,
+        limit: int,
+        criteria: Optional[TaskFilter] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Any]:
+        """Full-text search, best match first (see TaskService.search_tasks)."""
+        stmt = TaskService._search_statement(
+            query, limit, criteria, session.bind.dialect.name
+        )
+        if stmt is None:
+            return []
+        if fields is not None:
+            stmt = stmt.with_only_columns(*TaskService._columns(fields))
+        return (await session.execute(stmt)).all()
+
+    @staticmethod
+    async def get_collection_state(session: AsyncSession) -> Tuple[Optional[Any], int]:
+        """Get (Last-Modified, task count) for list validators (see TaskService)."""
+        return TaskService._collection_state(
+            (await session.execute(TaskService._collection_state_statement())).one()
+        )
+
+    @staticmethod
+    async def get_task_row(
+        session: AsyncSession, task_id: int, fields: Optional[Sequence[str]] = None
+    ) -> Optional[Any]:
+        """Get one task as a column tuple, or None if it does not exist."""
+        table = Task.__table__
+        stmt = select(table).where(table.c.id == task_id)
+        if fields is not None:
+            stmt = stmt.with_only_columns(*TaskService._columns(fields, "updated_at"))
+        return (await session.execute(stmt)).first()
+
+    @staticmethod
+    async def task_exists(session: AsyncSession, task_id: int) -> bool:
+        """Check whether a task exists without loading it."""
+        table = Task.__table__
+        found = await session.execute(select(table.c.id).where(table.c.id == task_id))
+        return found.first() is not None
+
+    @staticmethod
+    async def create_task(session: AsyncSession, task_data: TaskCreate) -> Any:
+        """Create a task unless a duplicate was created inside the dedup window.
+
+        The window (TASK_DEDUP_WINDOW_SECONDS) is read from
+        ``session.info["dedup_window"]``; 0 or unset skips the lookup.
+
+        Returns:
+            The new task row, or the recent duplicate
+        """
+        content_hash = Task.compute_content_hash(task_data.title, task_data.description)
+        window = session.info.get("dedup_window", 0)
+        if window:
+            duplicates = (
+                await session.execute(TaskService._duplicates_statement([content_hash], window))
+            ).all()
+            if duplicates:
+                return duplicates[-1]
+        table = Task.__table__
+        row = (
+            await session.execute(
+                insert(table)
+                .values(
+                    title=task_data.title,
+                    description=task_data.description,
+                    completed=False,
+                    content_hash=content_hash,
+                )
+                .returning(*table.c)
+            )
+        ).one()
+        await AsyncTaskService._adjust_counters(session, total=1)
+        await session.commit()
+        return row
+
+    @staticmethod
+    async def update_task(
+        session: AsyncSession,
+        task_id: int,
+        task_data: TaskUpdate,
+        if_match: Optional[Sequence[Any]] = None,
+    ) -> Optional[Any]:
+        """Update a task with one UPDATE ... RETURNING (see TaskService).
+
+        Returns:
+            Updated row, or None if missing or the precondition failed
+        """
+        changes = task_data.model_dump(exclude_unset=True)
+        previous = None
+        stored = TaskService._stored_columns(changes)
+        if stored:
+            previous = (
+                await session.execute(TaskService._locked_read_statement(task_id, stored))
+            ).first()
+            if previous is None:
+                await session.rollback()
+                return None
+        row = (
+            await session.execute(
+                TaskService._update_statement(
+                    task_id, TaskService._update_values(changes, previous), if_match
+                )
+            )
+        ).first()
+        if row is not None:
+            await AsyncTaskService._adjust_counters(
+                session, completed=TaskService._status_delta(changes, previous, row)
+            )
+        await session.commit()
+        return row
+
+    @staticmethod
+    async def delete_task(
+        session: AsyncSession, task_id: int, if_match: Optional[Sequence[Any]] = None
+    ) -> bool:
+        """Delete a task and log its tombstone (see TaskService.delete_task).
+
+        Returns:
+            True if deleted, False if missing or the precondition failed
+        """
+        deleted = (
+            await session.execute(TaskService._delete_statement(task_id, if_match))
+        ).first()
+        if deleted is None:
+            await session.rollback()
+            return False
+        await session.execute(insert(TaskDeletion.__table__).values(task_id=deleted.id))
+        await AsyncTaskService._adjust_counters(
+            session, **TaskService._removal_deltas([deleted])
+        )
+        await session.commit()
+        return True
+
+    @staticmethod
+    async def get_stats(session: AsyncSession) -> Dict[str, int]:
+        """Get task totals from the counters table (see TaskService.get_stats)."""
+        return TaskService._stats(
+            (await session.execute(TaskService._counters_statement())).all()
+        )
+
+    @staticmethod
+    async def _adjust_counters(
+        session: AsyncSession, total: int = 0, completed: int = 0
+    ) -> None:
+        """Apply counter deltas in the caller's transaction (caller commits)."""
+        deltas = TaskService._counter_deltas(total, completed)
+        if deltas:
+            await session.execute(TaskService._counter_statement(), deltas)
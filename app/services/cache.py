@@ -0,0 +1,253 @@
+"""Per-worker read-through cache for task reads.
+
+Entries live in a bounded LRU with a TTL and are tagged with the data
+version current when they were stored. Every write bumps the version, so
+stale entries are never served: a lookup whose tag differs from the
+current version counts as a miss.
+
+The version lives in a pluggable backend. ``LocalVersionBackend`` keeps
+it in process memory, which only invalidates the worker that performed
+the write. ``SQLiteVersionBackend`` keeps it in a small SQLite file that
+every gunicorn worker on the host shares, so a write in one worker
+invalidates all of them.
+"""
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from flask import Flask, current_app
+from prometheus_client import Counter
+
+CACHE_HITS = Counter("todo_cache_hits", "Task cache hits", ["cache"])
+CACHE_MISSES = Counter("todo_cache_misses", "Task cache misses", ["cache"])
+CACHE_EVICTIONS = Counter(
+    "todo_cache_evictions", "Task cache entries evicted for capacity", ["cache"]
+)
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Thread-safe LRU mapping with a per-entry time-to-live.
+
+    Args:
+        max_entries: Maximum number of entries kept
+        ttl_seconds: Seconds an entry stays valid after being stored
+        on_evict: Called once per entry evicted for capacity
+        clock: Monotonic time source (overridable in tests)
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        on_evict: Optional[Callable[[], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._on_evict = on_evict
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the live value for ``key`` or ``default``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store ``value``, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                if self._on_evict is not None:
+                    self._on_evict()
+
+    def pop(self, key: Hashable) -> None:
+        """Drop the entry for ``key`` if there is one."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class LocalVersionBackend:
+    """Data version kept in process memory (single worker only)."""
+
+    def __init__(self) -> None:
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def get_version(self) -> int:
+        """Return the current data version."""
+        return self._version
+
+    def bump(self) -> int:
+        """Increment and return the data version."""
+        with self._lock:
+            self._version += 1
+            return self._version
+
+
+class SQLiteVersionBackend:
+    """Data version shared by every process on a host through a SQLite file.
+
+    Args:
+        path: Path of the SQLite file (created if missing)
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._local = threading.local()
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS data_version "
+            "(id INTEGER PRIMARY KEY CHECK (id = 1), version INTEGER NOT NULL)"
+        )
+        conn.execute("INSERT OR IGNORE INTO data_version (id, version) VALUES (1, 0)")
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def get_version(self) -> int:
+        """Return the current data version."""
+        row = self._connection().execute(
+            "SELECT version FROM data_version WHERE id = 1"
+        ).fetchone()
+        return row[0]
+
+    def bump(self) -> int:
+        """Increment and return the data version."""
+        row = self._connection().execute(
+            "UPDATE data_version SET version = version + 1 WHERE id = 1 "
+            "RETURNING version"
+        ).fetchone()
+        return row[0]
+
+
+class TaskCache:
+    """Versioned read-through cache used by TaskService.
+
+    The data version is tracked even when caching is disabled, so other
+    features (e.g. ETags) can rely on it.
+
+    Args:
+        backend: Version backend (local or shared)
+        enabled: Whether reads are served from the LRU
+        max_entries: LRU capacity
+        ttl_seconds: Entry time-to-live
+        name: Label used for the Prometheus counters
+    """
+
+    def __init__(
+        self,
+        backend: Any,
+        enabled: bool = True,
+        max_entries: int = 256,
+        ttl_seconds: float = 30.0,
+        name: str = "tasks",
+    ) -> None:
+        self.backend = backend
+        self.enabled = enabled
+        # Pre-bind label children once; .labels() is not free on the hot path
+        self._hits = CACHE_HITS.labels(cache=name)
+        self._misses = CACHE_MISSES.labels(cache=name)
+        self._lru = LRUCache(
+            max_entries, ttl_seconds, on_evict=CACHE_EVICTIONS.labels(cache=name).inc
+        )
+
+    @property
+    def version(self) -> int:
+        """Current data version."""
+        return self.backend.get_version()
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, loading it on a miss.
+
+        Values must be immutable (e.g. Core rows), since they are shared
+        between requests and threads.
+
+        Args:
+            key: Cache key
+            loader: Called to produce the value on a miss
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        if not self.enabled:
+            return loader()
+        version = self.version
+        entry = self._lru.get(key, _MISSING)
+        if entry is not _MISSING and entry[0] == version:
+            self._hits.inc()
+            return entry[1]
+        self._misses.inc()
+        value = loader()
+        self._lru.set(key, (version, value))
+        return value
+
+    def invalidate(self) -> int:
+        """Bump the data version after a write; returns the new version."""
+        return self.backend.bump()
+
+
+def create_version_backend(spec: str) -> Any:
+    """Build a version backend from its configuration string.
+
+    Args:
+        spec: ``"local"`` or ``"sqlite:///<path>"``
+
+    Returns:
+        Version backend instance
+
+    Raises:
+        ValueError: If the spec is not recognised
+    """
+    if spec == "local":
+        return LocalVersionBackend()
+    if spec.startswith("sqlite:///"):
+        return SQLiteVersionBackend(spec[len("sqlite:///"):])
+    raise ValueError(f"Unknown task cache backend: {spec}")
+
+
+def init_task_cache(app: Flask) -> None:
+    """Create the application's task cache from configuration.
+
+    Args:
+        app: Flask application instance
+    """
+    app.extensions["task_cache"] = TaskCache(
+        create_version_backend(app.config.get("TASK_CACHE_BACKEND", "local")),
+        enabled=app.config.get("TASK_CACHE_ENABLED", False),
+        max_entries=app.config.get("TASK_CACHE_MAX_ENTRIES", 256),
+        ttl_seconds=app.config.get("TASK_CACHE_TTL_SECONDS", 30.0),
+    )
+
+
+def get_task_cache() -> TaskCache:
+    """Return the task cache of the current application."""
+    return current_app.extensions["task_cache"]
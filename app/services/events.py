@@ -0,0 +1,154 @@
+"""In-process publish/subscribe for task change events.
+
+TaskService publishes an event after every committed write and the
+``GET /api/v1/tasks/stream`` endpoint relays them to browsers as
+Server-Sent Events. Each subscriber owns a bounded queue; publishing
+never blocks, and a subscriber whose queue is full is dropped and told to
+resynchronise instead of slowing every writer down.
+
+Events only reach subscribers connected to the same worker process, and
+each open stream holds one of that worker's threads (see
+:func:`stream_capacity`).
+"""
+import itertools
+import queue
+import threading
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from flask import Flask, current_app
+from prometheus_client import Counter, Gauge
+
+SSE_SUBSCRIBERS = Gauge(
+    "todo_sse_subscribers", "Open task event streams", multiprocess_mode="livesum"
+)
+SSE_DROPPED = Counter(
+    "todo_sse_dropped_subscribers", "Event streams dropped for falling behind"
+)
+
+# (event id, event type, payload)
+Event = Tuple[int, str, Dict[str, Any]]
+
+
+class Subscription:
+    """A subscriber's bounded event queue.
+
+    Args:
+        max_queue: Events buffered before the subscriber is dropped
+    """
+
+    def __init__(self, max_queue: int) -> None:
+        self._queue: "queue.Queue[Event]" = queue.Queue(maxsize=max_queue)
+        self.dropped = False
+
+    def offer(self, event: Event) -> bool:
+        """Queue an event without blocking; returns False if the queue is full."""
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except queue.Full:
+            return False
+
+    def get(self, timeout: float) -> Optional[Event]:
+        """Wait up to ``timeout`` seconds for the next event."""
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class EventBroker:
+    """Fan-out of task events to every open subscription.
+
+    Args:
+        max_subscribers: Maximum number of concurrent subscriptions
+        max_queue: Per-subscriber queue size
+    """
+
+    def __init__(self, max_subscribers: int = 100, max_queue: int = 100) -> None:
+        self.max_subscribers = max_subscribers
+        self.max_queue = max_queue
+        self._subscriptions: List[Subscription] = []
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    @property
+    def has_subscribers(self) -> bool:
+        """Whether anyone is listening (lets publishers skip serialization)."""
+        return bool(self._subscriptions)
+
+    def subscribe(self) -> Optional[Subscription]:
+        """Open a subscription, or return None when at capacity."""
+        with self._lock:
+            if len(self._subscriptions) >= self.max_subscribers:
+                return None
+            subscription = Subscription(self.max_queue)
+            self._subscriptions.append(subscription)
+        SSE_SUBSCRIBERS.inc()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Close a subscription (no-op if it was already dropped)."""
+        with self._lock:
+            if subscription not in self._subscriptions:
+                return
+            self._subscriptions.remove(subscription)
+        SSE_SUBSCRIBERS.dec()
+
+    def publish(self, event_type: str, payload: Dict[str, Any]) -> None:
+        """Deliver an event to every subscriber without blocking.
+
+        Subscribers whose queue is full are dropped and flagged so their
+        stream can tell the client to resynchronise.
+
+        Args:
+            event_type: SSE event name (e.g. ``task.created``)
+            payload: JSON-serializable event data
+        """
+        event = (next(self._ids), event_type, payload)
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            if not subscription.offer(event):
+                subscription.dropped = True
+                self.unsubscribe(subscription)
+                SSE_DROPPED.inc()
+
+
+def stream_capacity(settings: Mapping[str, Any]) -> int:
+    """Number of event streams one worker process may hold open.
+
+    A stream occupies a worker thread for as long as it is open, so the
+    cap leaves TASK_EVENTS_RESERVED_THREADS of the worker's
+    GUNICORN_THREADS (and always at least one) for API requests. A
+    single-threaded worker gets 0: one stream would take it over until
+    gunicorn's timeout killed it.
+
+    Args:
+        settings: Application configuration
+
+    Returns:
+        Maximum concurrent subscriptions (0 refuses every stream)
+    """
+    threads = settings.get("GUNICORN_THREADS", 1)
+    if threads <= 1:
+        return 0
+    capacity = max(threads - settings.get("TASK_EVENTS_RESERVED_THREADS", 2), 1)
+    limit = settings.get("TASK_EVENTS_MAX_SUBSCRIBERS")
+    return capacity if limit is None else min(limit, capacity)
+
+
+def init_event_broker(app: Flask) -> None:
+    """Create the application's event broker from configuration.
+
+    Args:
+        app: Flask application instance
+    """
+    app.extensions["task_events"] = EventBroker(
+        max_subscribers=stream_capacity(app.config),
+        max_queue=app.config.get("TASK_EVENTS_QUEUE_SIZE", 100),
+    )
+
+
+def get_event_broker() -> EventBroker:
+    """Return the event broker of the current application."""
+    return current_app.extensions["task_events"]
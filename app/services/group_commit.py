@@ -0,0 +1,177 @@
+"""Group commit for task creation.
+
+With TASK_GROUP_COMMIT_ENABLED, :meth:`TaskService.create_task` hands
+its payload to the worker's :class:`GroupCommitter` instead of
+committing on its own. A background thread collects concurrent payloads
+for up to TASK_GROUP_COMMIT_MAX_DELAY_MS (or TASK_GROUP_COMMIT_MAX_BATCH
+items) and writes them with one :meth:`TaskService.create_tasks` call,
+i.e. one transaction and one commit/fsync for the whole group; every
+caller then gets its own row back.
+
+The delay is added to each create's latency when traffic is light; in
+exchange, under bursts the commit cost is shared by the whole group.
+Groups never span worker processes.
+"""
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, List, Optional, Tuple
+
+from flask import Flask, current_app
+from prometheus_client import Histogram
+
+from app.schemas.task import TaskCreate
+
+GROUP_COMMIT_SIZE = Histogram(
+    "todo_api_group_commit_size",
+    "Tasks created per group commit",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256),
+)
+
+# (payload, future resolved with (row, created))
+_Item = Tuple[TaskCreate, "Future[Tuple[Any, bool]]"]
+
+
+class _FlusherStopped(Exception):
+    """The flusher thread is gone; the caller commits on its own."""
+
+
+class GroupCommitter:
+    """Batches concurrent task creations into shared transactions.
+
+    Should the flusher thread die, the committer stops and later creates
+    fall back to committing on their own, so no caller waits forever.
+
+    Args:
+        app: Application whose database and services the flusher uses
+        max_delay: Seconds the first item of a group waits for company
+        max_batch: Items after which a group is written immediately
+        timeout: Seconds a caller waits for its group's commit
+    """
+
+    def __init__(
+        self,
+        app: Flask,
+        max_delay: float = 0.002,
+        max_batch: int = 100,
+        timeout: float = 10.0,
+    ) -> None:
+        self.max_delay = max_delay
+        self.max_batch = max(max_batch, 1)
+        self.timeout = timeout
+        self._app = app
+        self._queue: "queue.SimpleQueue[_Item]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self._lock = threading.Lock()
+
+    def submit(self, task_data: TaskCreate) -> Optional[Tuple[Any, bool]]:
+        """Create a task as part of the next group and wait for the commit.
+
+        Args:
+            task_data: Validated task payload
+
+        Returns:
+            Tuple of (task row, created); see TaskService.create_tasks.
+            None if the flusher has stopped and the caller must create
+            the task itself
+
+        Raises:
+            Exception: Whatever failed the group's transaction
+            TimeoutError: If the group was not committed within ``timeout``
+        """
+        future: "Future[Tuple[Any, bool]]" = Future()
+        with self._lock:
+            if self._stopped:
+                return None
+            if self._thread is None:
+                # Started on first use, after gunicorn forked the worker
+                self._thread = threading.Thread(
+                    target=self._run, name="task-group-commit", daemon=True
+                )
+                self._thread.start()
+            self._queue.put((task_data, future))
+        try:
+            return future.result(timeout=self.timeout)
+        except _FlusherStopped:
+            return None
+
+    def _collect(self) -> List[_Item]:
+        """Block for one item, then gather more until the delay or size cap."""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_delay
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                # Items that queued up during the previous flush are taken
+                # even when the delay is zero
+                batch.append(
+                    self._queue.get(timeout=remaining) if remaining > 0
+                    else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        try:
+            while True:
+                self._flush(self._collect())
+        finally:
+            # Only a BaseException gets here. Items are queued under the
+            # lock, so none can arrive after the drain below
+            with self._lock:
+                self._stopped = True
+            while True:
+                try:
+                    _, future = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                future.set_exception(_FlusherStopped())
+
+    def _flush(self, batch: List[_Item]) -> None:
+        """Write one group and resolve its callers' futures."""
+        from app.extensions import db
+        from app.services.task_service import TaskService
+
+        GROUP_COMMIT_SIZE.observe(len(batch))
+        with self._app.app_context():
+            try:
+                results = TaskService.create_tasks(
+                    [task_data for task_data, _ in batch], announce_each=True
+                )
+            except BaseException as e:
+                db.session.rollback()
+                # Never raise SystemExit and the like in request threads
+                error = e if isinstance(e, Exception) else RuntimeError(
+                    f"Group commit aborted: {e!r}"
+                )
+                for _, future in batch:
+                    future.set_exception(error)
+                if error is e:
+                    return
+                raise
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+
+def init_group_commit(app: Flask) -> None:
+    """Create the worker's group committer when group commit is enabled.
+
+    Args:
+        app: Flask application instance
+    """
+    if not app.config.get("TASK_GROUP_COMMIT_ENABLED", False):
+        return
+    app.extensions["task_group_commit"] = GroupCommitter(
+        app,
+        max_delay=app.config.get("TASK_GROUP_COMMIT_MAX_DELAY_MS", 2) / 1000,
+        max_batch=app.config.get("TASK_GROUP_COMMIT_MAX_BATCH", 100),
+        timeout=app.config.get("TASK_GROUP_COMMIT_TIMEOUT_MS", 10000) / 1000,
+    )
+
+
+def get_group_committer() -> Optional[GroupCommitter]:
+    """Return the current application's group committer, if enabled."""
+    return current_app.extensions.get("task_group_commit")
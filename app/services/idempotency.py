@@ -0,0 +1,332 @@
+"""Idempotency-Key support for task writes.
+
+A client that retries a POST, PUT, PATCH or DELETE (after a timeout or a
+dropped connection) sends the same ``Idempotency-Key`` header with every
+attempt. The first attempt runs and its response is stored under the
+key; retries get that response back, marked ``Idempotent-Replayed:
+true``, without touching the tasks table. Reusing a key for a different
+request (method, path, query or body) is rejected with 422, and a retry
+arriving while the first attempt is still running gets 409. Server
+errors (5xx) are not stored, so a failed attempt can be retried.
+
+Responses live in a bounded per-worker LRU with a TTL. A shared backend
+can sit behind it so a retry that lands on another worker is recognised
+too: ``SQLiteIdempotencyBackend`` keeps keys in a SQLite table that every
+process on the host shares (a local stand-in for a shared store).
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from flask import Flask, Response, current_app, make_response, request
+from prometheus_client import Counter
+
+from app.services.cache import LRUCache
+from app.utils.constants import (
+    HTTP_BAD_REQUEST, HTTP_CONFLICT, HTTP_INTERNAL_SERVER_ERROR,
+    HTTP_UNPROCESSABLE_ENTITY, IDEMPOTENCY_KEY_HEADER, IDEMPOTENCY_LEASE_SECONDS,
+    IDEMPOTENT_REPLAYED_HEADER, MAX_IDEMPOTENCY_KEY_LENGTH,
+    ERR_IDEMPOTENCY_IN_PROGRESS, ERR_IDEMPOTENCY_KEY_REUSED,
+    ERR_INVALID_IDEMPOTENCY_KEY,
+)
+from app.utils.error_handlers import APIError
+from app.utils.response_builder import ResponseBuilder
+
+IDEMPOTENCY_REQUESTS = Counter(
+    "todo_api_idempotency_requests",
+    "Write requests carrying an Idempotency-Key",
+    ["outcome"],
+)
+
+# (status, headers, body) of a stored response
+StoredResponse = Tuple[int, Dict[str, str], bytes]
+# (request fingerprint, response or None while the first attempt runs)
+Entry = Tuple[str, Optional[StoredResponse]]
+
+# Recomputed when a response is replayed
+_UNSTORED_HEADERS = {"content-length"}
+
+
+def request_fingerprint(method: str, path: str, query: str, body: bytes) -> str:
+    """Hash what identifies a request, to catch a key reused for another one."""
+    digest = hashlib.sha256(f"{method} {path}?{query}\n".encode())
+    digest.update(body)
+    return digest.hexdigest()
+
+
+class SQLiteIdempotencyBackend:
+    """Idempotency keys shared by every process on a host through a SQLite file.
+
+    A key is claimed by inserting its row, so only one attempt per key runs
+    at a time across workers. Unfinished claims expire after a lease, in
+    case the worker holding them died.
+
+    Args:
+        path: Path of the SQLite file (created if missing)
+        ttl_seconds: How long a stored response is kept
+        max_entries: Rows kept at most; the oldest claims are dropped first
+        lease_seconds: How long an unfinished attempt holds its key
+        clock: Wall-clock time source (shared between processes)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: float,
+        max_entries: int,
+        lease_seconds: float = IDEMPOTENCY_LEASE_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.lease_seconds = lease_seconds
+        self._clock = clock
+        self._local = threading.local()
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS idempotency_keys ("
+            "key TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, status INTEGER, "
+            "headers TEXT, body BLOB, expires_at REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_idempotency_keys_expires_at "
+            "ON idempotency_keys (expires_at)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def claim(self, key: str, fingerprint: str) -> Optional[Entry]:
+        """Claim ``key`` unless another attempt holds it or stored a response.
+
+        Returns:
+            None if the key was claimed, else the existing entry
+        """
+        conn = self._connection()
+        now = self._clock()
+        conn.execute(
+            "DELETE FROM idempotency_keys WHERE key = ? AND expires_at <= ?", (key, now)
+        )
+        claimed = conn.execute(
+            "INSERT INTO idempotency_keys (key, fingerprint, expires_at) "
+            "VALUES (?, ?, ?) ON CONFLICT (key) DO NOTHING RETURNING key",
+            (key, fingerprint, now + self.lease_seconds),
+        ).fetchone()
+        if claimed is not None:
+            return None
+        row = conn.execute(
+            "SELECT fingerprint, status, headers, body FROM idempotency_keys "
+            "WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            # Released by its holder in between
+            return self.claim(key, fingerprint)
+        stored_fingerprint, status, headers, body = row
+        if status is None:
+            return stored_fingerprint, None
+        return stored_fingerprint, (status, json.loads(headers), body)
+
+    def complete(self, key: str, fingerprint: str, response: StoredResponse) -> None:
+        """Store the response of a claimed key and prune old rows."""
+        conn = self._connection()
+        now = self._clock()
+        status, headers, body = response
+        conn.execute(
+            "UPDATE idempotency_keys SET status = ?, headers = ?, body = ?, "
+            "expires_at = ? WHERE key = ? AND fingerprint = ?",
+            (status, json.dumps(headers), body, now + self.ttl_seconds, key, fingerprint),
+        )
+        conn.execute("DELETE FROM idempotency_keys WHERE expires_at <= ?", (now,))
+        # Rowids grow with every claim, so this keeps the newest max_entries
+        conn.execute(
+            "DELETE FROM idempotency_keys WHERE rowid <= "
+            "(SELECT max(rowid) FROM idempotency_keys) - ?",
+            (self.max_entries,),
+        )
+
+    def release(self, key: str) -> None:
+        """Drop an unfinished claim so the request can be retried."""
+        self._connection().execute(
+            "DELETE FROM idempotency_keys WHERE key = ? AND status IS NULL", (key,)
+        )
+
+
+class IdempotencyStore:
+    """Bounded LRU of idempotent responses, optionally backed by a shared store.
+
+    Without a backend, keys are only known to this worker.
+
+    Args:
+        backend: Shared backend, or None
+        max_entries: LRU capacity
+        ttl_seconds: How long a response is replayed
+    """
+
+    def __init__(
+        self,
+        backend: Any = None,
+        max_entries: int = 1000,
+        ttl_seconds: float = 86400.0,
+    ) -> None:
+        self.backend = backend
+        self._lru = LRUCache(max_entries, ttl_seconds)
+        self._lock = threading.Lock()
+
+    def begin(self, key: str, fingerprint: str) -> Optional[StoredResponse]:
+        """Start an attempt for ``key``, or find the response to replay.
+
+        Args:
+            key: Idempotency-Key header value
+            fingerprint: :func:`request_fingerprint` of the request
+
+        Returns:
+            The stored response to send back, or None when the caller now
+            holds the key and must run the request, then call
+            :meth:`finish` (or :meth:`release` if it raised)
+
+        Raises:
+            APIError: 400 for an invalid key, 422 if the key was used for
+                a different request, 409 if its first attempt is running
+        """
+        if not key or len(key) > MAX_IDEMPOTENCY_KEY_LENGTH:
+            raise APIError(ERR_INVALID_IDEMPOTENCY_KEY, HTTP_BAD_REQUEST)
+        entry = self._claim(key, fingerprint)
+        if entry is None:
+            IDEMPOTENCY_REQUESTS.labels(outcome="executed").inc()
+            return None
+        stored_fingerprint, response = entry
+        if stored_fingerprint != fingerprint:
+            IDEMPOTENCY_REQUESTS.labels(outcome="mismatch").inc()
+            raise APIError(ERR_IDEMPOTENCY_KEY_REUSED, HTTP_UNPROCESSABLE_ENTITY)
+        if response is None:
+            IDEMPOTENCY_REQUESTS.labels(outcome="in_progress").inc()
+            raise APIError(ERR_IDEMPOTENCY_IN_PROGRESS, HTTP_CONFLICT)
+        IDEMPOTENCY_REQUESTS.labels(outcome="replayed").inc()
+        status, headers, body = response
+        return status, {**headers, IDEMPOTENT_REPLAYED_HEADER: "true"}, body
+
+    def _claim(self, key: str, fingerprint: str) -> Optional[Entry]:
+        entry = self._lru.get(key)
+        if entry is not None and entry[1] is not None:
+            return entry
+        if self.backend is not None:
+            entry = self.backend.claim(key, fingerprint)
+            if entry is not None and entry[1] is not None:
+                self._lru.set(key, entry)
+            return entry
+        with self._lock:
+            entry = self._lru.get(key)
+            if entry is None:
+                self._lru.set(key, (fingerprint, None))
+            return entry
+
+    def finish(self, key: str, fingerprint: str, response: StoredResponse) -> None:
+        """Store the response of an attempt (or release the key on a 5xx)."""
+        status, headers, body = response
+        if status >= HTTP_INTERNAL_SERVER_ERROR:
+            self.release(key)
+            return
+        headers = {
+            name: value for name, value in headers.items()
+            if name.lower() not in _UNSTORED_HEADERS
+        }
+        self._lru.set(key, (fingerprint, (status, headers, body)))
+        if self.backend is not None:
+            self.backend.complete(key, fingerprint, (status, headers, body))
+
+    def release(self, key: str) -> None:
+        """Forget an unfinished attempt so the request can be retried."""
+        self._lru.pop(key)
+        if self.backend is not None:
+            self.backend.release(key)
+
+
+def create_idempotency_store(settings: Mapping[str, Any]) -> Optional[IdempotencyStore]:
+    """Build the idempotency store from configuration.
+
+    Args:
+        settings: Application configuration (IDEMPOTENCY_* settings)
+
+    Returns:
+        Store instance, or None when IDEMPOTENCY_ENABLED is off
+
+    Raises:
+        ValueError: If IDEMPOTENCY_BACKEND is not recognised
+    """
+    if not settings.get("IDEMPOTENCY_ENABLED", True):
+        return None
+    spec = settings.get("IDEMPOTENCY_BACKEND", "local")
+    max_entries = settings.get("IDEMPOTENCY_MAX_ENTRIES", 1000)
+    ttl_seconds = settings.get("IDEMPOTENCY_TTL_SECONDS", 86400.0)
+    if spec == "local":
+        backend = None
+    elif spec.startswith("sqlite:///"):
+        backend = SQLiteIdempotencyBackend(
+            spec[len("sqlite:///"):], ttl_seconds=ttl_seconds, max_entries=max_entries
+        )
+    else:
+        raise ValueError(f"Unknown idempotency backend: {spec}")
+    return IdempotencyStore(backend, max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+
+def init_idempotency(app: Flask) -> None:
+    """Create the application's idempotency store from configuration.
+
+    Args:
+        app: Flask application instance
+    """
+    app.extensions["idempotency"] = create_idempotency_store(app.config)
+
+
+def get_idempotency_store() -> Optional[IdempotencyStore]:
+    """Return the idempotency store of the current application, if enabled."""
+    return current_app.extensions.get("idempotency")
+
+
+def idempotent(view: Callable[..., Any]) -> Callable[..., Any]:
+    """Make a write endpoint honour the Idempotency-Key header.
+
+    Requests without the header are passed through unchanged.
+    """
+
+    @wraps(view)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        store = get_idempotency_store()
+        key = request.headers.get(IDEMPOTENCY_KEY_HEADER)
+        if store is None or key is None:
+            return view(*args, **kwargs)
+        fingerprint = request_fingerprint(
+            request.method, request.path, request.query_string.decode("latin-1"),
+            request.get_data(),
+        )
+        try:
+            stored = store.begin(key, fingerprint)
+        except APIError as e:
+            return ResponseBuilder.error(e.message, e.status_code)
+        if stored is not None:
+            status, headers, body = stored
+            return Response(body, status, headers)
+
+        try:
+            response = make_response(view(*args, **kwargs))
+        except BaseException:
+            store.release(key)
+            raise
+        store.finish(
+            key, fingerprint,
+            (response.status_code, dict(response.headers), response.get_data()),
+        )
+        return response
+
+    return wrapper
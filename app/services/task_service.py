@@ -1,10 +1,33 @@
 """Task service module."""
-from typing import List, Optional
-from datetime import datetime, timedelta
+import re
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+)
+from datetime import datetime, timedelta, timezone
+from flask import current_app
+from sqlalchemy import (
+    and_, bindparam, column, delete, false, func, insert, literal_column, or_,
+    select, table, true, update,
+)
+from sqlalchemy.orm import load_only
+from sqlalchemy.sql.elements import ColumnClause, UnaryExpression
+from sqlalchemy.sql.operators import custom_op
 from app.extensions import db
-from app.models.task import Task
-from app.schemas.task import TaskCreate, TaskUpdate
-from app.utils.constants import DUPLICATE_CHECK_WINDOW_SECONDS
+from app.models.task import (
+    COUNTER_COMPLETED, COUNTER_NAMES, COUNTER_TOTAL, PUBLIC_FIELDS,
+    SEARCH_FTS_TABLE, Task, TaskCounter, TaskDeletion,
+)
+from app.services.cache import get_task_cache
+from app.services.events import get_event_broker
+from app.services.group_commit import get_group_committer
+from app.schemas.task import (
+    TaskBulkChanges, TaskBulkSelection, TaskCreate, TaskFilter, TaskUpdate
+)
+from app.utils.conditional import as_utc
+from app.utils.constants import (
+    DEFAULT_TASK_SORT, EXPORT_CHUNK_SIZE, SEARCH_TITLE_WEIGHT,
+)
+from app.utils.pagination import CursorKey, SyncToken
 
 
 class TaskService:
@@ -17,18 +40,438 @@ class TaskService:
     """
 
     @staticmethod
-    def get_all_tasks() -> List[Task]:
-        """Get all tasks."""
-        query = Task.query.order_by(
-            Task.created_at.desc()  # type: ignore[attr-defined]
+    def get_all_tasks(
+        limit: Optional[int] = None,
+        after: Optional[CursorKey] = None,
+        criteria: Optional[TaskFilter] = None,
+        sort: str = DEFAULT_TASK_SORT,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Task]:
+        """Get tasks matching ``criteria`` using keyset pagination.
+        
+        Rows are ordered by ``(sort column, id)`` and the seek predicate is
+        answered by the matching ``(column, id)`` index, so fetching a page
+        costs the same however deep the cursor is.
+        
+        Args:
+            limit: Maximum number of tasks to return (None for no limit)
+            after: Key of the last task on the previous page
+            criteria: Optional filter (status, created/updated ranges)
+            sort: Sort column, prefixed with ``-`` for descending order
+            fields: Public fields the caller needs (None for all); other
+                columns, typically the unbounded description, are deferred
+            
+        Returns:
+            List of tasks
+        """
+        stmt = TaskService._list_statement(Task, limit, after, criteria, sort)
+        if fields is not None:
+            columns = TaskService._column_names(fields, sort.lstrip("-"))
+            stmt = stmt.options(load_only(*(getattr(Task, name) for name in columns)))
+        return list(db.session.scalars(stmt))
+
+    @staticmethod
+    def get_task_rows(
+        limit: Optional[int] = None,
+        after: Optional[CursorKey] = None,
+        criteria: Optional[TaskFilter] = None,
+        sort: str = DEFAULT_TASK_SORT,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Any]:
+        """Get the same page as :meth:`get_all_tasks` as raw column tuples.
+        
+        Skips ORM hydration and identity-map bookkeeping; used by the
+        fast read path. Results go through the task cache: rows are
+        immutable, unlike session-bound ORM objects, so they can be shared.
+        Only the columns for ``fields`` (plus id and the sort key) are
+        selected.
+        """
+        def load() -> List[Any]:
+            stmt = TaskService._list_statement(
+                Task.__table__, limit, after, criteria, sort
+            )
+            if fields is not None:
+                stmt = stmt.with_only_columns(
+                    *TaskService._columns(fields, sort.lstrip("-"))
+                )
+            return db.session.execute(stmt).all()
+
+        key = (
+            "list", limit, after, TaskService._filter_key(criteria), sort,
+            tuple(fields) if fields is not None else None,
         )
-        return query.all()  # type: ignore[attr-defined]
+        return get_task_cache().get_or_load(key, load)
 
     @staticmethod
-    def get_task_by_id(task_id: int) -> Optional[Task]:
-        """Get task by ID."""
-        # Use Session.get() instead of Query.get() (SQLAlchemy 2.x)
-        return db.session.get(Task, task_id)
+    def get_task_row(
+        task_id: int, fields: Optional[Sequence[str]] = None
+    ) -> Optional[Any]:
+        """Get one task as a raw column tuple, or None if it does not exist.
+        
+        Args:
+            task_id: Task ID
+            fields: Public fields to select (None for all); id and
+                updated_at are always included for the validators
+        """
+        def load() -> Optional[Any]:
+            table = Task.__table__
+            stmt = select(table).where(table.c.id == task_id)
+            if fields is not None:
+                stmt = stmt.with_only_columns(*TaskService._columns(fields, "updated_at"))
+            return db.session.execute(stmt).first()
+
+        key = ("task", task_id, tuple(fields) if fields is not None else None)
+        return get_task_cache().get_or_load(key, load)
+
+    @staticmethod
+    def search_tasks(
+        query: str,
+        limit: int,
+        criteria: Optional[TaskFilter] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Any]:
+        """Full-text search over task titles and descriptions.
+        
+        Every word of ``query`` must match (title or description); results
+        are ranked by relevance, title matches first. Served from the FTS5
+        table on SQLite and the ``search_vector`` GIN index on PostgreSQL;
+        other databases fall back to a (scanning) substring match.
+        
+        Args:
+            query: Free-text query typed by the user
+            limit: Maximum number of results
+            criteria: Optional filter applied to the matches
+            fields: Public fields to select (None for all)
+            
+        Returns:
+            Matching tasks as raw column tuples, best match first
+        """
+        def load() -> List[Any]:
+            stmt = TaskService._search_statement(query, limit, criteria)
+            if stmt is None:
+                return []
+            if fields is not None:
+                stmt = stmt.with_only_columns(*TaskService._columns(fields))
+            return db.session.execute(stmt).all()
+
+        key = (
+            "search", query, limit, TaskService._filter_key(criteria),
+            tuple(fields) if fields is not None else None,
+        )
+        return get_task_cache().get_or_load(key, load)
+
+    @staticmethod
+    def _search_statement(
+        query: str,
+        limit: int,
+        criteria: Optional[TaskFilter] = None,
+        dialect: Optional[str] = None,
+    ) -> Optional[Any]:
+        """Build the dialect-specific search query (None if nothing to match).
+        
+        Every match is ranked, so the cost grows with the number of rows a
+        query matches. Without ``criteria``, SQLite ranks and limits inside
+        the FTS5 table and joins only the returned rows to ``tasks``.
+        ``dialect`` defaults to that of the session's database.
+        """
+        tasks = Task.__table__
+        words = re.findall(r"\w+", query)
+        if not words:
+            return None
+        filters = TaskService._filter_clauses(criteria) if criteria is not None else []
+        dialect = dialect or db.session.get_bind().dialect.name
+        if dialect == "sqlite":
+            # Quote every word so user input is never parsed as FTS5 syntax
+            match = " ".join(f'"{word}"' for word in words)
+            fts = table(SEARCH_FTS_TABLE, column("rowid"))
+            fts_ref: ColumnClause[Any] = literal_column(SEARCH_FTS_TABLE)
+            rank = func.bm25(fts_ref, SEARCH_TITLE_WEIGHT, 1.0)  # lower is better
+            ranked = (
+                select(fts.c.rowid, rank.label("rank"))
+                .where(fts_ref.op("MATCH")(match))
+                .order_by(rank, fts.c.rowid.desc())
+            )
+            if not filters:
+                ranked = ranked.limit(limit)
+            hits = ranked.subquery()
+            return (
+                select(tasks)
+                .join_from(tasks, hits, hits.c.rowid == tasks.c.id)
+                .where(*filters)
+                .order_by(hits.c.rank, tasks.c.id.desc())
+                .limit(limit)
+            )
+        if dialect == "postgresql":
+            vector: ColumnClause[Any] = literal_column("tasks.search_vector")
+            ts_query = func.plainto_tsquery("english", " ".join(words))
+            return (
+                select(tasks)
+                .where(vector.op("@@")(ts_query), *filters)
+                .order_by(func.ts_rank_cd(vector, ts_query).desc(), tasks.c.id.desc())
+                .limit(limit)
+            )
+        matches = (
+            or_(
+                tasks.c.title.icontains(word, autoescape=True),
+                tasks.c.description.icontains(word, autoescape=True),
+            )
+            for word in words
+        )
+        return (
+            select(tasks)
+            .where(*matches, *filters)
+            .order_by(tasks.c.created_at.desc(), tasks.c.id.desc())
+            .limit(limit)
+        )
+
+    @staticmethod
+    def get_collection_state() -> Tuple[int, Optional[datetime], int]:
+        """Get the cheap aggregate state used to validate list responses.
+        
+        ``max(updated_at)`` is answered from ``ix_tasks_updated_at_id``,
+        the newest tombstone from the deletion log's primary key and the
+        count from the ``total`` counter, each in its own scalar subquery:
+        combined with ``count(*)`` in one SELECT, the max would lose its
+        index shortcut and both would scan the table. The aggregate is
+        cached per data version when the cache is on.
+        
+        Returns:
+            Tuple of (data version, Last-Modified or None, task count)
+        """
+        def load() -> Tuple[Optional[datetime], int]:
+            return TaskService._collection_state(
+                db.session.execute(TaskService._collection_state_statement()).one()
+            )
+
+        cache = get_task_cache()
+        version = cache.version
+        last_modified, count = cache.get_or_load(("state",), load)
+        return version, last_modified, count
+
+    @staticmethod
+    def _collection_state_statement() -> Any:
+        """SELECT of (newest updated_at, newest deletion, total) for list validators."""
+        table = Task.__table__
+        deletions = TaskDeletion.__table__
+        counters = TaskCounter.__table__
+        return select(
+            select(func.max(table.c.updated_at)).scalar_subquery(),
+            select(deletions.c.deleted_at)
+            .where(deletions.c.id == select(func.max(deletions.c.id)).scalar_subquery())
+            .scalar_subquery(),
+            select(counters.c.value)
+            .where(counters.c.name == COUNTER_TOTAL)
+            .scalar_subquery(),
+        )
+
+    @staticmethod
+    def _collection_state(row: Any) -> Tuple[Optional[datetime], int]:
+        """Fold a collection-state row into (Last-Modified, task count).
+        
+        A deletion modifies the collection without touching any remaining
+        row's ``updated_at``, so the newest tombstone counts too; otherwise
+        If-Modified-Since would get a 304 for a list that lost a task.
+        """
+        updated_at, deleted_at, count = row
+        stamps = [as_utc(stamp) for stamp in (updated_at, deleted_at) if stamp is not None]
+        return max(stamps, default=None), count or 0
+
+    @staticmethod
+    def get_task_updated_at(task_id: int) -> Optional[datetime]:
+        """Get a task's updated_at without loading the row (None if missing)."""
+        table = Task.__table__
+        return db.session.execute(
+            select(table.c.updated_at).where(table.c.id == task_id)
+        ).scalar()
+
+    @staticmethod
+    def task_exists(task_id: int) -> bool:
+        """Check whether a task exists (primary-key probe)."""
+        table = Task.__table__
+        return db.session.execute(
+            select(table.c.id).where(table.c.id == task_id)
+        ).first() is not None
+
+    @staticmethod
+    def _list_statement(
+        entity: Any,
+        limit: Optional[int],
+        after: Optional[CursorKey],
+        criteria: Optional[TaskFilter] = None,
+        sort: str = DEFAULT_TASK_SORT,
+        dialect: Optional[str] = None,
+    ) -> Any:
+        """Build the keyset-paginated list query for an entity or table.
+        
+        ``updated_after`` is always answered by a range of
+        ``ix_tasks_updated_at_id``, whatever the sort. ``dialect`` defaults
+        to that of the session's database.
+        """
+        table = Task.__table__
+        descending = sort.startswith("-")
+        sort_column = table.c[sort.lstrip("-")]
+        order_column: Any = sort_column
+        if (
+            criteria is not None
+            and criteria.updated_after is not None
+            and sort_column is not table.c.updated_at
+            and (dialect or db.session.get_bind().dialect.name) == "sqlite"
+        ):
+            # Left to itself, SQLite walks the whole sort index to skip the
+            # sort and filters updated_at row by row. A unary "+" keeps the
+            # sort column out of index selection, so the planner seeks the
+            # updated_at range and sorts only the rows it finds
+            order_column = UnaryExpression(
+                sort_column, operator=custom_op("+"), type_=sort_column.type
+            )
+        if descending:
+            order = [order_column.desc(), table.c.id.desc()]
+        else:
+            order = [order_column.asc(), table.c.id.asc()]
+        stmt = select(entity).order_by(*order)
+        if criteria is not None:
+            stmt = stmt.where(*TaskService._filter_clauses(criteria))
+        if after is not None:
+            value, task_id = after
+            # The redundant bound on the sort column alone is what lets
+            # the planner turn the seek into an index range search; the
+            # OR by itself is answered by scanning the index from the top
+            if descending:
+                seek = or_(
+                    sort_column < value,
+                    and_(sort_column == value, table.c.id < task_id),
+                )
+                bound = sort_column <= value
+            else:
+                seek = or_(
+                    sort_column > value,
+                    and_(sort_column == value, table.c.id > task_id),
+                )
+                bound = sort_column >= value
+            stmt = stmt.where(bound, seek)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return stmt
+
+    @staticmethod
+    def stream_task_rows(chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[Sequence[Any]]:
+        """Stream every task as chunks of Core rows, in id order.
+        
+        Uses ``yield_per`` so the driver reads from a server-side cursor
+        (PostgreSQL) or steps the statement lazily (SQLite); memory stays
+        bounded by ``chunk_size`` regardless of table size.
+        
+        Args:
+            chunk_size: Rows fetched per round-trip
+            
+        Yields:
+            Chunks of at most ``chunk_size`` task rows
+        """
+        table = Task.__table__
+        result = db.session.execute(
+            select(table).order_by(table.c.id).execution_options(yield_per=chunk_size)
+        )
+        for partition in result.partitions():
+            yield partition
+
+    @staticmethod
+    def get_changes(
+        position: SyncToken, limit: int, lag_seconds: float = 0.0
+    ) -> Tuple[Sequence[Any], Sequence[Any], bool, SyncToken]:
+        """Get task changes and deletions after a change-feed position.
+        
+        Changed tasks are read in ``(updated_at, id)`` order from
+        ``ix_tasks_updated_at_id`` and tombstones by log position, so a
+        poll costs O(changes) rather than O(table). Clients should apply
+        the returned deletions before the changes.
+        
+        Timestamps and log ids are assigned before commit, so a concurrent
+        transaction can commit a position older than one already returned.
+        Entries younger than ``lag_seconds`` are returned but the next
+        position never moves past them; they are returned again on the
+        next poll (clients apply changes idempotently) and a late commit
+        behind them is not skipped.
+        
+        Args:
+            position: (updated_at, task id, deletion log id) already seen
+            limit: Maximum number of changes and of deletions returned
+            lag_seconds: Safety lag (longer than any write transaction)
+            
+        Returns:
+            Tuple of (changed task rows, tombstone rows, has_more, next
+            position)
+        """
+        updated_at, task_id, deletion_id = position
+        tasks = Task.__table__
+        stmt = select(tasks).order_by(tasks.c.updated_at, tasks.c.id).limit(limit + 1)
+        if updated_at is not None:
+            stmt = stmt.where(
+                or_(
+                    tasks.c.updated_at > updated_at,
+                    and_(tasks.c.updated_at == updated_at, tasks.c.id > task_id),
+                )
+            )
+        changes = db.session.execute(stmt).all()
+
+        log = TaskDeletion.__table__
+        deletions = db.session.execute(
+            select(log.c.id, log.c.task_id, log.c.deleted_at)
+            .where(log.c.id > deletion_id)
+            .order_by(log.c.id)
+            .limit(limit + 1)
+        ).all()
+
+        has_more = len(changes) > limit or len(deletions) > limit
+        changes, deletions = changes[:limit], deletions[:limit]
+        horizon = datetime.now(timezone.utc) - timedelta(seconds=lag_seconds)
+        for row in changes:
+            if not TaskService._settled(row.updated_at, horizon):
+                break
+            updated_at, task_id = row.updated_at, row.id
+        for row in deletions:
+            if not TaskService._settled(row.deleted_at, horizon):
+                break
+            deletion_id = row.id
+        next_position = (updated_at, task_id, deletion_id)
+        # A page of unsettled entries only would come straight back
+        has_more = has_more and next_position != position
+        return changes, deletions, has_more, next_position
+
+    @staticmethod
+    def _settled(stamp: datetime, horizon: datetime) -> bool:
+        """Whether a change-feed timestamp is older than the safety horizon."""
+        return as_utc(stamp) <= horizon
+
+    @staticmethod
+    def prune_deletions(retention_days: float) -> int:
+        """Delete tombstones older than the change feed's retention window.
+        
+        Args:
+            retention_days: Age in days of the oldest tombstone kept
+            
+        Returns:
+            Number of tombstones deleted
+        """
+        log = TaskDeletion.__table__
+        cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+        result = db.session.execute(delete(log).where(log.c.deleted_at < cutoff))
+        db.session.commit()
+        return result.rowcount
+
+    @staticmethod
+    def get_task_by_id(
+        task_id: int, fields: Optional[Sequence[str]] = None
+    ) -> Optional[Task]:
+        """Get task by ID, loading only the columns for ``fields`` if given."""
+        if fields is None:
+            # Use Session.get() instead of Query.get() (SQLAlchemy 2.x)
+            return db.session.get(Task, task_id)
+        columns = TaskService._column_names(fields, "updated_at")
+        return db.session.scalars(
+            select(Task)
+            .filter_by(id=task_id)
+            .options(load_only(*(getattr(Task, name) for name in columns)))
+        ).first()
 
     @staticmethod
     def create_task(task_data: TaskCreate) -> Task:
@@ -36,7 +479,12 @@ class TaskService:
         
         Prevents duplicate tasks from being created if an identical
         task (same title and description) was created within the
-        deduplication window.
+        deduplication window (TASK_DEDUP_WINDOW_SECONDS; no lookup is
+        made when it is 0).
+        
+        In group-commit mode (TASK_GROUP_COMMIT_ENABLED) the task is
+        written together with concurrent creations of the same worker,
+        and the result is a detached Task built from its row.
         
         Args:
             task_data: Task creation data
@@ -44,32 +492,181 @@ class TaskService:
         Returns:
             Created or existing task
         """
+        committer = get_group_committer()
+        grouped = committer.submit(task_data) if committer is not None else None
+        if grouped is not None:
+            row, _ = grouped
+            return Task(**row._mapping)
+
         # Check for duplicates within the deduplication window
-        recent_duplicate = TaskService._find_recent_duplicate(task_data)
-        if recent_duplicate:
-            return recent_duplicate
+        window = TaskService._dedup_window()
+        if window:
+            recent_duplicate = TaskService._find_recent_duplicate(task_data, window)
+            if recent_duplicate:
+                return recent_duplicate
 
-        task = Task(title=task_data.title, description=task_data.description)
+        task = Task(
+            title=task_data.title,
+            description=task_data.description,
+            content_hash=Task.compute_content_hash(
+                task_data.title, task_data.description
+            ),
+        )
         db.session.add(task)
+        TaskService._adjust_counters(total=1)
         db.session.commit()
+        TaskService._after_write("task.created", task.to_dict)
         return task
 
     @staticmethod
-    def _find_recent_duplicate(task_data: TaskCreate) -> Optional[Task]:
+    def create_tasks(
+        tasks_data: List[TaskCreate], announce_each: bool = False
+    ) -> List[Tuple[Any, bool]]:
+        """Create many tasks in a single transaction.
+        
+        Duplicate detection runs as one query for the whole batch, and new
+        rows are written with a single executemany INSERT ... RETURNING.
+        Items that repeat an earlier item of the same batch resolve to
+        the task created for that earlier item. Both checks only apply
+        while deduplication is enabled (TASK_DEDUP_WINDOW_SECONDS > 0). No
+        ORM objects are hydrated; results are Core rows.
+        
+        Args:
+            tasks_data: Validated task creation payloads
+            announce_each: Publish one ``task.created`` event per new task
+                (group commit) instead of a single ``tasks.invalidated``
+            
+        Returns:
+            One (task row, created) tuple per input item, in input order.
+            ``created`` is False when an existing task was returned instead.
+        """
+        if not tasks_data:
+            return []
+        hashes = [
+            Task.compute_content_hash(data.title, data.description)
+            for data in tasks_data
+        ]
+        window = TaskService._dedup_window()
+        existing = TaskService._find_recent_duplicates(hashes, window) if window else {}
+
+        new_rows: List[Dict[str, Any]] = []
+        pending = set()
+        for data, content_hash in zip(tasks_data, hashes):
+            if content_hash in existing or content_hash in pending:
+                continue
+            if window:
+                pending.add(content_hash)
+            new_rows.append(
+                {
+                    "title": data.title,
+                    "description": data.description,
+                    "completed": False,
+                    "content_hash": content_hash,
+                }
+            )
+
+        inserted: Dict[str, List[Any]] = {}
+        if new_rows:
+            table = Task.__table__
+            # Rows are matched back by content hash rather than with
+            # sort_by_parameter_order: SQLite has no ordering sentinel, so
+            # that would degrade to one INSERT per row. Rows sharing a hash
+            # (only without deduplication) are identical apart from the id
+            for row in db.session.execute(insert(table).returning(*table.c), new_rows):
+                inserted.setdefault(row.content_hash, []).append(row)
+            for rows in inserted.values():
+                rows.sort(key=lambda row: row.id)
+            TaskService._adjust_counters(total=len(new_rows))
+            db.session.commit()
+            if announce_each:
+                TaskService._after_write_each(
+                    "task.created",
+                    [Task.row_to_dict(row) for rows in inserted.values() for row in rows],
+                )
+            else:
+                TaskService._after_write(
+                    "tasks.invalidated", lambda: {"reason": "batch_create"}
+                )
+
+        results: List[Tuple[Any, bool]] = []
+        claimed: Dict[str, int] = {}
+        for content_hash in hashes:
+            if content_hash in existing:
+                results.append((existing[content_hash], False))
+                continue
+            rows = inserted[content_hash]
+            index = claimed.get(content_hash, 0)
+            claimed[content_hash] = index + 1
+            # Repeats beyond the inserted rows were deduplicated
+            results.append((rows[min(index, len(rows) - 1)], index < len(rows)))
+        return results
+
+    @staticmethod
+    def _dedup_window() -> float:
+        """Return the configured dedup window in seconds (0 = disabled)."""
+        return current_app.config.get("TASK_DEDUP_WINDOW_SECONDS", 0)
+
+    @staticmethod
+    def _duplicate_window_start(window_seconds: float) -> datetime:
+        """Return the earliest creation time still inside the dedup window."""
+        return datetime.now(timezone.utc) - timedelta(seconds=window_seconds)
+
+    @staticmethod
+    def _find_recent_duplicates(
+        hashes: Iterable[str], window_seconds: float
+    ) -> Dict[str, Any]:
+        """Find recently created tasks for many content hashes in one query.
+        
+        Args:
+            hashes: Content hashes to look up
+            window_seconds: Length of the dedup window
+            
+        Returns:
+            Mapping of content hash to the newest matching task row
+        """
+        rows = db.session.execute(
+            TaskService._duplicates_statement(hashes, window_seconds)
+        ).all()
+        # Later rows overwrite earlier ones, leaving the newest per hash
+        return {row.content_hash: row for row in rows}
+
+    @staticmethod
+    def _duplicates_statement(hashes: Iterable[str], window_seconds: float) -> Any:
+        """SELECT of tasks created inside the dedup window with these hashes."""
+        table = Task.__table__
+        return (
+            select(table)
+            .where(
+                table.c.content_hash.in_(set(hashes)),
+                table.c.created_at >= TaskService._duplicate_window_start(window_seconds),
+            )
+            .order_by(table.c.created_at)
+        )
+
+    @staticmethod
+    def _find_recent_duplicate(
+        task_data: TaskCreate, window_seconds: float
+    ) -> Optional[Task]:
         """Find a recently created task matching the given data.
         
+        Matches on the stored content hash, so the lookup is a range probe
+        on ``ix_tasks_content_hash_created_at`` instead of a comparison
+        against the unindexed title and description columns.
+        
         Args:
             task_data: Task data to match
+            window_seconds: Length of the dedup window
             
         Returns:
             Matching task if found within deduplication window, None otherwise
         """
-        now = datetime.utcnow()
-        window_start = now - timedelta(seconds=DUPLICATE_CHECK_WINDOW_SECONDS)
+        window_start = TaskService._duplicate_window_start(window_seconds)
+        content_hash = Task.compute_content_hash(
+            task_data.title, task_data.description
+        )
         recent = (
             Task.query.filter(
-                Task.title == task_data.title,
-                Task.description == task_data.description,
+                Task.content_hash == content_hash,
                 Task.created_at >= window_start,
             )
             .order_by(Task.created_at.desc())
@@ -78,15 +675,386 @@ class TaskService:
         return recent
 
     @staticmethod
-    def update_task(task: Task, task_data: TaskUpdate) -> Task:
-        """Update an existing task."""
-        for key, value in task_data.model_dump(exclude_unset=True).items():
-            setattr(task, key, value)
+    def update_task(
+        task_id: int,
+        task_data: TaskUpdate,
+        if_match: Optional[Sequence[datetime]] = None,
+    ) -> Optional[Any]:
+        """Update a task with a single UPDATE ... RETURNING statement.
+        
+        A missing task shows up as an empty RETURNING result. The row is
+        only read (and locked) first when the write depends on stored
+        values: a status change, for the counters, or a change to just one
+        of title/description, to recompute the content hash.
+        
+        Args:
+            task_id: ID of the task to update
+            task_data: Fields to change (unset fields are left untouched)
+            if_match: Accepted ``updated_at`` values (optimistic concurrency);
+                None skips the check
+            
+        Returns:
+            Updated task row, or None if the task does not exist or the
+            precondition failed
+        """
+        changes = task_data.model_dump(exclude_unset=True)
+        previous = None
+        stored = TaskService._stored_columns(changes)
+        if stored:
+            # RETURNING only sees the new row; lock and read the old values
+            previous = db.session.execute(
+                TaskService._locked_read_statement(task_id, stored)
+            ).first()
+            if previous is None:
+                db.session.rollback()
+                return None
+
+        row = db.session.execute(
+            TaskService._update_statement(
+                task_id, TaskService._update_values(changes, previous), if_match
+            )
+        ).first()
+        if row is not None:
+            TaskService._adjust_counters(
+                completed=TaskService._status_delta(changes, previous, row)
+            )
         db.session.commit()
-        return task
+        if row is not None:
+            TaskService._after_write("task.updated", lambda: Task.row_to_dict(row))
+        return row
+
+    @staticmethod
+    def _stored_columns(changes: Dict[str, Any]) -> List[Any]:
+        """Columns an update must read before writing ``changes``."""
+        table = Task.__table__
+        columns = []
+        if "completed" in changes:
+            columns.append(table.c.completed)
+        if ("title" in changes) != ("description" in changes):
+            columns.extend((table.c.title, table.c.description))
+        return columns
+
+    @staticmethod
+    def _update_values(
+        changes: Dict[str, Any], previous: Any = None
+    ) -> Dict[str, Any]:
+        """Column values for updating a task from a (partial) payload.
+        
+        Args:
+            changes: Fields set in the payload
+            previous: Stored row with the :meth:`_stored_columns` of ``changes``
+        """
+        if not changes:
+            # Still one statement: a self-assignment suppresses the
+            # updated_at onupdate and keeps the If-Match check in SQL
+            return {"updated_at": Task.__table__.c.updated_at}
+        if "title" in changes or "description" in changes:
+            title = changes["title"] if "title" in changes else previous.title
+            description = (
+                changes["description"] if "description" in changes else previous.description
+            )
+            changes = {**changes, "content_hash": Task.compute_content_hash(title, description)}
+        return changes
 
     @staticmethod
-    def delete_task(task: Task) -> None:
-        """Delete a task."""
-        db.session.delete(task)
+    def _locked_read_statement(task_id: int, columns: Sequence[Any]) -> Any:
+        """SELECT ... FOR UPDATE of some stored columns of one task."""
+        table = Task.__table__
+        return select(*columns).where(table.c.id == task_id).with_for_update()
+
+    @staticmethod
+    def _update_statement(
+        task_id: int,
+        values: Dict[str, Any],
+        if_match: Optional[Sequence[datetime]] = None,
+    ) -> Any:
+        """UPDATE ... RETURNING of one task, optionally conditional on If-Match."""
+        table = Task.__table__
+        stmt = update(table).where(table.c.id == task_id)
+        if if_match is not None:
+            stmt = stmt.where(table.c.updated_at.in_(if_match))
+        return stmt.values(**values).returning(*table.c)
+
+    @staticmethod
+    def _status_delta(changes: Dict[str, Any], previous: Any, row: Any) -> int:
+        """Completed-counter delta of an update (-1, 0 or 1).
+        
+        A NULL status (raw inserts) counts as open, like reconcile does.
+        """
+        if "completed" not in changes or bool(previous.completed) == bool(row.completed):
+            return 0
+        return 1 if row.completed else -1
+
+    @staticmethod
+    def _delete_statement(
+        task_id: int, if_match: Optional[Sequence[datetime]] = None
+    ) -> Any:
+        """DELETE ... RETURNING (id, completed) of one task."""
+        table = Task.__table__
+        stmt = delete(table).where(table.c.id == task_id)
+        if if_match is not None:
+            stmt = stmt.where(table.c.updated_at.in_(if_match))
+        return stmt.returning(table.c.id, table.c.completed)
+
+    @staticmethod
+    def _removal_deltas(deleted: Sequence[Any]) -> Dict[str, int]:
+        """Counter deltas for deleted (id, completed) rows; NULL counts as open."""
+        return {
+            "total": -len(deleted),
+            "completed": -sum(bool(row.completed) for row in deleted),
+        }
+
+    @staticmethod
+    def delete_task(
+        task_id: int, if_match: Optional[Sequence[datetime]] = None
+    ) -> bool:
+        """Delete a task with a single DELETE ... RETURNING statement.
+        
+        Args:
+            task_id: ID of the task to delete
+            if_match: Accepted ``updated_at`` values (optimistic concurrency);
+                None skips the check
+            
+        Returns:
+            True if the task was deleted, False if it does not exist or the
+            precondition failed
+        """
+        deleted = db.session.execute(TaskService._delete_statement(task_id, if_match)).first()
+        if deleted is None:
+            db.session.rollback()
+            return False
+        deleted_id = deleted.id
+        TaskService._record_deletions([deleted_id])
+        TaskService._adjust_counters(**TaskService._removal_deltas([deleted]))
+        db.session.commit()
+        TaskService._after_write("task.deleted", lambda: {"id": deleted_id})
+        return True
+
+    @staticmethod
+    def bulk_update(selection: TaskBulkSelection, changes: TaskBulkChanges) -> int:
+        """Update every selected task with a single UPDATE ... WHERE.
+        
+        Rows are never loaded into the session. Tasks already in the
+        requested state are skipped, so every updated row is a status
+        transition and the counters move by the row count.
+        
+        Args:
+            selection: Id list and/or filter selecting the tasks
+            changes: Field values to set
+            
+        Returns:
+            Number of tasks whose status changed
+        """
+        table = Task.__table__
+        result = db.session.execute(
+            update(table)
+            .where(
+                *TaskService._selection_clauses(selection),
+                table.c.completed != changes.completed,
+            )
+            .values(**changes.model_dump())
+        )
+        if result.rowcount:
+            sign = 1 if changes.completed else -1
+            TaskService._adjust_counters(completed=sign * result.rowcount)
         db.session.commit()
+        if result.rowcount:
+            TaskService._after_write(
+                "tasks.invalidated", lambda: {"reason": "bulk_update"}
+            )
+        return result.rowcount
+
+    @staticmethod
+    def bulk_delete(selection: TaskBulkSelection) -> int:
+        """Delete every selected task with a single DELETE ... WHERE.
+        
+        The deleted ids come back through RETURNING and are written to the
+        deletion log with one executemany INSERT in the same transaction.
+        
+        Args:
+            selection: Id list and/or filter selecting the tasks
+            
+        Returns:
+            Number of tasks deleted
+        """
+        table = Task.__table__
+        deleted = db.session.execute(
+            delete(table)
+            .where(*TaskService._selection_clauses(selection))
+            .returning(table.c.id, table.c.completed)
+        ).all()
+        deleted_ids = [row.id for row in deleted]
+        if deleted_ids:
+            TaskService._record_deletions(deleted_ids)
+            TaskService._adjust_counters(**TaskService._removal_deltas(deleted))
+        db.session.commit()
+        if deleted_ids:
+            TaskService._after_write("tasks.deleted", lambda: {"ids": deleted_ids})
+        return len(deleted_ids)
+
+    @staticmethod
+    def _after_write(event_type: str, payload: Callable[[], Dict[str, Any]]) -> None:
+        """Invalidate cached reads and notify subscribers after a commit.
+        
+        Args:
+            event_type: Event name published to task stream subscribers
+            payload: Builds the event data; only called if anyone listens
+        """
+        get_task_cache().invalidate()
+        broker = get_event_broker()
+        if broker.has_subscribers:
+            broker.publish(event_type, payload())
+
+    @staticmethod
+    def _after_write_each(event_type: str, payloads: List[Dict[str, Any]]) -> None:
+        """Like :meth:`_after_write` for several writes in one commit."""
+        get_task_cache().invalidate()
+        broker = get_event_broker()
+        if broker.has_subscribers:
+            for payload in payloads:
+                broker.publish(event_type, payload)
+
+    @staticmethod
+    def get_stats() -> Dict[str, int]:
+        """Get task totals from the counters table (no table scan).
+        
+        Returns:
+            Dictionary with ``total``, ``open`` and ``completed`` counts
+        """
+        return TaskService._stats(
+            db.session.execute(TaskService._counters_statement()).all()
+        )
+
+    @staticmethod
+    def _counters_statement() -> Any:
+        """SELECT of every (name, value) counter row."""
+        counters = TaskCounter.__table__
+        return select(counters.c.name, counters.c.value)
+
+    @staticmethod
+    def _stats(rows: Iterable[Any]) -> Dict[str, int]:
+        """Turn counter rows into the ``total``/``open``/``completed`` stats."""
+        values: Dict[str, int] = {name: value for name, value in rows}
+        total = values.get(COUNTER_TOTAL, 0)
+        completed = values.get(COUNTER_COMPLETED, 0)
+        return {"total": total, "open": total - completed, "completed": completed}
+
+    @staticmethod
+    def reconcile_counters() -> Dict[str, Tuple[int, int]]:
+        """Rebuild the counters from the tasks table.
+        
+        Takes the counts and rewrites the counters in one transaction.
+        
+        Returns:
+            Mapping of counter name to (stored value, actual value) for
+            every counter that had drifted (empty when all were correct)
+        """
+        table = Task.__table__
+        counters = TaskCounter.__table__
+        total, completed = db.session.execute(
+            select(
+                func.count(),
+                func.coalesce(func.sum(func.cast(table.c.completed, db.Integer)), 0),
+            ).select_from(table)
+        ).one()
+        actual = {COUNTER_TOTAL: total, COUNTER_COMPLETED: completed}
+        stored: Dict[str, int] = {
+            name: value
+            for name, value in db.session.execute(TaskService._counters_statement())
+        }
+        drift = {
+            name: (stored.get(name, 0), actual[name])
+            for name in COUNTER_NAMES
+            if stored.get(name) != actual[name]
+        }
+        db.session.execute(delete(counters))
+        db.session.execute(
+            insert(counters),
+            [{"name": name, "value": value} for name, value in actual.items()],
+        )
+        db.session.commit()
+        return drift
+
+    @staticmethod
+    def _adjust_counters(total: int = 0, completed: int = 0) -> None:
+        """Apply counter deltas in the caller's transaction (caller commits)."""
+        deltas = TaskService._counter_deltas(total, completed)
+        if deltas:
+            db.session.execute(TaskService._counter_statement(), deltas)
+
+    @staticmethod
+    def _counter_deltas(total: int = 0, completed: int = 0) -> List[Dict[str, Any]]:
+        """Executemany parameters of :meth:`_counter_statement` (non-zero deltas)."""
+        return [
+            {"_name": name, "_delta": delta}
+            for name, delta in ((COUNTER_TOTAL, total), (COUNTER_COMPLETED, completed))
+            if delta
+        ]
+
+    @staticmethod
+    def _counter_statement() -> Any:
+        """UPDATE adding ``_delta`` to the counter named ``_name``."""
+        counters = TaskCounter.__table__
+        return (
+            update(counters)
+            .where(counters.c.name == bindparam("_name"))
+            .values(value=counters.c.value + bindparam("_delta"))
+        )
+
+    @staticmethod
+    def _record_deletions(task_ids: List[int]) -> None:
+        """Write tombstones for deleted tasks (caller commits)."""
+        db.session.execute(
+            insert(TaskDeletion.__table__),
+            [{"task_id": task_id} for task_id in task_ids],
+        )
+
+    @staticmethod
+    def _selection_clauses(selection: TaskBulkSelection) -> List[Any]:
+        """Translate a bulk selection into SQL WHERE clauses (ANDed)."""
+        table = Task.__table__
+        clauses: List[Any] = []
+        if selection.ids:
+            clauses.append(table.c.id.in_(selection.ids))
+        if selection.filter is not None:
+            clauses += TaskService._filter_clauses(selection.filter)
+        return clauses
+
+    @staticmethod
+    def _filter_clauses(criteria: TaskFilter) -> List[Any]:
+        """Translate filter criteria into SQL WHERE clauses (ANDed)."""
+        table = Task.__table__
+        clauses: List[Any] = []
+        if criteria.completed is not None:
+            # Compare against a literal, not a bound parameter: SQLite only
+            # uses the partial status indexes when it can prove the match
+            # at prepare time
+            clauses.append(
+                table.c.completed == (true() if criteria.completed else false())
+            )
+        if criteria.created_before is not None:
+            clauses.append(table.c.created_at < criteria.created_before)
+        if criteria.created_after is not None:
+            clauses.append(table.c.created_at > criteria.created_after)
+        if criteria.updated_after is not None:
+            clauses.append(table.c.updated_at > criteria.updated_after)
+        return clauses
+
+    @staticmethod
+    def _column_names(fields: Sequence[str], *required: str) -> List[str]:
+        """Column names to select for ``fields`` plus ``required`` columns."""
+        wanted = {"id", *fields, *required}
+        return [name for name in PUBLIC_FIELDS if name in wanted]
+
+    @staticmethod
+    def _columns(fields: Sequence[str], *required: str) -> List[Any]:
+        """Core columns to select for ``fields`` plus ``required`` columns."""
+        table = Task.__table__
+        return [table.c[name] for name in TaskService._column_names(fields, *required)]
+
+    @staticmethod
+    def _filter_key(criteria: Optional[TaskFilter]) -> Optional[Tuple[Any, ...]]:
+        """Hashable form of filter criteria, for cache keys."""
+        if criteria is None:
+            return None
+        return tuple(getattr(criteria, name) for name in TaskFilter.model_fields)
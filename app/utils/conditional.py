@@ -0,0 +1,194 @@
+"""ETag and Last-Modified helpers for conditional requests.
+
+Single-task ETags encode the task id and its ``updated_at`` timestamp, so
+an ``If-Match`` header can be turned straight into an
+``UPDATE ... WHERE id = ? AND updated_at = ?`` precondition. Collection
+ETags hash the cheap aggregate state of the table; neither kind requires
+serializing a response body.
+"""
+import hashlib
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from flask import Response, request
+from werkzeug.datastructures import ETags
+from werkzeug.http import http_date, quote_etag
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def as_utc(value: datetime) -> datetime:
+    """Normalize a datetime to UTC, treating naive values as UTC already.
+
+    SQLite returns naive UTC values; aware values are converted.
+    """
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def task_etag(task_id: int, updated_at: datetime) -> str:
+    """Build the strong ETag (unquoted) of a single task.
+
+    Args:
+        task_id: Task ID
+        updated_at: Task's last update timestamp
+
+    Returns:
+        ETag value
+    """
+    micros = (as_utc(updated_at) - _EPOCH) // timedelta(microseconds=1)
+    return f"t{task_id}.{micros}"
+
+
+def parse_task_etag(etag: str) -> Optional[Tuple[int, datetime]]:
+    """Decode a task ETag built by :func:`task_etag`.
+
+    Args:
+        etag: Unquoted ETag value
+
+    Returns:
+        Tuple of (task id, updated_at), or None if the tag is not a task ETag
+    """
+    if not etag.startswith("t"):
+        return None
+    task_id, _, micros = etag[1:].partition(".")
+    if not (task_id.isdigit() and micros.isdigit()):
+        return None
+    return int(task_id), _EPOCH + timedelta(microseconds=int(micros))
+
+
+def collection_etag(
+    version: int, last_modified: Optional[datetime], count: int, variant: str
+) -> str:
+    """Build the strong ETag (unquoted) of a task collection response.
+
+    Args:
+        version: Current data version
+        last_modified: Newest ``updated_at`` in the table (None if empty)
+        count: Number of tasks in the table
+        variant: Normalized query parameters of the request
+
+    Returns:
+        ETag value
+    """
+    stamp = as_utc(last_modified).isoformat() if last_modified else "-"
+    raw = f"{version}|{stamp}|{count}|{variant}"
+    return "c" + hashlib.sha1(raw.encode()).hexdigest()[:20]
+
+
+def is_not_modified(etag: str, last_modified: Optional[datetime]) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since for the current request.
+
+    Args:
+        etag: Current ETag of the resource
+        last_modified: Current modification time of the resource
+
+    Returns:
+        True if a 304 Not Modified response should be sent
+    """
+    return evaluate_not_modified(
+        request.if_none_match, request.if_modified_since, etag, last_modified
+    )
+
+
+def evaluate_not_modified(
+    if_none_match: ETags,
+    if_modified_since: Optional[datetime],
+    etag: str,
+    last_modified: Optional[datetime],
+) -> bool:
+    """Evaluate parsed If-None-Match / If-Modified-Since headers.
+
+    If-Modified-Since is only consulted when If-None-Match is absent
+    (RFC 9110, section 13.2.2).
+
+    Args:
+        if_none_match: Parsed If-None-Match header (may be empty)
+        if_modified_since: Parsed If-Modified-Since header, or None
+        etag: Current ETag of the resource
+        last_modified: Current modification time of the resource
+
+    Returns:
+        True if a 304 Not Modified response should be sent
+    """
+    if if_none_match:
+        return if_none_match.contains_weak(etag)
+    if if_modified_since and last_modified is not None:
+        # HTTP dates have one-second resolution
+        current = as_utc(last_modified).replace(microsecond=0)
+        return current <= if_modified_since
+    return False
+
+
+def if_match_versions(task_id: int) -> Optional[List[datetime]]:
+    """Extract the ``updated_at`` values the current request's If-Match accepts.
+
+    Args:
+        task_id: ID of the task being modified
+
+    Returns:
+        See :func:`accepted_versions`
+    """
+    return accepted_versions(request.if_match, task_id)
+
+
+def accepted_versions(if_match: ETags, task_id: int) -> Optional[List[datetime]]:
+    """Extract the ``updated_at`` values a parsed If-Match header accepts.
+
+    Args:
+        if_match: Parsed If-Match header (may be empty)
+        task_id: ID of the task being modified
+
+    Returns:
+        None when there is no precondition (header absent or ``*``),
+        otherwise the accepted timestamps (possibly empty, which can
+        never match)
+    """
+    if not if_match or if_match.star_tag:
+        return None
+    accepted = []
+    for etag in if_match.as_set():
+        parsed = parse_task_etag(etag)
+        if parsed is not None and parsed[0] == task_id:
+            accepted.append(parsed[1])
+    return accepted
+
+
+def not_modified(etag: str, last_modified: Optional[datetime]) -> Response:
+    """Build an empty 304 response carrying the validators."""
+    response = Response(status=304)
+    return with_validators(response, etag, last_modified)
+
+
+def with_validators(
+    response: Response, etag: str, last_modified: Optional[datetime]
+) -> Response:
+    """Attach ETag and Last-Modified headers to a response.
+
+    Args:
+        response: Response to decorate
+        etag: Unquoted ETag value
+        last_modified: Modification time (omitted when None)
+
+    Returns:
+        The same response
+    """
+    response.headers.update(validator_headers(etag, last_modified))
+    return response
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime]) -> Dict[str, str]:
+    """Render the ETag and Last-Modified header values.
+
+    Args:
+        etag: Unquoted ETag value
+        last_modified: Modification time (omitted when None)
+
+    Returns:
+        Header name to value mapping
+    """
+    headers = {"ETag": quote_etag(etag)}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(as_utc(last_modified).replace(microsecond=0))
+    return headers
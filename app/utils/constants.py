@@ -1,25 +1,72 @@
 """Constants for the application."""
+from typing import Final
 
-# Database and timing
-DUPLICATE_CHECK_WINDOW_SECONDS = 2  # Deduplication window for task creation
+# Pagination
+DEFAULT_PAGE_SIZE = 100  # Tasks returned per page when no limit is given
+MAX_PAGE_SIZE = 500  # Hard upper bound on the page size a client may request
+DEFAULT_TASK_SORT: Final = "-created_at"  # Newest first; "-" prefix means descending
+
+# Search
+MAX_SEARCH_QUERY_LENGTH = 200  # Longest accepted ?q= search string
+SEARCH_TITLE_WEIGHT = 10.0  # Relative weight of title matches in SQLite bm25 ranking
+
+# Export
+EXPORT_CHUNK_SIZE = 1000  # Rows fetched from the server-side cursor per round-trip
+
+# Batch operations
+MAX_BATCH_SIZE = 10000  # Maximum number of tasks accepted by POST /tasks/batch
+
+# Idempotency keys
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+IDEMPOTENT_REPLAYED_HEADER = "Idempotent-Replayed"  # "true" on a replayed response
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+IDEMPOTENCY_LEASE_SECONDS = 60  # How long an unfinished attempt holds a shared key
 
 # HTTP Status Codes (defined as constants for clarity)
 HTTP_OK = 200
 HTTP_CREATED = 201
 HTTP_NO_CONTENT = 204
+HTTP_NOT_MODIFIED = 304
 HTTP_BAD_REQUEST = 400
+HTTP_UNAUTHORIZED = 401
 HTTP_NOT_FOUND = 404
+HTTP_METHOD_NOT_ALLOWED = 405
+HTTP_CONFLICT = 409
+HTTP_GONE = 410
+HTTP_PRECONDITION_FAILED = 412
 HTTP_UNPROCESSABLE_ENTITY = 422
 HTTP_INTERNAL_SERVER_ERROR = 500
+HTTP_SERVICE_UNAVAILABLE = 503
 
 # API Endpoints
 API_PREFIX = "/api/v1"
 ENDPOINT_TASKS = "/tasks"
 ENDPOINT_TASKS_ID = "/tasks/<id>"
+ENDPOINT_TASKS_BATCH = "/tasks/batch"
+ENDPOINT_TASKS_EXPORT = "/tasks/export"
+ENDPOINT_TASKS_CHANGES = "/tasks/changes"
+ENDPOINT_TASKS_STREAM = "/tasks/stream"
+ENDPOINT_TASKS_STATS = "/tasks/stats"
 ENDPOINT_HEALTH = "/health"
 ENDPOINT_METRICS = "/metrics"
+ENDPOINT_ADMIN_PROFILES = "/admin/profiles"
 
 # Error Messages
 ERR_TASK_NOT_FOUND = "Task not found"
 ERR_VALIDATION_FAILED = "Validation failed"
+ERR_INVALID_CURSOR = "Invalid pagination cursor"
+ERR_CURSOR_MISMATCH = "Pagination cursor was issued for another sort or filter"
+ERR_INVALID_SYNC_TOKEN = "Invalid sync token"
+ERR_SYNC_TOKEN_EXPIRED = "Sync token expired; resync without 'since'"
+ERR_SEARCH_WITH_CURSOR = "Search results are not paginated; drop the cursor"
+ERR_PRECONDITION_FAILED = "Task was modified since the given ETag"
+ERR_TOO_MANY_STREAMS = "Too many open event streams, retry later"
+ERR_STREAMS_UNAVAILABLE = "Event streams need threaded workers (gunicorn --threads)"
+ERR_UNAUTHORIZED = "Missing or invalid admin token"
+ERR_PROFILE_NOT_FOUND = "Profile not found"
+ERR_INVALID_JSON = "Request body is not valid JSON"
+ERR_METHOD_NOT_ALLOWED = "Method not allowed"
+ERR_INVALID_IDEMPOTENCY_KEY = "Idempotency-Key must be 1 to 255 characters"
+ERR_IDEMPOTENCY_KEY_REUSED = "Idempotency-Key was already used for a different request"
+ERR_IDEMPOTENCY_IN_PROGRESS = "A request with this Idempotency-Key is still in progress"
 ERR_INTERNAL_ERROR = "Internal server error"
@@ -0,0 +1,135 @@
+"""Connection pool profiles and pool metrics.
+
+:func:`engine_options` turns the DB_POOL_* settings into SQLAlchemy
+engine options: pool sizing from a named profile (config/settings.py),
+pessimistic (pre-ping) or optimistic disconnect handling, and a pool
+class that reports how long requests wait for a connection and how full
+the pool is:
+
+- ``todo_api_db_pool_wait_seconds``: time to check a connection out,
+  including a pre-ping or a new connection when the pool grows
+- ``todo_api_db_pool_timeouts``: checkouts that gave up after
+  ``pool_timeout``
+- ``todo_api_db_pool_in_use`` / ``todo_api_db_pool_capacity``: checked
+  out connections and ``pool_size + max_overflow``, summed over workers
+- ``todo_api_db_pool_saturation``: in use / capacity of the busiest worker
+"""
+import time
+from typing import Any, Dict, Mapping
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+
+from config.settings import pool_profile
+
+POOL_WAIT = Histogram(
+    "todo_api_db_pool_wait_seconds",
+    "Time spent checking a connection out of the pool in seconds",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0),
+)
+POOL_TIMEOUTS = Counter(
+    "todo_api_db_pool_timeouts", "Checkouts that timed out waiting for a connection"
+)
+POOL_IN_USE = Gauge(
+    "todo_api_db_pool_in_use", "Connections checked out", multiprocess_mode="livesum"
+)
+POOL_CAPACITY = Gauge(
+    "todo_api_db_pool_capacity", "Pool size plus max overflow", multiprocess_mode="livesum"
+)
+POOL_SATURATION = Gauge(
+    "todo_api_db_pool_saturation",
+    "Connections checked out as a fraction of capacity",
+    multiprocess_mode="livemax",
+)
+
+DISCONNECT_HANDLING = ("pessimistic", "optimistic")
+
+
+class _InstrumentedPoolMixin:
+    """Records checkout wait time and occupancy of a QueuePool."""
+
+    def connect(self) -> Any:
+        start = time.perf_counter()
+        try:
+            return super().connect()  # type: ignore[misc]
+        except exc.TimeoutError:
+            POOL_TIMEOUTS.inc()
+            raise
+        finally:
+            POOL_WAIT.observe(time.perf_counter() - start)
+            self._report_usage()
+
+    def _return_conn(self, record: Any) -> None:
+        super()._return_conn(record)  # type: ignore[misc]
+        self._report_usage()
+
+    def _report_usage(self) -> None:
+        in_use = self.checkedout()  # type: ignore[attr-defined]
+        capacity = self.size() + max(self._max_overflow, 0)  # type: ignore[attr-defined]
+        POOL_IN_USE.set(in_use)
+        POOL_CAPACITY.set(capacity)
+        POOL_SATURATION.set(in_use / capacity if capacity else 0.0)
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """QueuePool exporting the pool metrics."""
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool exporting the pool metrics."""
+
+
+def engine_options(
+    settings: Mapping[str, Any], uri: str, asynchronous: bool = False
+) -> Dict[str, Any]:
+    """Build the pool-related engine options for the configured profile.
+
+    Args:
+        settings: Application configuration (DB_POOL_* settings)
+        uri: Database URI the engine connects to
+        asynchronous: Options for the async engine of asgi.py, which
+            uses the ``async`` profile unless ``serverless`` is chosen
+
+    Returns:
+        Engine options (empty when no profile applies, e.g. for an
+        in-memory SQLite database, which must stay on one connection)
+
+    Raises:
+        ValueError: If the profile or disconnect handling is unknown
+    """
+    profile = settings.get("DB_POOL_PROFILE") or ""
+    concurrency = settings.get("DB_POOL_CONCURRENCY", 4)
+    if asynchronous and profile != "serverless":
+        profile, concurrency = "async", settings.get("ASYNC_DB_POOL_SIZE", 5)
+    if not profile or ":memory:" in uri:
+        return {}
+    handling = settings.get("DB_DISCONNECT_HANDLING") or "pessimistic"
+    if handling not in DISCONNECT_HANDLING:
+        raise ValueError(
+            f"Unknown DB_DISCONNECT_HANDLING {handling!r}; "
+            f"choose from {', '.join(DISCONNECT_HANDLING)}"
+        )
+
+    sizing = pool_profile(profile, concurrency)
+    for key, option in (
+        ("DB_POOL_SIZE", "pool_size"),
+        ("DB_POOL_MAX_OVERFLOW", "max_overflow"),
+        ("DB_POOL_TIMEOUT", "pool_timeout"),
+    ):
+        if settings.get(key) is not None:
+            sizing[option] = settings[key]
+
+    options: Dict[str, Any] = {
+        "pool_pre_ping": handling == "pessimistic",
+        "pool_recycle": settings.get("DB_POOL_RECYCLE", 300),
+    }
+    if sizing["pool_size"] == 0:
+        options["poolclass"] = NullPool
+        return options
+    if settings.get("METRICS_ENABLED", True):
+        options["poolclass"] = InstrumentedAsyncQueuePool if asynchronous else InstrumentedQueuePool
+    else:
+        options["poolclass"] = AsyncAdaptedQueuePool if asynchronous else QueuePool
+    options.update(sizing)
+    return options
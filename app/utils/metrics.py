@@ -0,0 +1,132 @@
+"""Prometheus request metrics, aggregated across gunicorn workers.
+
+Every request is recorded by app-level hooks into the ``todo_api_*``
+series used by the Grafana dashboard (docs/monitoring). Label children
+are bound once per (method, endpoint, status) and reused, so the hot path
+is a dict lookup plus the increments.
+
+With several worker processes each one has its own in-memory registry,
+so a scrape would only see the worker that happened to answer it. When
+``PROMETHEUS_MULTIPROC_DIR`` is set (see deployment/gunicorn.conf.py)
+prometheus_client writes samples to per-process files in that directory
+and :func:`collect_metrics` merges all of them.
+"""
+import os
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from flask import Flask, Response, g, request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+
+REQUEST_COUNT = Counter(
+    "todo_api_request_count",
+    "Total number of requests",
+    ["method", "endpoint", "http_status"],
+)
+REQUEST_LATENCY = Histogram(
+    "todo_api_request_latency_seconds",
+    "Request latency in seconds",
+    ["method", "endpoint"],
+)
+ERROR_COUNT = Counter(
+    "todo_api_error_count",
+    "Total number of errors",
+    ["method", "endpoint", "http_status"],
+)
+
+# Label values are bounded: unknown methods and unrouted paths collapse
+# into one series each instead of one per client-chosen string
+_KNOWN_METHODS = frozenset(
+    {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+)
+_OTHER_METHOD = "OTHER"
+_UNMATCHED_ENDPOINT = "<unmatched>"
+
+
+class RequestRecorder:
+    """Records request metrics through cached, pre-bound label children."""
+
+    def __init__(self) -> None:
+        # (method, endpoint, status) -> (count, latency, errors or None)
+        self._children: Dict[Tuple[str, str, int], Tuple[Any, ...]] = {}
+
+    def record(self, method: str, endpoint: str, status: int, seconds: float) -> None:
+        """Count one request and observe its latency.
+
+        Args:
+            method: HTTP method
+            endpoint: URL rule that matched the request
+            status: Response status code
+            seconds: Time spent handling the request
+        """
+        key = (method, endpoint, status)
+        children = self._children.get(key)
+        if children is None:
+            # Racing threads may both bind; labels() returns the same child
+            children = (
+                REQUEST_COUNT.labels(method, endpoint, status),
+                REQUEST_LATENCY.labels(method, endpoint),
+                ERROR_COUNT.labels(method, endpoint, status) if status >= 400 else None,
+            )
+            self._children[key] = children
+        count, latency, errors = children
+        count.inc()
+        latency.observe(seconds)
+        if errors is not None:
+            errors.inc()
+
+
+def multiprocess_dir() -> Optional[str]:
+    """Directory shared by worker processes, or None in single-process mode."""
+    return os.environ.get("PROMETHEUS_MULTIPROC_DIR") or None
+
+
+def collect_metrics() -> bytes:
+    """Render every metric in the Prometheus text format.
+
+    Returns:
+        Samples of all worker processes in multiprocess mode, otherwise
+        those of the current process
+    """
+    if multiprocess_dir():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest(REGISTRY)
+
+
+def metrics_response() -> Response:
+    """Build the response for the metrics scrape endpoint."""
+    return Response(collect_metrics(), mimetype=CONTENT_TYPE_LATEST)
+
+
+def init_metrics(app: Flask) -> None:
+    """Record every request of ``app`` (unless METRICS_ENABLED is off).
+
+    Args:
+        app: Flask application instance
+    """
+    if not app.config.get("METRICS_ENABLED", True):
+        return
+    recorder = RequestRecorder()
+    app.extensions["request_metrics"] = recorder
+
+    @app.before_request
+    def _start_timer() -> None:
+        g.metrics_start = time.perf_counter()
+
+    @app.after_request
+    def _record_request(response: Response) -> Response:
+        start = g.pop("metrics_start", None)
+        if start is not None:
+            method = request.method if request.method in _KNOWN_METHODS else _OTHER_METHOD
+            rule = request.url_rule
+            endpoint = rule.rule if rule is not None else _UNMATCHED_ENDPOINT
+            recorder.record(
+                method, endpoint, response.status_code, time.perf_counter() - start
+            )
+        return response
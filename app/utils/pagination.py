@@ -0,0 +1,144 @@
+"""Keyset (cursor) pagination helpers.
+
+Cursors are opaque to clients: a URL-safe base64 encoding of the sort
+key of the last row on the previous page, plus a scope naming the sort
+and filter it was issued for. Seeking past that key keeps the cost of
+every page constant, no matter how deep the client pages.
+Sync tokens for the change feed use the same encoding.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from app.utils.constants import (
+    ERR_CURSOR_MISMATCH, ERR_INVALID_CURSOR, ERR_INVALID_SYNC_TOKEN,
+)
+
+# Decoded cursor: (sort key value, task id)
+CursorKey = Tuple[datetime, int]
+# Decoded sync token: (last updated_at seen, last task id, last deletion log id)
+SyncToken = Tuple[Optional[datetime], int, int]
+
+
+def _encode(values: list) -> str:
+    raw = json.dumps(values, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode(token: str) -> Any:
+    padded = token + "=" * (-len(token) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode()))
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def encode_cursor(value: datetime, task_id: int, scope: str = "") -> str:
+    """Encode a sort key into an opaque cursor string.
+
+    Args:
+        value: Sort column value of the last row on the page
+        task_id: ID of the last row on the page (tie-breaker)
+        scope: Sort and filter the cursor is valid for
+
+    Returns:
+        URL-safe cursor string
+    """
+    return _encode([value.isoformat(), task_id, scope])
+
+
+def decode_cursor(cursor: str, scope: Optional[str] = None) -> CursorKey:
+    """Decode a cursor produced by :func:`encode_cursor`.
+
+    Args:
+        cursor: Cursor string received from the client
+        scope: Scope the cursor must have been issued for; None skips
+            the check
+
+    Returns:
+        Tuple of (sort key value, task id)
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another
+            scope
+    """
+    try:
+        value, task_id, cursor_scope = _decode(cursor)
+        if not (_is_int(task_id) and isinstance(cursor_scope, str)):
+            raise ValueError(ERR_INVALID_CURSOR)
+        key = datetime.fromisoformat(value), task_id
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError(ERR_INVALID_CURSOR) from e
+    if scope is not None and cursor_scope != scope:
+        raise ValueError(ERR_CURSOR_MISMATCH)
+    return key
+
+
+def encode_sync_token(position: SyncToken, issued_at: datetime) -> str:
+    """Encode a change-feed position into an opaque sync token.
+
+    Args:
+        position: (updated_at of the last task change delivered or None,
+            ID of that task, log position of the last tombstone delivered)
+        issued_at: When the token is handed out, so tokens that outlived
+            the deletion log retention can be refused
+
+    Returns:
+        URL-safe sync token string
+    """
+    updated_at, task_id, deletion_id = position
+    stamp = updated_at.isoformat() if updated_at is not None else None
+    return _encode([stamp, task_id, deletion_id, issued_at.isoformat()])
+
+
+def decode_sync_token(token: str) -> Tuple[SyncToken, Optional[datetime]]:
+    """Decode a sync token produced by :func:`encode_sync_token`.
+
+    Args:
+        token: Sync token received from the client
+
+    Returns:
+        Tuple of ((updated_at or None, task id, deletion log id), issue
+        time or None for tokens of releases that did not record it)
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        values = _decode(token)
+        if len(values) not in (3, 4):
+            raise ValueError(ERR_INVALID_SYNC_TOKEN)
+        stamp, task_id, deletion_id = values[:3]
+        if not (_is_int(task_id) and _is_int(deletion_id)):
+            raise ValueError(ERR_INVALID_SYNC_TOKEN)
+        updated_at = datetime.fromisoformat(stamp) if stamp is not None else None
+        issued_at = datetime.fromisoformat(values[3]) if len(values) == 4 else None
+        return (updated_at, task_id, deletion_id), issued_at
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError(ERR_INVALID_SYNC_TOKEN) from e
+
+
+def split_page(
+    rows: Sequence[Any], limit: int, key: Callable[[Any], CursorKey], scope: str = ""
+) -> Tuple[List[Any], Optional[str]]:
+    """Trim an over-fetched result set to a page and build the next cursor.
+
+    Callers fetch ``limit + 1`` rows; the extra row only signals that
+    another page exists and is never returned.
+
+    Args:
+        rows: Rows fetched with a limit of ``limit + 1``
+        limit: Requested page size
+        key: Function returning the cursor key of a row
+        scope: Sort and filter of the listing, stored in the cursor
+
+    Returns:
+        Tuple of (page rows, next cursor or None on the last page)
+    """
+    page = list(rows[:limit])
+    if len(rows) <= limit or not page:
+        return page, None
+    return page, encode_cursor(*key(page[-1]), scope)
@@ -0,0 +1,226 @@
+"""Sampled cProfile profiling of live requests.
+
+Disabled by default; with PROFILING_ENABLED off no hook is registered, so
+requests pay nothing. When enabled, a request is profiled if it wins the
+PROFILING_SAMPLE_RATE draw or carries a valid signed ``X-Profile-Request``
+header (see :func:`sign_profile_request` and ``flask tasks profile-token``),
+which lets an operator profile one slow call on demand.
+
+Profiles are written as pstats files (``python -m pstats``, snakeviz,
+flameprof) to PROFILING_DIR, which is capped at PROFILING_MAX_FILES by
+deleting the oldest files, and are listed by the admin endpoints in
+app/api/admin.py.
+"""
+import cProfile
+import hashlib
+import hmac
+import io
+import os
+import pstats
+import random
+import re
+import time
+from typing import Any, Dict, List, Optional
+
+from flask import Flask, current_app, g, request
+
+PROFILE_HEADER = "X-Profile-Request"
+PROFILE_SUFFIX = ".prof"
+
+# <epoch ms>_<method>_<duration ms>_<endpoint slug>.prof
+_NAME_PATTERN = re.compile(r"^(\d+)_([A-Z]+)_(\d+)_([\w.-]*)\.prof$")
+_SLUG_UNSAFE = re.compile(r"[^\w.-]+")
+
+
+def sign_profile_request(secret: str, expires: int) -> str:
+    """Build an ``X-Profile-Request`` header value.
+
+    Args:
+        secret: PROFILING_SECRET of the target deployment
+        expires: Unix time after which the header is rejected
+
+    Returns:
+        Header value of the form ``<expires>.<hex HMAC-SHA256>``
+    """
+    digest = hmac.new(secret.encode(), str(expires).encode(), hashlib.sha256)
+    return f"{expires}.{digest.hexdigest()}"
+
+
+def verify_profile_request(secret: str, value: str) -> bool:
+    """Check a header value built by :func:`sign_profile_request`.
+
+    Args:
+        secret: PROFILING_SECRET of this deployment
+        value: Header value received from the client
+
+    Returns:
+        True if the signature matches and has not expired
+    """
+    expires, _, _ = value.partition(".")
+    if not expires.isdigit() or int(expires) < time.time():
+        return False
+    expected = sign_profile_request(secret, int(expires))
+    return hmac.compare_digest(expected, value)
+
+
+class RequestProfiler:
+    """Decides which requests to profile and stores their profiles.
+
+    Args:
+        directory: Where profile files are written
+        max_files: Number of profiles kept; older ones are deleted
+        sample_rate: Fraction of requests profiled at random (0 to 1)
+        secret: Key for signed profiling headers (empty disables them)
+    """
+
+    def __init__(
+        self, directory: str, max_files: int = 100, sample_rate: float = 0.0,
+        secret: str = "",
+    ) -> None:
+        self.directory = directory
+        self.max_files = max_files
+        self.sample_rate = sample_rate
+        self.secret = secret
+        os.makedirs(directory, exist_ok=True)
+
+    def wants(self, header: Optional[str]) -> bool:
+        """Whether to profile a request carrying ``header`` (may be None)."""
+        if header and self.secret and verify_profile_request(self.secret, header):
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def save(self, profile: cProfile.Profile, method: str, endpoint: str, seconds: float) -> str:
+        """Write a finished profile and rotate the directory.
+
+        Args:
+            profile: Disabled profiler of one request
+            method: HTTP method of the request
+            endpoint: URL rule (or path) of the request
+            seconds: Time the request was profiled for
+
+        Returns:
+            File name of the stored profile
+        """
+        slug = _SLUG_UNSAFE.sub("-", endpoint).strip("-")[:80]
+        name = (
+            f"{time.time_ns() // 1_000_000}_{method}_{round(seconds * 1000)}_{slug}"
+            f"{PROFILE_SUFFIX}"
+        )
+        profile.dump_stats(os.path.join(self.directory, name))
+        self._rotate()
+        return name
+
+    def _names(self) -> List[str]:
+        """Stored profile names, oldest first."""
+        names = [n for n in os.listdir(self.directory) if _NAME_PATTERN.match(n)]
+        return sorted(names, key=lambda n: int(n.split("_", 1)[0]))
+
+    def _rotate(self) -> None:
+        names = self._names()
+        for name in names[: max(len(names) - self.max_files, 0)]:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass  # Another worker rotated it first
+
+    def recent(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Describe the newest stored profiles, newest first.
+
+        Args:
+            limit: Maximum number of profiles returned
+
+        Returns:
+            One dict per profile (name, created_ms, method, duration_ms,
+            endpoint, size)
+        """
+        profiles = []
+        for name in reversed(self._names()[-limit:]):
+            match = _NAME_PATTERN.match(name)
+            if match is None:  # _names() only lists matching files
+                continue
+            created, method, duration, slug = match.groups()
+            try:
+                size = os.path.getsize(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            profiles.append({
+                "name": name,
+                "created_ms": int(created),
+                "method": method,
+                "duration_ms": int(duration),
+                "endpoint": slug,
+                "size": size,
+            })
+        return profiles
+
+    def path(self, name: str) -> Optional[str]:
+        """Absolute path of a stored profile, or None for unknown names."""
+        if not _NAME_PATTERN.match(name):
+            return None
+        path = os.path.join(self.directory, name)
+        return path if os.path.isfile(path) else None
+
+    def summary(self, name: str, limit: int = 40) -> Optional[str]:
+        """Render the top functions of a profile by cumulative time.
+
+        Args:
+            name: Stored profile name
+            limit: Number of functions listed
+
+        Returns:
+            pstats text report, or None for unknown names
+        """
+        path = self.path(name)
+        if path is None:
+            return None
+        output = io.StringIO()
+        stats = pstats.Stats(path, stream=output)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+        return output.getvalue()
+
+
+def init_profiling(app: Flask) -> None:
+    """Profile sampled requests of ``app`` (only when PROFILING_ENABLED).
+
+    Args:
+        app: Flask application instance
+    """
+    if not app.config.get("PROFILING_ENABLED"):
+        return
+    profiler = RequestProfiler(
+        directory=app.config["PROFILING_DIR"],
+        max_files=app.config.get("PROFILING_MAX_FILES", 100),
+        sample_rate=app.config.get("PROFILING_SAMPLE_RATE", 0.0),
+        secret=app.config.get("PROFILING_SECRET", ""),
+    )
+    app.extensions["request_profiler"] = profiler
+
+    @app.before_request
+    def _start_profile() -> None:
+        if not profiler.wants(request.headers.get(PROFILE_HEADER)):
+            return
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            return  # Another profiler is active on this thread
+        g.profile = (profile, time.perf_counter())
+
+    @app.teardown_request
+    def _save_profile(exc: Optional[BaseException]) -> None:
+        started = g.pop("profile", None)
+        if started is None:
+            return
+        profile, start = started
+        profile.disable()
+        rule = request.url_rule
+        endpoint = rule.rule if rule is not None else request.path
+        try:
+            profiler.save(profile, request.method, endpoint, time.perf_counter() - start)
+        except OSError:
+            current_app.logger.exception("Could not write request profile")
+
+
+def get_request_profiler() -> Optional[RequestProfiler]:
+    """Return the profiler of the current application (None if disabled)."""
+    return current_app.extensions.get("request_profiler")
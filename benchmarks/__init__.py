@@ -0,0 +1 @@
+"""Performance benchmarks for the task API (not collected by pytest)."""
@@ -0,0 +1,428 @@
+"""Latency and throughput of every task API route, with a regression check.
+
+For each dataset size the suite seeds a fresh database, then replays a
+fixed request mix against every route in app/api/tasks.py, through the
+Flask test client (in-process, no network) and/or a real gunicorn
+process (HTTP over loopback, concurrent clients). Read routes run first,
+writes after, deletes last, so every size sees the same data.
+
+Results are written as JSON. Given ``--baseline``, each (target,
+database, rows, route) is compared with the baseline and the script
+exits with status 1 when p95 latency or throughput is worse by more than
+``--threshold``.
+
+Usage:
+    python -m benchmarks.bench_api --sizes 10000,100000,1000000
+    python -m benchmarks.bench_api --target gunicorn --concurrency 8
+    python -m benchmarks.bench_api --dsn postgresql://user:pw@localhost/bench
+    python -m benchmarks.bench_api --baseline benchmarks/baseline.json
+    python -m benchmarks.bench_api --compare results.json --baseline benchmarks/baseline.json
+"""
+import argparse
+import http.client
+import json
+import math
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from benchmarks.common import create_bench_app, seed_tasks, temp_sqlite_uri
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_OUTPUT = ROOT / "benchmarks" / "results" / "latest.json"
+
+
+class Route(NamedTuple):
+    """One benchmarked request shape.
+
+    ``path`` and ``body`` receive the request index and the seeded row
+    count; ``share`` scales the request count for expensive routes.
+    """
+
+    name: str
+    method: str
+    path: Callable[[int, int], str]
+    body: Optional[Callable[[int, int], Any]] = None
+    share: float = 1.0
+    stream: bool = False
+
+
+def _tail_ids(i: int, rows: int, offset: int, size: int = 1) -> List[int]:
+    """Distinct ids counted down from the end of the seeded range."""
+    start = rows - offset - i * size
+    return list(range(start, start - size, -1))
+
+
+ROUTES: List[Route] = [
+    Route("GET /health", "GET", lambda i, n: "/api/v1/health"),
+    Route("GET /tasks", "GET", lambda i, n: "/api/v1/tasks"),
+    Route(
+        "GET /tasks?completed&sort",
+        "GET",
+        lambda i, n: "/api/v1/tasks?completed=true&sort=updated_at&limit=50",
+    ),
+    Route("GET /tasks?q", "GET", lambda i, n: f"/api/v1/tasks?q=task%20{i * 7919 % n}"),
+    Route("GET /tasks?fields", "GET", lambda i, n: "/api/v1/tasks?fields=title,completed"),
+    Route("GET /tasks/changes", "GET", lambda i, n: "/api/v1/tasks/changes"),
+    Route("GET /tasks/stats", "GET", lambda i, n: "/api/v1/tasks/stats"),
+    Route("GET /tasks/stream", "GET", lambda i, n: "/api/v1/tasks/stream", share=0.05, stream=True),
+    Route("GET /tasks/export", "GET", lambda i, n: "/api/v1/tasks/export", share=0.01),
+    Route("GET /tasks/<id>", "GET", lambda i, n: f"/api/v1/tasks/{i * 7919 % n + 1}"),
+    Route("GET /metrics", "GET", lambda i, n: "/api/v1/metrics", share=0.1),
+    Route(
+        "POST /tasks", "POST", lambda i, n: "/api/v1/tasks",
+        lambda i, n: {"title": f"Bench task {time.time_ns()}"},
+    ),
+    Route(
+        "POST /tasks/batch", "POST", lambda i, n: "/api/v1/tasks/batch",
+        lambda i, n: {"tasks": [{"title": f"Bench batch {time.time_ns()} {k}"} for k in range(100)]},
+        share=0.1,
+    ),
+    Route(
+        "PUT /tasks/<id>", "PUT", lambda i, n: f"/api/v1/tasks/{i * 7919 % n + 1}",
+        lambda i, n: {"title": f"Renamed {i}", "completed": i % 2 == 0},
+    ),
+    Route(
+        "PATCH /tasks", "PATCH", lambda i, n: "/api/v1/tasks",
+        lambda i, n: {"ids": [i * 7919 % n + 1 + k for k in range(10)],
+                      "changes": {"completed": i % 2 == 0}},
+    ),
+    Route(
+        "DELETE /tasks/<id>", "DELETE",
+        lambda i, n: f"/api/v1/tasks/{_tail_ids(i, n, 0)[0]}",
+    ),
+    Route(
+        "DELETE /tasks", "DELETE", lambda i, n: "/api/v1/tasks",
+        lambda i, n: {"ids": _tail_ids(i, n, n // 2, size=5)},
+    ),
+]
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted samples."""
+    if not samples:
+        return 0.0
+    return samples[max(math.ceil(pct / 100 * len(samples)) - 1, 0)]
+
+
+def summarize(route: str, latencies: List[float], errors: int, wall: float) -> Dict[str, Any]:
+    """Reduce raw latencies (seconds) to the stored result record."""
+    latencies = sorted(latencies)
+    return {
+        "route": route,
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / wall, 1) if wall else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+def measure(
+    route: Route, replay: Callable[[Route, int], Tuple[List[float], int, float]],
+    requests: int, rounds: int,
+) -> Dict[str, Any]:
+    """Warm a route up, replay it ``rounds`` times and keep the median round.
+
+    Args:
+        route: Route to measure
+        replay: Sends ``count`` requests; returns (latencies, errors, wall seconds)
+        requests: Requests per round before the route's share is applied
+        rounds: Measured rounds; medians damp noise from the host
+
+    Returns:
+        Result record of the route
+    """
+    count = max(int(requests * route.share), 3)
+    replay(route, min(count, 5))
+    summaries = [summarize(route.name, *replay(route, count)) for _ in range(rounds)]
+    result = dict(summaries[0])
+    for field in ("throughput_rps", "p50_ms", "p95_ms", "p99_ms"):
+        result[field] = statistics.median(summary[field] for summary in summaries)
+    result["requests"] = sum(summary["requests"] for summary in summaries)
+    result["errors"] = sum(summary["errors"] for summary in summaries)
+    return result
+
+
+# --- Flask test client -------------------------------------------------------
+
+def run_test_client(app, rows: int, requests: int, rounds: int) -> List[Dict[str, Any]]:
+    """Replay every route sequentially through the Flask test client."""
+    client = app.test_client()
+    issued = {route.name: 0 for route in ROUTES}
+
+    def replay(route: Route, count: int) -> Tuple[List[float], int, float]:
+        latencies, errors = [], 0
+        wall_start = time.perf_counter()
+        for _ in range(count):
+            i = issued[route.name]
+            issued[route.name] += 1
+            body = route.body(i, rows) if route.body else None
+            start = time.perf_counter()
+            response = client.open(
+                route.path(i, rows), method=route.method, json=body, buffered=not route.stream
+            )
+            if route.stream:
+                next(response.response)  # Time to the first event
+                response.close()
+            latencies.append(time.perf_counter() - start)
+            errors += response.status_code >= 400
+        return latencies, errors, time.perf_counter() - wall_start
+
+    return [measure(route, replay, requests, rounds) for route in ROUTES]
+
+
+# --- gunicorn ------------------------------------------------------------------
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_gunicorn(
+    database_uri: str, workers: int, threads: int, settings: Optional[Dict[str, str]] = None
+) -> Tuple[subprocess.Popen, int]:
+    """Start the production entry point (run:app) against ``database_uri``.
+
+    ``settings`` are extra environment variables (configuration overrides).
+    """
+    port = _free_port()
+    env = dict(
+        os.environ,
+        FLASK_CONFIG="testing",
+        SQLALCHEMY_DATABASE_URI=database_uri,
+        PROMETHEUS_MULTIPROC_DIR=tempfile.mkdtemp(prefix="todo-bench-metrics-"),
+        # Abandoned event streams notice the closed socket on the next beat
+        TASK_EVENTS_HEARTBEAT_SECONDS="0.05",
+        **(settings or {}),
+    )
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "gunicorn", "-c", "deployment/gunicorn.conf.py",
+            "--workers", str(workers), "--threads", str(threads),
+            "--bind", f"127.0.0.1:{port}", "--log-level", "warning", "run:app",
+        ],
+        cwd=ROOT, env=env,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            connection.request("GET", "/api/v1/health")
+            if connection.getresponse().status == 200:
+                return process, port
+        except OSError:
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError("gunicorn did not become ready within 30s")
+
+
+def _http_call(connection: http.client.HTTPConnection, route: Route, i: int, rows: int) -> int:
+    body = route.body(i, rows) if route.body else None
+    headers = {"Content-Type": "application/json"} if body is not None else {}
+    connection.request(
+        route.method, route.path(i, rows),
+        body=json.dumps(body) if body is not None else None, headers=headers,
+    )
+    response = connection.getresponse()
+    if route.stream:
+        response.fp.readline()  # First event line, then hang up
+        connection.close()
+    else:
+        response.read()
+    return response.status
+
+
+def run_gunicorn(port: int, rows: int, requests: int, rounds: int, concurrency: int) -> List[Dict[str, Any]]:
+    """Replay every route with ``concurrency`` keep-alive HTTP clients."""
+    issued = {route.name: 0 for route in ROUTES}
+
+    def replay(route: Route, count: int) -> Tuple[List[float], int, float]:
+        first = issued[route.name]
+        issued[route.name] += count
+        lanes = min(concurrency, count)
+
+        def lane(offset: int) -> Tuple[List[float], int]:
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+            latencies, errors = [], 0
+            for i in range(first + offset, first + count, lanes):
+                start = time.perf_counter()
+                try:
+                    errors += _http_call(connection, route, i, rows) >= 400
+                except (OSError, http.client.HTTPException):
+                    errors += 1
+                    connection.close()
+                latencies.append(time.perf_counter() - start)
+            connection.close()
+            return latencies, errors
+
+        wall_start = time.perf_counter()
+        with ThreadPoolExecutor(lanes) as pool:
+            outcomes = list(pool.map(lane, range(lanes)))
+        wall = time.perf_counter() - wall_start
+        latencies = [sample for samples, _ in outcomes for sample in samples]
+        return latencies, sum(errors for _, errors in outcomes), wall
+
+    return [measure(route, replay, requests, rounds) for route in ROUTES]
+
+
+# --- Baseline comparison -------------------------------------------------------
+
+def _key(record: Dict[str, Any]) -> Tuple:
+    return record["target"], record["database"], record["rows"], record["route"]
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Print the change against a baseline and return the regressions.
+
+    A route regresses when its p95 latency grows, or its throughput
+    drops, by more than ``threshold`` (a fraction).
+    """
+    previous = {_key(record): record for record in baseline["results"]}
+    regressions = []
+    print(f"\n{'target/db/rows route':<52} {'p95 ms':>18} {'req/s':>20}")
+    for record in current["results"]:
+        old = previous.get(_key(record))
+        if old is None:
+            continue
+        p95_change = record["p95_ms"] / old["p95_ms"] - 1 if old["p95_ms"] else 0.0
+        rps_change = record["throughput_rps"] / old["throughput_rps"] - 1 if old["throughput_rps"] else 0.0
+        regressed = p95_change > threshold or rps_change < -threshold
+        label = f"{record['target']}/{record['database']}/{record['rows']} {record['route']}"
+        print(
+            f"{label:<52} {old['p95_ms']:>8.2f} {p95_change:>+8.0%} "
+            f"{old['throughput_rps']:>10.0f} {rps_change:>+8.0%}{'  REGRESSED' if regressed else ''}"
+        )
+        if regressed:
+            regressions.append(label)
+    return regressions
+
+
+# --- Driver ----------------------------------------------------------------------
+
+def _prepare(size: int, dsn: Optional[str], chunk_size: int):
+    """Create an app on a fresh database seeded with ``size`` tasks."""
+    uri = dsn or temp_sqlite_uri(f"bench-{size}.db")
+    app = create_bench_app(uri)
+    if dsn:
+        from app.extensions import db
+
+        with app.app_context():
+            db.drop_all()
+            db.create_all()
+    seed_tasks(app, size, chunk_size=chunk_size)
+    return app, uri
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+            text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run_suite(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run every requested (size, target) combination."""
+    database = "postgresql" if args.dsn else "sqlite"
+    records = []
+    for size in args.sizes:
+        for target in args.targets:
+            # Each target gets its own freshly seeded data set
+            print(f"Seeding {size:,} tasks into {database} for {target}...", flush=True)
+            app, uri = _prepare(size, args.dsn, args.chunk_size)
+            if target == "testclient":
+                results = run_test_client(app, size, args.requests, args.rounds)
+            else:
+                process, port = start_gunicorn(uri, args.workers, args.threads)
+                try:
+                    results = run_gunicorn(
+                        port, size, args.requests, args.rounds, args.concurrency
+                    )
+                finally:
+                    process.terminate()
+                    process.wait(timeout=30)
+            for result in results:
+                records.append({"target": target, "database": database, "rows": size, **result})
+                print(
+                    f"  {target:<10} {result['route']:<28} {result['throughput_rps']:>9,.0f} req/s "
+                    f"p50 {result['p50_ms']:>8.2f}  p95 {result['p95_ms']:>8.2f}  "
+                    f"p99 {result['p99_ms']:>8.2f} ms"
+                    + (f"  ({result['errors']} errors)" if result["errors"] else ""),
+                    flush=True,
+                )
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "requests": args.requests,
+            "rounds": args.rounds,
+            "concurrency": args.concurrency,
+            "workers": args.workers,
+            "threads": args.threads,
+        },
+        "results": records,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", default="10000",
+        type=lambda value: [int(size) for size in value.split(",")],
+        help="Comma-separated task counts to seed, e.g. 10000,100000,1000000",
+    )
+    parser.add_argument(
+        "--target", choices=("testclient", "gunicorn", "both"), default="both",
+        help="Drive the app in-process, over HTTP, or both",
+    )
+    parser.add_argument("--dsn", help="PostgreSQL URI to benchmark instead of SQLite (tables are recreated)")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per route (scaled down for heavy routes)")
+    parser.add_argument("--rounds", type=int, default=3, help="Measured rounds per route (median is kept)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent HTTP clients (gunicorn)")
+    parser.add_argument("--workers", type=int, default=2, help="gunicorn worker processes")
+    parser.add_argument("--threads", type=int, default=4, help="Threads per gunicorn worker")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="Rows per seeding transaction")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT), help="Where to write the JSON results")
+    parser.add_argument("--baseline", help="Results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Tolerated slowdown as a fraction")
+    parser.add_argument("--compare", metavar="RESULTS", help="Only compare an existing results file with --baseline")
+    args = parser.parse_args()
+    args.targets = ("testclient", "gunicorn") if args.target == "both" else (args.target,)
+
+    if args.compare:
+        if not args.baseline:
+            parser.error("--compare requires --baseline")
+        current = json.loads(Path(args.compare).read_text())
+    else:
+        current = run_suite(args)
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(current, indent=2) + "\n")
+        print(f"\nWrote {output}")
+
+    if args.baseline:
+        regressions = compare(current, json.loads(Path(args.baseline).read_text()), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} route(s) regressed by more than {args.threshold:.0%}")
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""gunicorn (WSGI, gthread) versus uvicorn (ASGI, async SQLAlchemy) under load.
+
+Seeds one database, then serves it with each server in turn: the current
+``create_app()`` entry point (``run:app`` under gunicorn with
+``--workers`` x ``--threads``, as in deployment/Dockerfile) and the ASGI
+entry point (``asgi:app`` under uvicorn with the same number of worker
+processes). For every concurrency level, that many keep-alive
+connections send a read-heavy request mix for ``--duration`` seconds.
+
+The client is a minimal asyncio HTTP/1.1 client, so 1000 connections
+cost one thread; it runs on the same host as the server, so compare the
+two servers with each other rather than with absolute numbers.
+
+Usage:
+    python -m benchmarks.bench_async
+    python -m benchmarks.bench_async --concurrency 100,1000 --duration 20
+    python -m benchmarks.bench_async --dsn postgresql://user:pw@localhost/bench
+"""
+import argparse
+import asyncio
+import http.client
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from benchmarks.bench_api import ROOT, _free_port, _prepare, percentile, start_gunicorn
+
+DEFAULT_OUTPUT = ROOT / "benchmarks" / "results" / "async.json"
+
+# (weight, method, path or path template, JSON body); {id} is a random task id
+MIX = [
+    (5, "GET", "/api/v1/tasks?limit=20", None),
+    (3, "GET", "/api/v1/tasks/{id}", None),
+    (1, "GET", "/api/v1/tasks/stats", None),
+    (1, "POST", "/api/v1/tasks", {"title": "Load test task {n}"}),
+]
+
+
+def start_uvicorn(database_uri: str, workers: int) -> Tuple[subprocess.Popen, int]:
+    """Start the ASGI entry point (asgi:app) against ``database_uri``."""
+    port = _free_port()
+    env = dict(os.environ, FLASK_CONFIG="testing", SQLALCHEMY_DATABASE_URI=database_uri)
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "asgi:app", "--workers", str(workers),
+            "--host", "127.0.0.1", "--port", str(port), "--backlog", "4096",
+            "--log-level", "warning", "--no-access-log",
+        ],
+        cwd=ROOT, env=env,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            connection.request("GET", "/api/v1/health")
+            if connection.getresponse().status == 200:
+                return process, port
+        except OSError:
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError("uvicorn did not become ready within 30s")
+
+
+async def _request(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+    method: str, path: str, body: Optional[bytes],
+) -> int:
+    """Send one keep-alive request and read the response; returns the status."""
+    head = f"{method} {path} HTTP/1.1\r\nHost: bench\r\n"
+    if body is not None:
+        head += f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+    writer.write(head.encode() + b"\r\n" + (body or b""))
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    if length:
+        await reader.readexactly(length)
+    return status
+
+
+async def load(
+    port: int, rows: int, concurrency: int, duration: float, mix: List[Tuple] = MIX
+) -> Dict[str, Any]:
+    """Run ``concurrency`` connections against ``mix`` for ``duration`` seconds."""
+    weights = [weight for weight, *_ in mix]
+    latencies: List[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def connection(lane: int) -> None:
+        nonlocal errors
+        rng = random.Random(lane)
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port, limit=2 ** 20)
+        except OSError:
+            errors += 1
+            return
+        n = 0
+        try:
+            while time.perf_counter() < deadline:
+                _, method, path, payload = rng.choices(mix, weights)[0]
+                path = path.format(id=rng.randint(1, rows))
+                body = None
+                if payload is not None:
+                    body = json.dumps({
+                        key: value.format(n=f"{lane}-{n}") for key, value in payload.items()
+                    }).encode()
+                n += 1
+                start = time.perf_counter()
+                status = await _request(reader, writer, method, path, body)
+                latencies.append(time.perf_counter() - start)
+                errors += status >= 400
+        except (OSError, asyncio.IncompleteReadError, ValueError, IndexError):
+            errors += 1
+        finally:
+            writer.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(connection(lane) for lane in range(concurrency)))
+    wall = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / wall, 1) if wall else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000, help="Tasks to seed")
+    parser.add_argument(
+        "--concurrency", default="100,250,500,1000",
+        type=lambda value: [int(level) for level in value.split(",")],
+        help="Comma-separated numbers of concurrent connections",
+    )
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per level")
+    parser.add_argument("--workers", type=int, default=2, help="Worker processes (both servers)")
+    parser.add_argument("--threads", type=int, default=4, help="Threads per gunicorn worker")
+    parser.add_argument("--dsn", help="PostgreSQL URI to benchmark instead of SQLite (tables are recreated)")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT), help="Where to write the JSON results")
+    args = parser.parse_args()
+
+    database = "postgresql" if args.dsn else "sqlite"
+    print(f"Seeding {args.rows:,} tasks into {database}...", flush=True)
+    _, uri = _prepare(args.rows, args.dsn, 10000)
+    servers = [
+        ("gunicorn-gthread", lambda: start_gunicorn(uri, args.workers, args.threads)),
+        ("uvicorn-asgi", lambda: start_uvicorn(uri, args.workers)),
+    ]
+    records = []
+    for server, start in servers:
+        process, port = start()
+        try:
+            for level in args.concurrency:
+                result = asyncio.run(load(port, args.rows, level, args.duration))
+                records.append({"server": server, "database": database, **result})
+                print(
+                    f"  {server:<17} {level:>5} conns {result['throughput_rps']:>9,.0f} req/s "
+                    f"p50 {result['p50_ms']:>8.2f}  p95 {result['p95_ms']:>8.2f}  "
+                    f"p99 {result['p99_ms']:>8.2f} ms"
+                    + (f"  ({result['errors']} errors)" if result["errors"] else ""),
+                    flush=True,
+                )
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        "meta": {
+            "rows": args.rows, "duration": args.duration,
+            "workers": args.workers, "threads": args.threads,
+        },
+        "results": records,
+    }, indent=2) + "\n")
+    print(f"\nWrote {output}")
+
+
+if __name__ == "__main__":
+    main()
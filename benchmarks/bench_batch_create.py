@@ -0,0 +1,51 @@
+"""Compare task creation throughput: POST /tasks vs POST /tasks/batch.
+
+Also reports the SQL statements of one batch request, which must not
+grow with the batch size (one executemany INSERT ... RETURNING).
+
+Usage:
+    python -m benchmarks.bench_batch_create --count 5000 --batch-size 1000
+"""
+import argparse
+
+from benchmarks.common import create_bench_app, rate, timer
+from app.extensions import db
+from app.utils.query_metrics import capture_queries
+
+
+def _payloads(prefix: str, count: int) -> list:
+    return [{"title": f"{prefix} {i}", "description": f"Description {i}"} for i in range(count)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=5000, help="Tasks created per path")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Items per batch request")
+    args = parser.parse_args()
+
+    app = create_bench_app()
+    client = app.test_client()
+
+    with timer() as single:
+        for payload in _payloads("single", args.count):
+            assert client.post("/api/v1/tasks", json=payload).status_code == 201
+
+    items = _payloads("batch", args.count)
+    with app.app_context():
+        engine = db.engine
+    with timer() as batch, capture_queries(engine) as statements:
+        for start in range(0, args.count, args.batch_size):
+            chunk = items[start:start + args.batch_size]
+            assert client.post("/api/v1/tasks/batch", json={"tasks": chunk}).status_code == 200
+    requests = -(-args.count // args.batch_size)
+
+    print(f"single-item path: {args.count} tasks in {single['seconds']:.2f}s "
+          f"({rate(args.count, single['seconds'])})")
+    print(f"batch path:       {args.count} tasks in {batch['seconds']:.2f}s "
+          f"({rate(args.count, batch['seconds'])}, batch size {args.batch_size})")
+    print(f"speedup:          {single['seconds'] / batch['seconds']:.1f}x")
+    print(f"statements:       {len(statements) / requests:.0f} per batch request")
+
+
+if __name__ == "__main__":
+    main()
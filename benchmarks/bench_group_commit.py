@@ -0,0 +1,82 @@
+"""Create throughput and latency with and without group commit.
+
+Serves a fresh database with gunicorn once per setting: group commit
+off, then on with each ``--delays`` value (TASK_GROUP_COMMIT_MAX_DELAY_MS).
+``--concurrency`` keep-alive connections send only ``POST /tasks`` for
+``--duration`` seconds. A group can only hold the creates one worker is
+handling at once, so the gain grows with ``--threads``.
+
+Usage:
+    python -m benchmarks.bench_group_commit
+    python -m benchmarks.bench_group_commit --delays 0,2,10 --threads 32 --concurrency 64
+    python -m benchmarks.bench_group_commit --dsn postgresql://user:pw@localhost/bench
+"""
+import argparse
+import asyncio
+import json
+from pathlib import Path
+
+from app.extensions import db
+from benchmarks.bench_api import ROOT, _prepare, start_gunicorn
+from benchmarks.bench_async import load
+
+DEFAULT_OUTPUT = ROOT / "benchmarks" / "results" / "group_commit.json"
+
+CREATE_ONLY = [(1, "POST", "/api/v1/tasks", {"title": "Grouped task {n}"})]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--delays", default="0,1,2,5,10",
+        type=lambda value: [float(delay) for delay in value.split(",")],
+        help="Comma-separated TASK_GROUP_COMMIT_MAX_DELAY_MS values to try",
+    )
+    parser.add_argument("--max-batch", type=int, default=100, help="TASK_GROUP_COMMIT_MAX_BATCH")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent connections")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per setting")
+    parser.add_argument("--workers", type=int, default=2, help="gunicorn worker processes")
+    parser.add_argument("--threads", type=int, default=16, help="Threads per gunicorn worker")
+    parser.add_argument("--dsn", help="PostgreSQL URI to benchmark instead of SQLite (tables are recreated)")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT), help="Where to write the JSON results")
+    args = parser.parse_args()
+
+    settings = [("off", {"TASK_GROUP_COMMIT_ENABLED": "0"})] + [
+        (
+            f"{delay:g} ms",
+            {
+                "TASK_GROUP_COMMIT_ENABLED": "1",
+                "TASK_GROUP_COMMIT_MAX_DELAY_MS": str(delay),
+                "TASK_GROUP_COMMIT_MAX_BATCH": str(args.max_batch),
+            },
+        )
+        for delay in args.delays
+    ]
+    records = []
+    for label, overrides in settings:
+        app, uri = _prepare(0, args.dsn, 10000)
+        with app.app_context():
+            db.engine.dispose()
+        process, port = start_gunicorn(uri, args.workers, args.threads, overrides)
+        try:
+            result = asyncio.run(load(port, 1, args.concurrency, args.duration, CREATE_ONLY))
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+        records.append({"group_commit": label, **result})
+        print(
+            f"  group commit {label:<7} {result['throughput_rps']:>8,.0f} creates/s "
+            f"p50 {result['p50_ms']:>8.2f}  p95 {result['p95_ms']:>8.2f}  "
+            f"p99 {result['p99_ms']:>8.2f} ms"
+            + (f"  ({result['errors']} errors)" if result["errors"] else ""),
+            flush=True,
+        )
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({"meta": vars(args), "results": records}, indent=2) + "\n")
+    print(f"\nWrote {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Measure the per-request cost of the request metrics hooks.
+
+Times requests to a trivial endpoint with METRICS_ENABLED on and off, and
+micro-benchmarks recording through ``labels()`` on every call against the
+pre-bound children RequestRecorder keeps. Run with
+PROMETHEUS_MULTIPROC_DIR set to include the cost of multiprocess mode
+(samples written to mmap'd files).
+
+Usage:
+    python -m benchmarks.bench_metrics --requests 20000
+    PROMETHEUS_MULTIPROC_DIR=$(mktemp -d) python -m benchmarks.bench_metrics
+"""
+import argparse
+import timeit
+
+from benchmarks.common import create_bench_app, timer
+from app.utils.metrics import REQUEST_COUNT, REQUEST_LATENCY, RequestRecorder
+from config.settings import TestingConfig
+
+
+def _request_seconds(enabled: bool, count: int) -> float:
+    """Average wall-clock seconds per GET /api/v1/ping."""
+    TestingConfig.METRICS_ENABLED = enabled
+    client = create_bench_app().test_client()
+    for _ in range(200):  # warm-up
+        client.get("/api/v1/ping")
+    with timer() as elapsed:
+        for _ in range(count):
+            client.get("/api/v1/ping")
+    return elapsed["seconds"] / count
+
+
+def _unbound_record() -> None:
+    REQUEST_COUNT.labels("GET", "/bench", 200).inc()
+    REQUEST_LATENCY.labels("GET", "/bench").observe(0.001)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000, help="Requests per run")
+    parser.add_argument("--calls", type=int, default=200000, help="Micro-benchmark calls")
+    args = parser.parse_args()
+
+    without = _request_seconds(False, args.requests)
+    with_metrics = _request_seconds(True, args.requests)
+    print(f"request without metrics  {without * 1e6:8.1f} us")
+    print(f"request with metrics     {with_metrics * 1e6:8.1f} us "
+          f"(+{(with_metrics - without) * 1e6:.1f} us)")
+
+    recorder = RequestRecorder()
+    bound = timeit.timeit(
+        lambda: recorder.record("GET", "/bench", 200, 0.001), number=args.calls
+    )
+    unbound = timeit.timeit(_unbound_record, number=args.calls)
+    print(f"record, pre-bound        {bound / args.calls * 1e6:8.2f} us")
+    print(f"record, labels() each    {unbound / args.calls * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
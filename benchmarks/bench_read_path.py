@@ -0,0 +1,63 @@
+"""Compare list/get throughput of the ORM read path and the fast path.
+
+The fast path (TASKS_FAST_READ_PATH) selects raw column tuples and encodes
+them with orjson (stdlib json when orjson is not installed) instead of
+hydrating Task objects and calling jsonify.
+
+Usage:
+    python -m benchmarks.bench_read_path --rows 20000 --page-size 500
+    python -m benchmarks.bench_read_path --fields id,title,completed
+"""
+import argparse
+from typing import Tuple
+
+from benchmarks.common import create_bench_app, rate, seed_tasks, timer
+from app.utils import serialization
+
+
+def _walk_pages(client, page_size: int, fields: str = "") -> Tuple[int, int]:
+    """Fetch every page of the task list; return (rows read, payload bytes)."""
+    total, size, cursor = 0, 0, None
+    base = f"/api/v1/tasks?limit={page_size}" + (f"&fields={fields}" if fields else "")
+    while True:
+        response = client.get(base + (f"&cursor={cursor}" if cursor else ""))
+        body = response.get_json()
+        total += len(body["data"])
+        size += len(response.data)
+        cursor = body["next_cursor"]
+        if not cursor:
+            return total, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000, help="Tasks to seed")
+    parser.add_argument("--page-size", type=int, default=500, help="List page size")
+    parser.add_argument("--gets", type=int, default=2000, help="Single-task GETs per path")
+    parser.add_argument("--rounds", type=int, default=3, help="Full list walks per path")
+    parser.add_argument("--fields", default="", help="Sparse fieldset for list requests")
+    args = parser.parse_args()
+
+    app = create_bench_app()
+    # Realistic descriptions make the cost of shipping them visible
+    seed_tasks(app, args.rows, describe=lambda i: f"Notes for task {i}. " * 20)
+    client = app.test_client()
+    encoder = "orjson" if serialization.orjson is not None else "stdlib json"
+
+    for label, fast in (("ORM + jsonify", False), (f"fast path ({encoder})", True)):
+        app.config["TASKS_FAST_READ_PATH"] = fast
+        _walk_pages(client, args.page_size, args.fields)  # warm-up
+        with timer() as listing:
+            for _ in range(args.rounds):
+                rows, size = _walk_pages(client, args.page_size, args.fields)
+        rows *= args.rounds
+        with timer() as gets:
+            for i in range(args.gets):
+                client.get(f"/api/v1/tasks/{i % args.rows + 1}")
+        print(f"{label:<26} list: {rate(rows, listing['seconds'])} rows "
+              f"({size / 1024:,.0f} KiB per walk)   "
+              f"get: {rate(args.gets, gets['seconds'])} requests")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Compare indexed full-text search with a LIKE scan over a large table.
+
+Seeds tasks whose descriptions are drawn from a fixed vocabulary (so term
+frequencies range from rare to common), then times
+``TaskService.search_tasks`` (FTS5 on SQLite, tsvector/GIN on PostgreSQL)
+against the naive ``LIKE '%term%'`` query it replaces.
+
+Usage:
+    python -m benchmarks.bench_search --rows 1000000
+    python -m benchmarks.bench_search --database-uri postgresql+psycopg2://...
+"""
+import argparse
+import random
+
+from sqlalchemy import or_, select
+
+from benchmarks.common import create_bench_app, rate, seed_tasks, timer
+from app.extensions import db
+from app.models.task import Task
+from app.services.task_service import TaskService
+
+VOCABULARY = [f"word{n}" for n in range(5000)]
+# (label, query): the first term is rare, the last appears in most rows
+QUERIES = [("rare", "word200"), ("medium", "word50"), ("two words", "word1 word2"),
+           ("common", "word0")]
+
+
+def _describe(i: int) -> str:
+    """Eight words per task, Zipf-like: low-numbered words are frequent."""
+    rng = random.Random(i)
+    return " ".join(
+        VOCABULARY[min(int(rng.paretovariate(1.0)) - 1, len(VOCABULARY) - 1)]
+        for _ in range(8)
+    )
+
+
+def _like_statement(query: str, limit: int):
+    tasks = Task.__table__
+    return (
+        select(tasks)
+        .where(*(
+            or_(tasks.c.title.contains(word), tasks.c.description.contains(word))
+            for word in query.split()
+        ))
+        .order_by(tasks.c.created_at.desc())
+        .limit(limit)
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Tasks to seed")
+    parser.add_argument("--limit", type=int, default=20, help="Results per search")
+    parser.add_argument("--repeat", type=int, default=20, help="Searches per query")
+    parser.add_argument("--database-uri", help="Database to use (default: temp SQLite)")
+    args = parser.parse_args()
+
+    app = create_bench_app(args.database_uri)
+    with timer() as seeding:
+        seed_tasks(app, args.rows, describe=_describe)
+    print(f"seeded {args.rows:,} rows in {seeding['seconds']:.1f}s "
+          "(includes search index maintenance)")
+
+    with app.app_context():
+        # The cache is off by default; make sure every search hits the index
+        app.extensions["task_cache"].enabled = False
+        for label, query in QUERIES:
+            with timer() as indexed:
+                for _ in range(args.repeat):
+                    hits = len(TaskService.search_tasks(query, limit=args.limit))
+            with timer() as scan:
+                for _ in range(args.repeat):
+                    db.session.execute(_like_statement(query, args.limit)).all()
+            print(f"{label:<10} {query!r:<14} hits={hits:<4} "
+                  f"index: {rate(args.repeat, indexed['seconds'])}   "
+                  f"LIKE: {rate(args.repeat, scan['seconds'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Concurrent read/write throughput of SQLite with and without the pragma profile.
+
+For each profile (off: SQLite defaults with the rollback journal; on: the
+SQLITE_* settings, WAL by default) a fresh file database is seeded and
+served by gunicorn (``--workers`` x ``--threads``). ``--concurrency``
+keep-alive connections then send a read-heavy and a write-heavy mix of
+list, get and create requests for ``--duration`` seconds each.
+
+Usage:
+    python -m benchmarks.bench_sqlite_profile
+    python -m benchmarks.bench_sqlite_profile --concurrency 64 --workers 4 --duration 20
+"""
+import argparse
+import asyncio
+import json
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from app.extensions import db
+from benchmarks.bench_api import ROOT, _prepare, start_gunicorn
+from benchmarks.bench_async import load
+
+DEFAULT_OUTPUT = ROOT / "benchmarks" / "results" / "sqlite_profile.json"
+
+# Mix name -> (weight, method, path, body) entries, as in bench_async
+MIXES: Dict[str, List[Tuple]] = {
+    "read-heavy": [
+        (60, "GET", "/api/v1/tasks?limit=20", None),
+        (30, "GET", "/api/v1/tasks/{id}", None),
+        (10, "POST", "/api/v1/tasks", {"title": "Profile bench task {n}"}),
+    ],
+    "write-heavy": [
+        (25, "GET", "/api/v1/tasks?limit=20", None),
+        (25, "GET", "/api/v1/tasks/{id}", None),
+        (50, "POST", "/api/v1/tasks", {"title": "Profile bench task {n}"}),
+    ],
+}
+
+
+def _set_journal_mode(database_uri: str, mode: str) -> None:
+    """Switch the journal mode stored in the database file."""
+    connection = sqlite3.connect(database_uri.removeprefix("sqlite:///"))
+    try:
+        connection.execute(f"PRAGMA journal_mode = {mode}")
+    finally:
+        connection.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000, help="Tasks to seed")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent connections")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per mix")
+    parser.add_argument("--workers", type=int, default=2, help="gunicorn worker processes")
+    parser.add_argument("--threads", type=int, default=4, help="Threads per gunicorn worker")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT), help="Where to write the JSON results")
+    args = parser.parse_args()
+
+    records = []
+    for profile, enabled in (("off", "0"), ("on", "1")):
+        print(f"Seeding {args.rows:,} tasks (profile {profile})...", flush=True)
+        app, uri = _prepare(args.rows, None, 10000)
+        with app.app_context():
+            db.engine.dispose()
+        # Seeding ran with the profile and WAL persists in the file: set
+        # the journal mode the server is meant to start from
+        _set_journal_mode(uri, "WAL" if enabled == "1" else "DELETE")
+        process, port = start_gunicorn(
+            uri, args.workers, args.threads, {"SQLITE_PRAGMAS_ENABLED": enabled}
+        )
+        try:
+            for mix_name, mix in MIXES.items():
+                result = asyncio.run(
+                    load(port, args.rows, args.concurrency, args.duration, mix)
+                )
+                records.append({"profile": profile, "mix": mix_name, **result})
+                print(
+                    f"  profile {profile:<3} {mix_name:<11} {result['throughput_rps']:>8,.0f} req/s "
+                    f"p50 {result['p50_ms']:>8.2f}  p95 {result['p95_ms']:>8.2f}  "
+                    f"p99 {result['p99_ms']:>8.2f} ms"
+                    + (f"  ({result['errors']} errors)" if result["errors"] else ""),
+                    flush=True,
+                )
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({"meta": vars(args), "results": records}, indent=2) + "\n")
+    print(f"\nWrote {output}")
+
+
+if __name__ == "__main__":
+    main()
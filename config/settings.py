@@ -1,7 +1,7 @@
 """Application configuration module."""
 import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -9,6 +9,46 @@ load_dotenv()
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 
+def _optional_number(name: str, kind: type = int, default: str = "") -> Any:
+    """Read a numeric setting, or None when empty (unset reads ``default``)."""
+    value = os.getenv(name, default).strip()
+    return kind(value) if value else None
+
+
+# Pool profile -> sizing rule; see pool_profile()
+POOL_PROFILES = ("threaded", "async", "serverless")
+
+
+def pool_profile(name: str, concurrency: int) -> Dict[str, Any]:
+    """Derive pool sizing from the worker model.
+
+    Args:
+        name: One of POOL_PROFILES
+        concurrency: Requests a process serves at once (gunicorn
+            ``--threads``, or the async pool size)
+
+    Returns:
+        ``pool_size``, ``max_overflow`` and ``pool_timeout``
+
+    Raises:
+        ValueError: If the profile is unknown
+    """
+    if name == "threaded":
+        # A request thread holds at most one connection; the overflow
+        # covers background threads (event broker, cache) without
+        # letting a thread leak grow the pool unbounded
+        return {"pool_size": concurrency, "max_overflow": 2, "pool_timeout": 10}
+    if name == "async":
+        # Coroutines queue on the pool instead of on threads, so bursts
+        # may open extra connections before anyone waits
+        return {"pool_size": concurrency, "max_overflow": 2 * concurrency, "pool_timeout": 30}
+    if name == "serverless":
+        # Many small instances scaled to zero: keep one idle connection,
+        # open more only while requests overlap, fail fast when starved
+        return {"pool_size": 1, "max_overflow": max(concurrency - 1, 0), "pool_timeout": 5}
+    raise ValueError(f"Unknown DB_POOL_PROFILE {name!r}; choose from {', '.join(POOL_PROFILES)}")
+
+
 def _get_database_uri() -> str:
     """
     Normalize the database URL:
@@ -35,6 +75,145 @@ class Config:
     # Logging
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
 
+    # Record todo_api_* request metrics for every request
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "1") == "1"
+
+    # Per-request SQL instrumentation: log a warning when a request runs
+    # more than SQL_STATEMENT_BUDGET statements or repeats one statement
+    # SQL_REPEAT_THRESHOLD times (likely N+1); 0 disables either check.
+    # SQL_SERVER_TIMING exposes the DB time in a Server-Timing header.
+    SQL_STATEMENT_BUDGET: int = int(os.getenv("SQL_STATEMENT_BUDGET", "20"))
+    SQL_REPEAT_THRESHOLD: int = int(os.getenv("SQL_REPEAT_THRESHOLD", "5"))
+    SQL_SERVER_TIMING: bool = os.getenv("SQL_SERVER_TIMING", "0") == "1"
+
+    # Sampled cProfile profiling (see app/utils/profiling.py). Requests are
+    # profiled at PROFILING_SAMPLE_RATE, or when they carry an
+    # X-Profile-Request header signed with PROFILING_SECRET; profiles are
+    # served by /api/v1/admin/profiles to callers presenting ADMIN_TOKEN.
+    PROFILING_ENABLED: bool = os.getenv("PROFILING_ENABLED", "0") == "1"
+    PROFILING_SAMPLE_RATE: float = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+    PROFILING_SECRET: str = os.getenv("PROFILING_SECRET", "")
+    PROFILING_DIR: str = os.getenv("PROFILING_DIR", "/tmp/todo-api-profiles")
+    PROFILING_MAX_FILES: int = int(os.getenv("PROFILING_MAX_FILES", "100"))
+    ADMIN_TOKEN: str = os.getenv("ADMIN_TOKEN", "")
+
+    # Serve task reads from raw column tuples encoded with orjson (when
+    # installed), skipping ORM hydration and jsonify
+    TASKS_FAST_READ_PATH: bool = os.getenv("TASKS_FAST_READ_PATH", "0") == "1"
+
+    # Read-through cache for task reads (see app/services/cache.py). The
+    # cache holds immutable column tuples, so enabling it also serves
+    # reads through the fast path. Use a sqlite:/// backend when running
+    # several gunicorn workers so a write in one invalidates all of them.
+    TASK_CACHE_ENABLED: bool = os.getenv("TASK_CACHE_ENABLED", "0") == "1"
+    TASK_CACHE_BACKEND: str = os.getenv("TASK_CACHE_BACKEND", "local")
+    TASK_CACHE_MAX_ENTRIES: int = int(os.getenv("TASK_CACHE_MAX_ENTRIES", "256"))
+    TASK_CACHE_TTL_SECONDS: float = float(os.getenv("TASK_CACHE_TTL_SECONDS", "30"))
+
+    # Idempotency-Key support for task writes (see app/services/idempotency.py).
+    # Responses are kept in a per-worker LRU for IDEMPOTENCY_TTL_SECONDS; use
+    # a sqlite:/// backend when running several gunicorn workers so a retry
+    # landing on another worker is still recognised. Entries hold response
+    # bodies, so size IDEMPOTENCY_MAX_ENTRIES with batch responses in mind.
+    IDEMPOTENCY_ENABLED: bool = os.getenv("IDEMPOTENCY_ENABLED", "1") == "1"
+    IDEMPOTENCY_BACKEND: str = os.getenv("IDEMPOTENCY_BACKEND", "local")
+    IDEMPOTENCY_MAX_ENTRIES: int = int(os.getenv("IDEMPOTENCY_MAX_ENTRIES", "1000"))
+    IDEMPOTENCY_TTL_SECONDS: float = float(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400"))
+
+    # Content deduplication of task creation: a task identical to one
+    # created less than TASK_DEDUP_WINDOW_SECONDS ago is returned instead of
+    # inserted (one extra query per create). 0 disables it; clients that
+    # retry should send an Idempotency-Key instead.
+    TASK_DEDUP_WINDOW_SECONDS: float = float(os.getenv("TASK_DEDUP_WINDOW_SECONDS", "0"))
+
+    # Change feed (GET /api/v1/tasks/changes). Sync tokens never advance
+    # past changes younger than the safety lag, so a write whose
+    # transaction stamped its updated_at before a poll but committed after
+    # it is still delivered; keep it above the longest write transaction.
+    # `flask tasks prune` deletes tombstones older than the retention, and
+    # tokens issued before then get 410 and must resync (0 keeps them).
+    TASK_CHANGES_SAFETY_LAG_SECONDS: float = float(
+        os.getenv("TASK_CHANGES_SAFETY_LAG_SECONDS", "5")
+    )
+    TASK_DELETIONS_RETENTION_DAYS: float = float(
+        os.getenv("TASK_DELETIONS_RETENTION_DAYS", "30")
+    )
+
+    # Server-Sent Events (GET /api/v1/tasks/stream). Each open stream holds
+    # a thread of the worker process serving it, and the cap applies per
+    # worker: streams get GUNICORN_THREADS minus TASK_EVENTS_RESERVED_THREADS
+    # (at least one thread always stays free for API calls), and sync
+    # workers (one thread) refuse them with 503. TASK_EVENTS_MAX_SUBSCRIBERS
+    # can only lower that cap. deployment/gunicorn.conf.py exports the
+    # actual --threads value as GUNICORN_THREADS.
+    GUNICORN_THREADS: int = int(os.getenv("GUNICORN_THREADS", "4"))
+    TASK_EVENTS_RESERVED_THREADS: int = int(os.getenv("TASK_EVENTS_RESERVED_THREADS", "2"))
+    TASK_EVENTS_MAX_SUBSCRIBERS: Optional[int] = _optional_number("TASK_EVENTS_MAX_SUBSCRIBERS")
+    TASK_EVENTS_QUEUE_SIZE: int = int(os.getenv("TASK_EVENTS_QUEUE_SIZE", "100"))
+    TASK_EVENTS_HEARTBEAT_SECONDS: float = float(
+        os.getenv("TASK_EVENTS_HEARTBEAT_SECONDS", "15")
+    )
+
+    # Connection pool (see app/utils/db_pool.py). DB_POOL_PROFILE sizes the
+    # pool for the worker model: "threaded" (gunicorn gthread), "async"
+    # (asgi.py, always used there) or "serverless" (Cloud Run); empty keeps
+    # SQLAlchemy's defaults. DB_POOL_CONCURRENCY is the number of requests
+    # a process serves at once (gunicorn --threads). DB_POOL_SIZE,
+    # DB_POOL_MAX_OVERFLOW and DB_POOL_TIMEOUT override the derived values;
+    # DB_POOL_SIZE=0 disables pooling (NullPool).
+    DB_POOL_PROFILE: str = os.getenv("DB_POOL_PROFILE", "")
+    DB_POOL_CONCURRENCY: int = int(os.getenv("DB_POOL_CONCURRENCY") or GUNICORN_THREADS)
+    DB_POOL_SIZE: Optional[int] = _optional_number("DB_POOL_SIZE")
+    DB_POOL_MAX_OVERFLOW: Optional[int] = _optional_number("DB_POOL_MAX_OVERFLOW")
+    DB_POOL_TIMEOUT: Optional[float] = _optional_number("DB_POOL_TIMEOUT", float)
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "300"))
+    # "pessimistic" pings each connection at checkout (one extra round trip
+    # per request); "optimistic" skips the ping, relying on DB_POOL_RECYCLE
+    # to retire connections before the server does and on SQLAlchemy
+    # invalidating the whole pool at the first disconnect error (that one
+    # request fails)
+    DB_DISCONNECT_HANDLING: str = os.getenv("DB_DISCONNECT_HANDLING", "pessimistic")
+
+    # Group commit (see app/services/group_commit.py): POST /tasks requests
+    # of a worker are written together, one transaction per group of up to
+    # TASK_GROUP_COMMIT_MAX_BATCH tasks gathered for at most
+    # TASK_GROUP_COMMIT_MAX_DELAY_MS (added to create latency when idle)
+    TASK_GROUP_COMMIT_ENABLED: bool = os.getenv("TASK_GROUP_COMMIT_ENABLED", "0") == "1"
+    TASK_GROUP_COMMIT_MAX_DELAY_MS: float = float(
+        os.getenv("TASK_GROUP_COMMIT_MAX_DELAY_MS", "2")
+    )
+    TASK_GROUP_COMMIT_MAX_BATCH: int = int(os.getenv("TASK_GROUP_COMMIT_MAX_BATCH", "100"))
+    # How long a create waits for its group's commit before failing
+    TASK_GROUP_COMMIT_TIMEOUT_MS: float = float(
+        os.getenv("TASK_GROUP_COMMIT_TIMEOUT_MS", "10000")
+    )
+
+    # SQLite connection profile (see app/extensions.py), applied to every
+    # new connection of a sqlite:/// database; an empty value skips that
+    # pragma, while 0 is applied (SQLITE_MMAP_SIZE=0 turns mmap off).
+    # Defaults: WAL with NORMAL sync (durable across crashes of
+    # the app, may lose the last commits on power loss), 256 MiB of
+    # memory-mapped I/O, a 64 MiB page cache (negative = KiB), writers wait
+    # up to 5 s for the lock, temporary tables and indexes in memory.
+    SQLITE_PRAGMAS_ENABLED: bool = os.getenv("SQLITE_PRAGMAS_ENABLED", "1") == "1"
+    SQLITE_JOURNAL_MODE: str = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_MMAP_SIZE: Optional[int] = _optional_number(
+        "SQLITE_MMAP_SIZE", default=str(256 * 1024 * 1024)
+    )
+    SQLITE_CACHE_SIZE: Optional[int] = _optional_number("SQLITE_CACHE_SIZE", default="-65536")
+    SQLITE_BUSY_TIMEOUT_MS: Optional[int] = _optional_number(
+        "SQLITE_BUSY_TIMEOUT_MS", default="5000"
+    )
+    SQLITE_TEMP_STORE: str = os.getenv("SQLITE_TEMP_STORE", "MEMORY")
+
+    # ASGI entry point (asgi.py). Derived from the main database URI
+    # (aiosqlite / asyncpg driver) unless ASYNC_DATABASE_URI is set.
+    # ASYNC_DB_POOL_SIZE connections per process; keep it small on SQLite,
+    # where more connections only queue on the single write lock.
+    ASYNC_DATABASE_URI: str = os.getenv("ASYNC_DATABASE_URI", "")
+    ASYNC_DB_POOL_SIZE: int = int(os.getenv("ASYNC_DB_POOL_SIZE", "5"))
+
     @staticmethod
     def init_app(app: Any) -> None:
         pass
@@ -57,11 +236,7 @@ class TestingConfig(Config):
 
 class ProductionConfig(Config):
     # Database URI will be set dynamically in __init__.py to ensure env vars are loaded
-    # Optionally harden the pool (prevents timeouts)
-    SQLALCHEMY_ENGINE_OPTIONS = {
-        "pool_pre_ping": True,
-        "pool_recycle": 300,
-    }
+    DB_POOL_PROFILE = os.getenv("DB_POOL_PROFILE", "threaded")
 
     @classmethod
     def init_app(cls, app: Any) -> None:
@@ -0,0 +1,35 @@
+"""Gunicorn settings shared by the Dockerfile and the Procfile.
+
+Enables prometheus_client multiprocess mode so /api/v1/metrics reports
+the sum of every worker instead of whichever worker answers the scrape.
+Worker count, threads and bind address stay on the command line; the
+thread count is passed on to the app as GUNICORN_THREADS.
+"""
+import os
+import shutil
+
+# prometheus_client picks its storage backend when first imported, so the
+# directory must be in the environment before any worker imports the app.
+# PROMETHEUS_MULTIPROCESS_DIR is accepted as an alias.
+_metrics_dir = (
+    os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    or os.environ.get("PROMETHEUS_MULTIPROCESS_DIR")
+    or "/tmp/prometheus-multiproc"
+)
+os.environ["PROMETHEUS_MULTIPROC_DIR"] = _metrics_dir
+
+from prometheus_client import multiprocess  # noqa: E402
+
+
+def on_starting(server):
+    """Start every master with an empty metrics directory."""
+    shutil.rmtree(_metrics_dir, ignore_errors=True)
+    os.makedirs(_metrics_dir, exist_ok=True)
+    # Workers size their event stream cap and DB pool from the actual
+    # --threads value (1 under sync workers), not from a default
+    os.environ["GUNICORN_THREADS"] = str(server.cfg.threads)
+
+
+def child_exit(server, worker):
+    """Drop live gauges of workers that exited (counters are kept)."""
+    multiprocess.mark_process_dead(worker.pid)
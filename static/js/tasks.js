@@ -16,11 +16,18 @@ document.addEventListener('DOMContentLoaded', () => {
 
   async function loadTasks() {
     try {
-      const res = await fetch(apiBase);
-      if (!res.ok) throw new Error(`Failed to load tasks: ${res.status}`);
-      const response = await res.json();
-      // Extract tasks from response wrapper
-      const tasks = response.data || response || [];
+      // The list endpoint is cursor-paginated; follow next_cursor to the end
+      const tasks = [];
+      let cursor = null;
+      do {
+        const url = cursor ? `${apiBase}?cursor=${encodeURIComponent(cursor)}` : apiBase;
+        const res = await fetch(url);
+        if (!res.ok) throw new Error(`Failed to load tasks: ${res.status}`);
+        const response = await res.json();
+        // Extract tasks from response wrapper
+        tasks.push(...(response.data || []));
+        cursor = response.next_cursor;
+      } while (cursor);
       renderTasks(tasks);
     } catch (err) {
       showError(err.message);
@@ -29,81 +36,114 @@ document.addEventListener('DOMContentLoaded', () => {
 
   function renderTasks(tasks) {
     taskList.innerHTML = '';
-    tasks.forEach(task => {
-      const li = document.createElement('li');
-      li.className = 'task-item' + (task.completed ? ' completed' : '');
-
-      const content = document.createElement('div');
-      content.className = 'task-content';
-
-      const title = document.createElement('div');
-      title.className = 'task-title';
-      title.textContent = task.title;
-
-      const desc = document.createElement('div');
-      desc.className = 'task-description';
-      desc.textContent = task.description || '';
-
-      const meta = document.createElement('div');
-      meta.className = 'task-meta';
-      meta.textContent = `Created: ${new Date(task.created_at).toLocaleString()}`;
-
-      content.appendChild(title);
-      content.appendChild(desc);
-      content.appendChild(meta);
-
-      const actions = document.createElement('div');
-      actions.className = 'task-actions';
-
-      const completeBtn = document.createElement('button');
-      completeBtn.className = 'btn btn-complete';
-      completeBtn.textContent = task.completed ? 'Uncomplete' : 'Complete';
-      completeBtn.onclick = async () => {
-        try {
-          await fetch(`${apiBase}/${task.id}`, {
-            method: 'PUT',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({ completed: !task.completed })
-          });
-          loadTasks();
-        } catch (err) { showError(err.message); }
-      };
-
-      const editBtn = document.createElement('button');
-      editBtn.className = 'btn btn-edit';
-      editBtn.textContent = 'Edit';
-      editBtn.onclick = async () => {
-        const newTitle = prompt('Edit task title', task.title);
-        if (!newTitle) return;
-        try {
-          await fetch(`${apiBase}/${task.id}`, {
-            method: 'PUT',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({ title: newTitle })
-          });
-          loadTasks();
-        } catch (err) { showError(err.message); }
-      };
-
-      const delBtn = document.createElement('button');
-      delBtn.className = 'btn btn-delete';
-      delBtn.textContent = 'Delete';
-      delBtn.onclick = async () => {
-        if (!confirm('Delete this task?')) return;
-        try {
-          await fetch(`${apiBase}/${task.id}`, { method: 'DELETE' });
-          loadTasks();
-        } catch (err) { showError(err.message); }
-      };
-
-      actions.appendChild(completeBtn);
-      actions.appendChild(editBtn);
-      actions.appendChild(delBtn);
-
-      li.appendChild(content);
-      li.appendChild(actions);
-      taskList.appendChild(li);
+    tasks.forEach(task => taskList.appendChild(renderTask(task)));
+  }
+
+  // Insert or replace a single task node; new tasks go to the top (newest first)
+  function upsertTask(task) {
+    const node = renderTask(task);
+    const existing = taskList.querySelector(`li[data-id="${task.id}"]`);
+    if (existing) existing.replaceWith(node);
+    else taskList.prepend(node);
+  }
+
+  function removeTask(id) {
+    const existing = taskList.querySelector(`li[data-id="${id}"]`);
+    if (existing) existing.remove();
+  }
+
+  async function updateTask(id, changes) {
+    const res = await fetch(`${apiBase}/${id}`, {
+      method: 'PUT',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify(changes)
     });
+    if (!res.ok) throw new Error(`Failed to update task: ${res.status}`);
+    const response = await res.json();
+    upsertTask(response.data);
+  }
+
+  function renderTask(task) {
+    const li = document.createElement('li');
+    li.className = 'task-item' + (task.completed ? ' completed' : '');
+    li.dataset.id = task.id;
+
+    const content = document.createElement('div');
+    content.className = 'task-content';
+
+    const title = document.createElement('div');
+    title.className = 'task-title';
+    title.textContent = task.title;
+
+    const desc = document.createElement('div');
+    desc.className = 'task-description';
+    desc.textContent = task.description || '';
+
+    const meta = document.createElement('div');
+    meta.className = 'task-meta';
+    meta.textContent = `Created: ${new Date(task.created_at).toLocaleString()}`;
+
+    content.appendChild(title);
+    content.appendChild(desc);
+    content.appendChild(meta);
+
+    const actions = document.createElement('div');
+    actions.className = 'task-actions';
+
+    const completeBtn = document.createElement('button');
+    completeBtn.className = 'btn btn-complete';
+    completeBtn.textContent = task.completed ? 'Uncomplete' : 'Complete';
+    completeBtn.onclick = async () => {
+      try {
+        await updateTask(task.id, { completed: !task.completed });
+      } catch (err) { showError(err.message); }
+    };
+
+    const editBtn = document.createElement('button');
+    editBtn.className = 'btn btn-edit';
+    editBtn.textContent = 'Edit';
+    editBtn.onclick = async () => {
+      const newTitle = prompt('Edit task title', task.title);
+      if (!newTitle) return;
+      try {
+        await updateTask(task.id, { title: newTitle });
+      } catch (err) { showError(err.message); }
+    };
+
+    const delBtn = document.createElement('button');
+    delBtn.className = 'btn btn-delete';
+    delBtn.textContent = 'Delete';
+    delBtn.onclick = async () => {
+      if (!confirm('Delete this task?')) return;
+      try {
+        const res = await fetch(`${apiBase}/${task.id}`, { method: 'DELETE' });
+        if (!res.ok && res.status !== 404) throw new Error(`Failed to delete task: ${res.status}`);
+        removeTask(task.id);
+      } catch (err) { showError(err.message); }
+    };
+
+    actions.appendChild(completeBtn);
+    actions.appendChild(editBtn);
+    actions.appendChild(delBtn);
+
+    li.appendChild(content);
+    li.appendChild(actions);
+    return li;
+  }
+
+  // Live updates from other tabs/clients. Events are applied to the DOM
+  // directly; bulk changes (or falling behind) fall back to a full reload.
+  function subscribe() {
+    if (!window.EventSource) return;
+    const source = new EventSource(`${apiBase}/stream`);
+    const upsert = (e) => upsertTask(JSON.parse(e.data));
+    source.addEventListener('task.created', upsert);
+    source.addEventListener('task.updated', upsert);
+    source.addEventListener('task.deleted', (e) => removeTask(JSON.parse(e.data).id));
+    source.addEventListener('tasks.deleted', (e) => JSON.parse(e.data).ids.forEach(removeTask));
+    source.addEventListener('tasks.invalidated', () => loadTasks());
+    // The server closes the stream after a resync; EventSource reconnects
+    source.addEventListener('resync', () => loadTasks());
   }
 
   form.addEventListener('submit', async (e) => {
@@ -125,9 +165,10 @@ document.addEventListener('DOMContentLoaded', () => {
         body: JSON.stringify(payload)
       });
       if (!res.ok) throw new Error(`Failed to create task: ${res.status}`);
+      const response = await res.json();
       titleInput.value = '';
       descriptionInput.value = '';
-      await loadTasks();
+      upsertTask(response.data);
     } catch (err) { showError(err.message); }
     finally {
       form.dataset.submitting = '0';
@@ -137,5 +178,6 @@ document.addEventListener('DOMContentLoaded', () => {
 
   // Initial load
   loadTasks();
+  subscribe();
 });
 // End: Single front-end implementation retained to avoid duplicate handlers
\ No newline at end of file
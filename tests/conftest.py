@@ -44,3 +44,17 @@ def client(app):
 def runner(app):
     """Create test CLI runner."""
     return app.test_cli_runner()
+
+
+@pytest.fixture
+def query_counter(db):
+    """Capture the SQL statements executed inside a ``with`` block.
+
+    Usage::
+
+        with query_counter() as statements:
+            client.get("/api/v1/tasks")
+        assert len(statements) == 2
+    """
+    from app.utils.query_metrics import capture_queries
+    return lambda: capture_queries(db.engine)
@@ -0,0 +1,238 @@
+"""Test the ASGI entry point against the Flask app's task contract."""
+import asyncio
+import json
+
+import pytest
+
+from app import create_app
+from app.asgi import async_database_uri, create_asgi_app
+from app.extensions import db as _db
+from app.models.task import Task
+from config.settings import TestingConfig
+
+
+class ASGIClient:
+    """Drive an ASGI app through the full protocol on a private loop."""
+
+    def __init__(self, app):
+        self.app = app
+        self.loop = asyncio.new_event_loop()
+
+    def run(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def request(self, method, path, json_body=None, headers=None, query=""):
+        body = json.dumps(json_body).encode() if json_body is not None else b""
+        scope = {
+            "type": "http",
+            "method": method,
+            "path": path,
+            "query_string": query.encode(),
+            "headers": [
+                (name.lower().encode(), value.encode())
+                for name, value in (headers or {}).items()
+            ],
+        }
+        sent = []
+
+        async def receive():
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message):
+            sent.append(message)
+
+        self.run(self.app(scope, receive, send))
+        start, payload = sent
+        response_headers = {
+            name.decode(): value.decode() for name, value in start["headers"]
+        }
+        data = json.loads(payload["body"]) if payload["body"] else None
+        return start["status"], response_headers, data
+
+    def close(self):
+        self.run(self.app.shutdown())
+        self.loop.close()
+
+
+@pytest.fixture
+def asgi():
+    """Client of an ASGI app on its own in-memory database."""
+    client = ASGIClient(create_asgi_app("testing"))
+    client.run(client.app.startup())
+    yield client
+    client.close()
+
+
+def test_async_database_uri():
+    assert async_database_uri("sqlite:///:memory:") == "sqlite+aiosqlite:///:memory:"
+    assert (
+        async_database_uri("postgresql+psycopg2://u:p@db/todo")
+        == "postgresql+asyncpg://u:p@db/todo"
+    )
+    assert async_database_uri("postgresql+asyncpg://db/todo") == "postgresql+asyncpg://db/todo"
+
+
+def test_crud_round_trip(asgi):
+    status, _, created = asgi.request("POST", "/api/v1/tasks", {"title": "Write report"})
+    assert status == 201
+    task_id = created["data"]["id"]
+
+    status, headers, body = asgi.request("GET", f"/api/v1/tasks/{task_id}")
+    assert status == 200 and body["data"]["title"] == "Write report"
+    etag = headers["etag"]
+
+    status, headers, _ = asgi.request(
+        "PUT", f"/api/v1/tasks/{task_id}", {"completed": True}, {"If-Match": etag}
+    )
+    assert status == 200
+    # The old ETag no longer matches
+    status, _, _ = asgi.request(
+        "PUT", f"/api/v1/tasks/{task_id}", {"completed": False}, {"If-Match": etag}
+    )
+    assert status == 412
+    assert asgi.request("GET", "/api/v1/tasks/stats")[2]["data"] == {
+        "total": 1, "open": 0, "completed": 1,
+    }
+
+    assert asgi.request("DELETE", f"/api/v1/tasks/{task_id}")[0] == 204
+    assert asgi.request("GET", f"/api/v1/tasks/{task_id}")[0] == 404
+    assert asgi.request("GET", "/api/v1/tasks/stats")[2]["data"]["total"] == 0
+
+
+def test_list_pages_and_validators(asgi):
+    for i in range(3):
+        asgi.request("POST", "/api/v1/tasks", {"title": f"Task {i}"})
+
+    status, headers, first = asgi.request("GET", "/api/v1/tasks", query="limit=2&fields=title")
+    assert status == 200
+    assert [task["title"] for task in first["data"]] == ["Task 2", "Task 1"]
+    assert set(first["data"][0]) == {"id", "title"}
+
+    cursor = first["next_cursor"]
+    rest = asgi.request("GET", "/api/v1/tasks", query=f"limit=2&fields=title&cursor={cursor}")
+    assert [task["title"] for task in rest[2]["data"]] == ["Task 0"]
+    assert rest[2]["next_cursor"] is None
+
+    status, _, body = asgi.request(
+        "GET", "/api/v1/tasks", headers={"If-None-Match": headers["etag"]},
+        query="limit=2&fields=title",
+    )
+    assert status == 304 and body is None
+
+
+def test_errors(asgi):
+    assert asgi.request("POST", "/api/v1/tasks", {"title": ""})[0] == 422
+    assert asgi.request("GET", "/api/v1/tasks", query="limit=0")[0] == 422
+    status, headers, _ = asgi.request("PATCH", "/api/v1/tasks")
+    assert status == 405 and headers["allow"] == "GET, POST"
+    # WSGI-only routes are not served
+    assert asgi.request("GET", "/api/v1/tasks/export")[2] == {"error": "Resource not found"}
+
+
+def test_responses_match_the_flask_app(monkeypatch, tmp_path):
+    """Both servers return the same documents from one database."""
+    uri = f"sqlite:///{tmp_path / 'tasks.db'}"
+    monkeypatch.setattr(TestingConfig, "SQLALCHEMY_DATABASE_URI", uri)
+    flask_app = create_app("testing")
+    client = flask_app.test_client()
+    asgi = ASGIClient(create_asgi_app("testing", database_uri=async_database_uri(uri)))
+    try:
+        with flask_app.app_context():
+            _db.create_all()
+        client.post("/api/v1/tasks", json={"title": "From Flask", "description": "a"})
+        asgi.request("POST", "/api/v1/tasks", {"title": "From ASGI", "description": "b"})
+        client.put("/api/v1/tasks/2", json={"completed": True})
+
+        for path, query in [
+            ("/api/v1/tasks", ""),
+            ("/api/v1/tasks", "completed=true"),
+            ("/api/v1/tasks", "q=asgi&fields=id,title"),
+            ("/api/v1/tasks/1", ""),
+            ("/api/v1/tasks/stats", ""),
+            ("/api/v1/tasks/99", ""),
+        ]:
+            expected = client.get(f"{path}?{query}")
+            status, headers, body = asgi.request("GET", path, query=query)
+            assert (status, body) == (expected.status_code, expected.json), path
+            assert headers.get("last-modified") == expected.headers.get("Last-Modified")
+    finally:
+        asgi.close()
+        with flask_app.app_context():
+            _db.session.remove()
+            _db.drop_all()
+
+
+def test_idempotency_key_replays_writes(asgi):
+    headers = {"Idempotency-Key": "create-1"}
+    status, _, first = asgi.request("POST", "/api/v1/tasks", {"title": "Once"}, headers)
+    assert status == 201
+    status, replay_headers, second = asgi.request(
+        "POST", "/api/v1/tasks", {"title": "Once"}, headers
+    )
+    assert (status, second) == (201, first)
+    assert replay_headers["idempotent-replayed"] == "true"
+    status, _, stats = asgi.request("GET", "/api/v1/tasks/stats")
+    assert stats["data"]["total"] == 1
+
+    status, _, _ = asgi.request("POST", "/api/v1/tasks", {"title": "Other"}, headers)
+    assert status == 422
+
+
+def test_dedup_window_is_opt_in(monkeypatch):
+    asgi = ASGIClient(create_asgi_app("testing"))
+    asgi.run(asgi.app.startup())
+    ids = {asgi.request("POST", "/api/v1/tasks", {"title": "Same"})[2]["data"]["id"]
+           for _ in range(2)}
+    asgi.close()
+    assert len(ids) == 2
+
+    monkeypatch.setattr(TestingConfig, "TASK_DEDUP_WINDOW_SECONDS", 2)
+    asgi = ASGIClient(create_asgi_app("testing"))
+    asgi.run(asgi.app.startup())
+    ids = {asgi.request("POST", "/api/v1/tasks", {"title": "Same"})[2]["data"]["id"]
+           for _ in range(2)}
+    asgi.close()
+    assert len(ids) == 1
+
+
+def test_writes_invalidate_a_shared_flask_read_cache(monkeypatch, tmp_path):
+    uri = f"sqlite:///{tmp_path / 'tasks.db'}"
+    monkeypatch.setattr(TestingConfig, "SQLALCHEMY_DATABASE_URI", uri)
+    monkeypatch.setattr(TestingConfig, "TASK_CACHE_ENABLED", True)
+    monkeypatch.setattr(TestingConfig, "TASK_CACHE_BACKEND", f"sqlite:///{tmp_path / 'v.db'}")
+    flask_app = create_app("testing")
+    client = flask_app.test_client()
+    asgi = ASGIClient(create_asgi_app("testing", database_uri=async_database_uri(uri)))
+    try:
+        with flask_app.app_context():
+            _db.create_all()
+        assert client.get("/api/v1/tasks").json["data"] == []
+        asgi.request("POST", "/api/v1/tasks", {"title": "From ASGI"})
+        assert [task["title"] for task in client.get("/api/v1/tasks").json["data"]] == [
+            "From ASGI"
+        ]
+        asgi.request("DELETE", "/api/v1/tasks/1")
+        assert client.get("/api/v1/tasks").json["data"] == []
+    finally:
+        asgi.close()
+        with flask_app.app_context():
+            _db.session.remove()
+            _db.drop_all()
+
+
+def test_null_status_rows_update_and_delete(asgi):
+    asgi.request("POST", "/api/v1/tasks", {"title": "A"})
+    assert asgi.request("PUT", "/api/v1/tasks/1", {"completed": None})[0] == 422
+
+    async def insert_null_status():
+        async with asgi.app.sessions() as session:
+            await session.execute(Task.__table__.insert().values(title="Raw", completed=None))
+            await session.commit()
+
+    asgi.run(insert_null_status())
+    assert asgi.request("PUT", "/api/v1/tasks/2", {"completed": False})[0] == 200
+    assert asgi.request("DELETE", "/api/v1/tasks/2")[0] == 204
+    # The raw insert bypassed the counters; the delete still counts it as open
+    assert asgi.request("GET", "/api/v1/tasks/stats")[2]["data"] == {
+        "total": 0, "open": 0, "completed": 0
+    }
@@ -0,0 +1,91 @@
+"""Test bulk task creation."""
+from app.models.task import Task
+
+
+def test_batch_create_reports_each_item(client, db):
+    """Valid items are created, invalid and repeated ones are reported."""
+    client.application.config["TASK_DEDUP_WINDOW_SECONDS"] = 2
+    response = client.post(
+        "/api/v1/tasks/batch",
+        json={
+            "tasks": [
+                {"title": "One"},
+                {"description": "missing title"},
+                {"title": "Two", "description": "desc"},
+                {"title": "One"},
+            ]
+        },
+    )
+    assert response.status_code == 200
+    results = response.json["data"]["results"]
+    assert [r["status"] for r in results] == ["created", "invalid", "created", "duplicate"]
+    assert results[0]["data"]["id"] == results[3]["data"]["id"]
+    assert results[2]["data"]["description"] == "desc"
+    assert response.json["data"]["summary"] == {"created": 2, "duplicate": 1, "invalid": 1}
+    assert Task.query.count() == 2
+
+
+def test_batch_create_detects_existing_duplicates(client, db):
+    client.application.config["TASK_DEDUP_WINDOW_SECONDS"] = 2
+    existing = client.post("/api/v1/tasks", json={"title": "Existing"}).json["data"]
+    response = client.post("/api/v1/tasks/batch", json={"tasks": [{"title": "Existing"}]})
+    result = response.json["data"]["results"][0]
+    assert result["status"] == "duplicate"
+    assert result["data"]["id"] == existing["id"]
+
+
+def test_batch_create_without_dedup_creates_repeated_items(client, db):
+    tasks = [{"title": "Same"}, {"title": "Other"}, {"title": "Same"}]
+    response = client.post("/api/v1/tasks/batch", json={"tasks": tasks})
+    results = response.json["data"]["results"]
+    assert [r["status"] for r in results] == ["created"] * 3
+    assert results[0]["data"]["id"] < results[2]["data"]["id"]
+    assert Task.query.count() == 3
+
+
+def test_batch_create_rejects_empty_batch(client, db):
+    response = client.post("/api/v1/tasks/batch", json={"tasks": []})
+    assert response.status_code == 422
+
+
+def _create(client, *titles):
+    items = [{"title": title} for title in titles]
+    response = client.post("/api/v1/tasks/batch", json={"tasks": items})
+    return [result["data"]["id"] for result in response.json["data"]["results"]]
+
+
+def test_bulk_update_by_ids(client, db):
+    ids = _create(client, "A", "B", "C")
+    response = client.patch(
+        "/api/v1/tasks", json={"ids": ids[:2], "changes": {"completed": True}}
+    )
+    assert response.status_code == 200
+    assert response.json["data"] == {"affected": 2}
+    assert Task.query.filter_by(completed=True).count() == 2
+
+
+def test_bulk_delete_by_filter(client, db):
+    ids = _create(client, "A", "B", "C")
+    client.patch("/api/v1/tasks", json={"ids": [ids[0]], "changes": {"completed": True}})
+
+    response = client.delete("/api/v1/tasks", json={"filter": {"completed": True}})
+    assert response.json["data"] == {"affected": 1}
+    assert sorted(t.id for t in Task.query.all()) == ids[1:]
+
+
+def test_bulk_delete_requires_criteria(client, db):
+    _create(client, "A")
+    response = client.delete("/api/v1/tasks", json={"filter": {}})
+    assert response.status_code == 422
+    assert Task.query.count() == 1
+
+
+def test_batch_statement_count_does_not_grow_with_the_batch(client, db, query_counter):
+    counts = []
+    for size in (10, 1000):
+        tasks = [{"title": f"Task {size}-{i}"} for i in range(size)]
+        with query_counter() as statements:
+            response = client.post("/api/v1/tasks/batch", json={"tasks": tasks})
+        assert response.json["data"]["summary"]["created"] == size
+        counts.append(len(statements))
+    assert counts[0] == counts[1]
@@ -0,0 +1,72 @@
+"""Test the versioned task read cache."""
+import pytest
+
+from app.services.cache import (
+    LRUCache, LocalVersionBackend, SQLiteVersionBackend, TaskCache,
+)
+
+
+@pytest.fixture
+def cached_app(app):
+    app.extensions["task_cache"] = TaskCache(LocalVersionBackend(), enabled=True)
+    return app
+
+
+def test_reads_are_served_from_cache_until_a_write(cached_app, client, db):
+    calls = []
+    cache = cached_app.extensions["task_cache"]
+    original = cache.get_or_load
+
+    def spy(key, loader):
+        return original(key, lambda: calls.append(key[0]) or loader())
+
+    cache.get_or_load = spy
+    client.post("/api/v1/tasks", json={"title": "A"})
+    client.get("/api/v1/tasks")
+    client.get("/api/v1/tasks")
+    assert calls.count("list") == 1
+
+    client.post("/api/v1/tasks", json={"title": "B"})
+    response = client.get("/api/v1/tasks")
+    assert calls.count("list") == 2
+    assert [t["title"] for t in response.json["data"]] == ["B", "A"]
+
+
+def test_update_invalidates_single_task_entry(cached_app, client, db):
+    task_id = client.post("/api/v1/tasks", json={"title": "A"}).json["data"]["id"]
+    assert client.get(f"/api/v1/tasks/{task_id}").json["data"]["completed"] is False
+    client.put(f"/api/v1/tasks/{task_id}", json={"completed": True})
+    assert client.get(f"/api/v1/tasks/{task_id}").json["data"]["completed"] is True
+
+
+def test_lru_evicts_least_recently_used_and_expires():
+    now = [0.0]
+    evicted = []
+    lru = LRUCache(2, ttl_seconds=10, on_evict=lambda: evicted.append(1), clock=lambda: now[0])
+    lru.set("a", 1)
+    lru.set("b", 2)
+    lru.get("a")
+    lru.set("c", 3)
+    assert lru.get("b") is None
+    assert lru.get("a") == 1
+    assert len(evicted) == 1
+
+    now[0] = 11
+    assert lru.get("a") is None
+
+
+def test_sqlite_backend_shares_version_between_workers(tmp_path):
+    path = str(tmp_path / "version.db")
+    worker_a = TaskCache(SQLiteVersionBackend(path))
+    worker_b = TaskCache(SQLiteVersionBackend(path))
+    loads = []
+
+    def load():
+        loads.append(1)
+        return "rows"
+
+    worker_b.get_or_load("list", load)
+    worker_b.get_or_load("list", load)
+    worker_a.invalidate()
+    worker_b.get_or_load("list", load)
+    assert len(loads) == 2
@@ -0,0 +1,115 @@
+"""Test the incremental change feed."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models.task import Task, TaskDeletion
+from app.utils.pagination import _encode, decode_sync_token, encode_sync_token
+
+
+@pytest.fixture(autouse=True)
+def no_safety_lag(app):
+    """Advance tokens immediately, except in tests of the lag itself."""
+    app.config["TASK_CHANGES_SAFETY_LAG_SECONDS"] = 0
+
+
+def _sync(client, token=None, limit=100):
+    url = f"/api/v1/tasks/changes?limit={limit}" + (f"&since={token}" if token else "")
+    response = client.get(url)
+    assert response.status_code == 200
+    return response.json["data"]
+
+
+def test_initial_sync_returns_everything(client, db):
+    client.post("/api/v1/tasks", json={"title": "A"})
+    client.post("/api/v1/tasks", json={"title": "B"})
+    data = _sync(client)
+    assert [t["title"] for t in data["changes"]] == ["A", "B"]
+    assert data["deleted"] == []
+    assert data["has_more"] is False
+
+
+def test_incremental_sync_reports_updates_and_deletions(client, db):
+    a = client.post("/api/v1/tasks", json={"title": "A"}).json["data"]["id"]
+    b = client.post("/api/v1/tasks", json={"title": "B"}).json["data"]["id"]
+    token = _sync(client)["next_token"]
+
+    assert _sync(client, token)["changes"] == []
+
+    client.put(f"/api/v1/tasks/{a}", json={"completed": True})
+    client.delete(f"/api/v1/tasks/{b}")
+    data = _sync(client, token)
+    assert [t["id"] for t in data["changes"]] == [a]
+    assert data["deleted"] == [b]
+
+    caught_up = _sync(client, data["next_token"])
+    assert (caught_up["changes"], caught_up["deleted"], caught_up["has_more"]) == ([], [], False)
+    # Same position, re-issued now
+    assert decode_sync_token(caught_up["next_token"])[0] == decode_sync_token(
+        data["next_token"]
+    )[0]
+
+
+def test_sync_pages_with_has_more(client, db):
+    for title in "ABC":
+        client.post("/api/v1/tasks", json={"title": title})
+    first = _sync(client, limit=2)
+    assert first["has_more"] is True
+    second = _sync(client, first["next_token"], limit=2)
+    assert [t["title"] for t in second["changes"]] == ["C"]
+    assert second["has_more"] is False
+
+
+def test_bulk_delete_writes_tombstones(client, db):
+    ids = [client.post("/api/v1/tasks", json={"title": t}).json["data"]["id"] for t in "AB"]
+    client.delete("/api/v1/tasks", json={"ids": ids})
+    assert sorted(d.task_id for d in TaskDeletion.query.all()) == sorted(ids)
+
+
+def test_invalid_token_is_rejected(client, db):
+    assert client.get("/api/v1/tasks/changes?since=garbage").status_code == 422
+
+
+def test_token_does_not_pass_changes_inside_the_safety_lag(client, db):
+    client.application.config["TASK_CHANGES_SAFETY_LAG_SECONDS"] = 60
+    client.post("/api/v1/tasks", json={"title": "A"})
+    first = _sync(client)
+    # Delivered right away, and again until it is older than the lag
+    assert [t["title"] for t in first["changes"]] == ["A"]
+    assert [t["title"] for t in _sync(client, first["next_token"])["changes"]] == ["A"]
+
+    # A write stamped before that poll whose transaction committed after it
+    stamp = datetime.now(timezone.utc) - timedelta(seconds=30)
+    db.session.execute(
+        Task.__table__.insert().values(title="Late", created_at=stamp, updated_at=stamp)
+    )
+    db.session.commit()
+    assert [t["title"] for t in _sync(client, first["next_token"])["changes"]] == ["Late", "A"]
+
+
+def test_expired_tokens_must_resync(client, db):
+    client.post("/api/v1/tasks", json={"title": "A"})
+    old = encode_sync_token((None, 0, 0), datetime.now(timezone.utc) - timedelta(days=31))
+    legacy = _encode([None, 0, 0])
+    for token in (old, legacy):
+        response = client.get(f"/api/v1/tasks/changes?since={token}")
+        assert response.status_code == 410
+
+    client.application.config["TASK_DELETIONS_RETENTION_DAYS"] = 0
+    assert _sync(client, old)["changes"][0]["title"] == "A"
+
+
+def test_prune_drops_tombstones_past_the_retention(runner, client, db):
+    ids = [client.post("/api/v1/tasks", json={"title": t}).json["data"]["id"] for t in "AB"]
+    client.delete("/api/v1/tasks", json={"ids": ids})
+    log = TaskDeletion.__table__
+    db.session.execute(
+        log.update()
+        .where(log.c.task_id == ids[0])
+        .values(deleted_at=datetime.now(timezone.utc) - timedelta(days=40))
+    )
+    db.session.commit()
+
+    result = runner.invoke(args=["tasks", "prune"])
+    assert "Pruned 1 tombstone(s)" in result.output
+    assert [d.task_id for d in TaskDeletion.query.all()] == [ids[1]]
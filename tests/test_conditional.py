@@ -0,0 +1,115 @@
+"""Test ETag / conditional request handling."""
+from datetime import datetime, timedelta, timezone
+
+from app.models.task import Task
+from app.utils.query_metrics import capture_queries
+
+
+def _create(client, title="Task"):
+    return client.post("/api/v1/tasks", json={"title": title}).json["data"]["id"]
+
+
+def test_list_not_modified_until_a_write(client, db):
+    _create(client)
+    first = client.get("/api/v1/tasks")
+    etag = first.headers["ETag"]
+    assert first.headers["Last-Modified"]
+
+    cached = client.get("/api/v1/tasks", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.data == b""
+
+    _create(client, "Another")
+    assert client.get("/api/v1/tasks", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_list_etag_depends_on_query(client, db):
+    _create(client)
+    etag = client.get("/api/v1/tasks").headers["ETag"]
+    response = client.get("/api/v1/tasks?limit=1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+
+def test_single_task_not_modified(client, db):
+    task_id = _create(client)
+    etag = client.get(f"/api/v1/tasks/{task_id}").headers["ETag"]
+    response = client.get(f"/api/v1/tasks/{task_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_if_match_gives_optimistic_concurrency(client, db):
+    task_id = _create(client)
+    etag = client.get(f"/api/v1/tasks/{task_id}").headers["ETag"]
+
+    first = client.put(
+        f"/api/v1/tasks/{task_id}", json={"completed": True}, headers={"If-Match": etag}
+    )
+    assert first.status_code == 200
+    assert first.headers["ETag"] != etag
+
+    stale = client.put(
+        f"/api/v1/tasks/{task_id}", json={"title": "Lost update"}, headers={"If-Match": etag}
+    )
+    assert stale.status_code == 412
+
+    stale_delete = client.delete(f"/api/v1/tasks/{task_id}", headers={"If-Match": etag})
+    assert stale_delete.status_code == 412
+
+    fresh = client.delete(f"/api/v1/tasks/{task_id}", headers={"If-Match": first.headers["ETag"]})
+    assert fresh.status_code == 204
+
+
+def test_if_match_on_missing_task_is_404(client, db):
+    response = client.put("/api/v1/tasks/999", json={"completed": True}, headers={"If-Match": '"t999.1"'})
+    assert response.status_code == 404
+
+
+def test_list_validators_do_not_scan_the_table(client, db):
+    _create(client)
+    with capture_queries(db.engine, with_parameters=True) as statements:
+        client.get("/api/v1/tasks")
+    statement, parameters = next(s for s in statements if "max(" in s[0])
+    plan = [
+        row[3] for row in db.session.connection().exec_driver_sql(
+            "EXPLAIN QUERY PLAN " + statement, parameters
+        )
+        if row[3].startswith(("SCAN", "SEARCH"))
+    ]
+    # The max is one index probe, the newest tombstone a primary-key
+    # lookup and the count a counter lookup
+    assert plan == [
+        "SCAN CONSTANT ROW",
+        "SEARCH tasks USING COVERING INDEX ix_tasks_updated_at_id",
+        "SEARCH task_deletions USING INTEGER PRIMARY KEY (rowid=?)",
+        "SEARCH task_deletions",
+        "SEARCH task_counters USING INDEX sqlite_autoindex_task_counters_1 (name=?)",
+    ]
+
+
+def test_list_etag_follows_deletes_of_older_tasks(client, db):
+    older = _create(client, "Older")
+    _create(client, "Newer")
+    etag = client.get("/api/v1/tasks").headers["ETag"]
+
+    # The newest updated_at is unchanged; only the count moves
+    client.delete(f"/api/v1/tasks/{older}")
+    response = client.get("/api/v1/tasks", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert [task["title"] for task in response.json["data"]] == ["Newer"]
+
+
+def test_list_last_modified_follows_deletes_of_older_tasks(client, db):
+    older = _create(client, "Older")
+    _create(client, "Newer")
+    # Backdate the rows so the deletion lands in a later HTTP-date second
+    db.session.execute(
+        Task.__table__.update().values(updated_at=datetime.now(timezone.utc) - timedelta(hours=1))
+    )
+    db.session.commit()
+    last_modified = client.get("/api/v1/tasks").headers["Last-Modified"]
+
+    client.delete(f"/api/v1/tasks/{older}")
+    response = client.get("/api/v1/tasks", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 200
+    assert [task["title"] for task in response.json["data"]] == ["Newer"]
+    assert response.headers["Last-Modified"] != last_modified
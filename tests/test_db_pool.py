@@ -0,0 +1,76 @@
+"""Test connection pool profiles and pool metrics."""
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import exc
+from sqlalchemy.pool import NullPool
+
+from app import create_app
+from app.extensions import db as _db
+from app.utils.db_pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool, engine_options
+from config.settings import TestingConfig, pool_profile
+
+FILE_URI = "sqlite:////tmp/tasks.db"
+
+
+def _sample(name):
+    return REGISTRY.get_sample_value(name) or 0.0
+
+
+def test_profiles_derive_sizing_from_the_worker_model():
+    assert pool_profile("threaded", 8) == {"pool_size": 8, "max_overflow": 2, "pool_timeout": 10}
+    assert pool_profile("async", 5)["max_overflow"] == 10
+    assert pool_profile("serverless", 4) == {"pool_size": 1, "max_overflow": 3, "pool_timeout": 5}
+    with pytest.raises(ValueError):
+        pool_profile("forking", 4)
+
+
+def test_engine_options():
+    assert engine_options({}, FILE_URI) == {}
+    assert engine_options({"DB_POOL_PROFILE": "threaded"}, "sqlite:///:memory:") == {}
+
+    threaded = engine_options({"DB_POOL_PROFILE": "threaded", "DB_POOL_CONCURRENCY": 6}, FILE_URI)
+    assert threaded["poolclass"] is InstrumentedQueuePool
+    assert (threaded["pool_size"], threaded["pool_pre_ping"]) == (6, True)
+
+    optimistic = engine_options(
+        {"DB_POOL_PROFILE": "threaded", "DB_DISCONNECT_HANDLING": "optimistic",
+         "DB_POOL_MAX_OVERFLOW": 0},
+        FILE_URI,
+    )
+    assert optimistic["pool_pre_ping"] is False and optimistic["max_overflow"] == 0
+    with pytest.raises(ValueError):
+        engine_options({"DB_POOL_PROFILE": "threaded", "DB_DISCONNECT_HANDLING": "hopeful"}, FILE_URI)
+
+    serverless = engine_options({"DB_POOL_PROFILE": "serverless", "DB_POOL_SIZE": 0}, FILE_URI)
+    assert serverless["poolclass"] is NullPool and "max_overflow" not in serverless
+
+    asynchronous = engine_options({"ASYNC_DB_POOL_SIZE": 3}, FILE_URI, asynchronous=True)
+    assert asynchronous["poolclass"] is InstrumentedAsyncQueuePool
+    assert asynchronous["pool_size"] == 3
+
+
+def test_pool_wait_occupancy_and_timeouts_are_exported(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        TestingConfig, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{tmp_path / 'tasks.db'}"
+    )
+    monkeypatch.setattr(TestingConfig, "DB_POOL_PROFILE", "threaded")
+    monkeypatch.setattr(TestingConfig, "DB_POOL_SIZE", 1)
+    monkeypatch.setattr(TestingConfig, "DB_POOL_MAX_OVERFLOW", 0)
+    monkeypatch.setattr(TestingConfig, "DB_POOL_TIMEOUT", 0.05)
+    app = create_app("testing")
+    with app.app_context():
+        engine = _db.engine
+        assert isinstance(engine.pool, InstrumentedQueuePool)
+        waits = _sample("todo_api_db_pool_wait_seconds_count")
+        timeouts = _sample("todo_api_db_pool_timeouts_total")
+
+        with engine.connect():
+            assert _sample("todo_api_db_pool_in_use") == 1
+            assert _sample("todo_api_db_pool_saturation") == 1.0
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+        assert _sample("todo_api_db_pool_in_use") == 0
+        assert _sample("todo_api_db_pool_capacity") == 1
+        assert _sample("todo_api_db_pool_wait_seconds_count") == waits + 2
+        assert _sample("todo_api_db_pool_timeouts_total") == timeouts + 1
+        engine.dispose()
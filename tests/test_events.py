@@ -0,0 +1,85 @@
+"""Test the task event broker and the SSE stream endpoint."""
+import json
+
+from app import create_app
+from app.services.events import EventBroker, stream_capacity
+from app.utils.constants import ERR_STREAMS_UNAVAILABLE, ERR_TOO_MANY_STREAMS
+from config.settings import TestingConfig
+
+
+def _read_event(chunks):
+    """Return (event type, data) of the next non-comment SSE message."""
+    while True:
+        chunk = next(chunks).decode()
+        if chunk.startswith(("retry:", ":")):
+            continue
+        fields = dict(line.split(": ", 1) for line in chunk.strip().splitlines())
+        return fields["event"], json.loads(fields["data"])
+
+
+def test_publish_fans_out_to_every_subscriber():
+    broker = EventBroker()
+    first, second = broker.subscribe(), broker.subscribe()
+    broker.publish("task.deleted", {"id": 1})
+    assert first.get(timeout=0)[1:] == ("task.deleted", {"id": 1})
+    assert second.get(timeout=0)[1:] == ("task.deleted", {"id": 1})
+
+
+def test_slow_subscriber_is_dropped_instead_of_blocking():
+    broker = EventBroker(max_queue=1)
+    slow = broker.subscribe()
+    broker.publish("task.deleted", {"id": 1})
+    broker.publish("task.deleted", {"id": 2})
+    assert slow.dropped
+    assert not broker.has_subscribers
+
+
+def test_subscribe_refuses_beyond_capacity():
+    broker = EventBroker(max_subscribers=1)
+    subscription = broker.subscribe()
+    assert broker.subscribe() is None
+    broker.unsubscribe(subscription)
+    assert broker.subscribe() is not None
+
+
+def test_stream_delivers_task_changes(app, client, db):
+    app.config["TASK_EVENTS_HEARTBEAT_SECONDS"] = 0.01
+    response = client.get("/api/v1/tasks/stream", buffered=False)
+    assert response.status_code == 200
+    assert response.mimetype == "text/event-stream"
+    chunks = response.response
+
+    task_id = client.post("/api/v1/tasks", json={"title": "A"}).json["data"]["id"]
+    assert _read_event(chunks) == ("task.created", client.get(
+        f"/api/v1/tasks/{task_id}").json["data"])
+
+    client.delete(f"/api/v1/tasks/{task_id}")
+    assert _read_event(chunks) == ("task.deleted", {"id": task_id})
+    response.close()
+    assert not app.extensions["task_events"].has_subscribers
+
+
+def test_stream_returns_503_at_capacity(app, client, db):
+    app.extensions["task_events"].max_subscribers = 1
+    app.extensions["task_events"].subscribe()
+    response = client.get("/api/v1/tasks/stream")
+    assert response.status_code == 503
+    assert response.json["error"] == ERR_TOO_MANY_STREAMS
+
+
+def test_capacity_follows_the_worker_threads():
+    assert stream_capacity({"GUNICORN_THREADS": 4}) == 2
+    assert stream_capacity({"GUNICORN_THREADS": 16, "TASK_EVENTS_RESERVED_THREADS": 4}) == 12
+    # At least one thread is left for API calls
+    assert stream_capacity({"GUNICORN_THREADS": 2}) == 1
+    # The explicit cap can only lower the derived one
+    assert stream_capacity({"GUNICORN_THREADS": 16, "TASK_EVENTS_MAX_SUBSCRIBERS": 3}) == 3
+    assert stream_capacity({"GUNICORN_THREADS": 4, "TASK_EVENTS_MAX_SUBSCRIBERS": 50}) == 2
+    assert stream_capacity({"GUNICORN_THREADS": 1}) == 0
+
+
+def test_sync_workers_refuse_streams(monkeypatch):
+    monkeypatch.setattr(TestingConfig, "GUNICORN_THREADS", 1)
+    response = create_app("testing").test_client().get("/api/v1/tasks/stream")
+    assert response.status_code == 503
+    assert response.json["error"] == ERR_STREAMS_UNAVAILABLE
@@ -0,0 +1,40 @@
+"""Test streaming task export."""
+import csv
+import io
+import json
+
+from app.models.task import Task
+
+
+def _seed(db, count):
+    for i in range(count):
+        db.session.add(Task(title=f"Task {i}", description=f"Line {i}, with comma"))
+    db.session.commit()
+
+
+def test_export_ndjson(client, db):
+    _seed(db, 3)
+    response = client.get("/api/v1/tasks/export")
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.mimetype == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [line["title"] for line in lines] == ["Task 0", "Task 1", "Task 2"]
+
+
+def test_export_csv(client, db):
+    _seed(db, 2)
+    response = client.get("/api/v1/tasks/export?format=csv")
+    assert response.mimetype == "text/csv"
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+    assert [row["description"] for row in rows] == ["Line 0, with comma", "Line 1, with comma"]
+
+
+def test_export_empty_csv_has_header(client, db):
+    response = client.get("/api/v1/tasks/export?format=csv")
+    assert response.get_data(as_text=True).startswith("id,title,description")
+
+
+def test_export_rejects_unknown_format(client, db):
+    response = client.get("/api/v1/tasks/export?format=xml")
+    assert response.status_code == 422
@@ -0,0 +1,37 @@
+"""Test the column-tuple fast read path produces the same responses."""
+import pytest
+
+from app.models.task import Task
+from app.utils import serialization
+
+
+@pytest.fixture
+def seeded(db):
+    db.session.add_all([Task(title="First", description="d"), Task(title="Second")])
+    db.session.commit()
+    return db
+
+
+@pytest.mark.parametrize("url", ["/api/v1/tasks", "/api/v1/tasks?limit=1", "/api/v1/tasks/1"])
+def test_fast_path_matches_orm_path(app, client, seeded, url):
+    app.config["TASKS_FAST_READ_PATH"] = False
+    expected = client.get(url).json
+
+    app.config["TASKS_FAST_READ_PATH"] = True
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.json == expected
+
+
+def test_fast_path_not_found(app, client, db):
+    app.config["TASKS_FAST_READ_PATH"] = True
+    assert client.get("/api/v1/tasks/999").status_code == 404
+
+
+def test_stdlib_fallback_matches_orjson(monkeypatch, seeded):
+    rows = [Task.row_to_raw_dict(row) for row in seeded.session.execute(
+        Task.__table__.select()
+    )]
+    encoded = serialization.dumps({"data": rows})
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert serialization.dumps({"data": rows}) == encoded
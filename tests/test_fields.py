@@ -0,0 +1,62 @@
+"""Test sparse fieldsets and column narrowing on task reads."""
+import pytest
+from sqlalchemy import inspect
+
+from app.models.task import Task
+from app.services.task_service import TaskService
+from app.utils.query_metrics import capture_queries
+
+
+@pytest.fixture
+def seeded(db):
+    db.session.add_all([Task(title="First", description="long text"), Task(title="Second")])
+    db.session.commit()
+    return db
+
+
+@pytest.fixture(params=[False, True], ids=["orm", "fast"])
+def read_path(request, app):
+    app.config["TASKS_FAST_READ_PATH"] = request.param
+
+
+def _selects(db, client, url):
+    """Return the response and the SELECT statements it issued."""
+    with capture_queries(db.engine) as statements:
+        response = client.get(url)
+    return response, [s for s in statements if s.startswith("SELECT")]
+
+
+@pytest.mark.usefixtures("read_path")
+def test_list_fields_narrow_payload_and_select(client, seeded):
+    response, statements = _selects(seeded, client, "/api/v1/tasks?fields=title,completed")
+    assert response.json["data"] == [
+        {"id": 2, "title": "Second", "completed": False},
+        {"id": 1, "title": "First", "completed": False},
+    ]
+    assert not any("description" in statement for statement in statements)
+
+
+@pytest.mark.usefixtures("read_path")
+def test_get_fields_narrow_payload_and_select(client, seeded):
+    response, statements = _selects(seeded, client, "/api/v1/tasks/1?fields=description")
+    assert response.json["data"] == {"id": 1, "description": "long text"}
+    assert response.headers["ETag"]
+    assert not any("title" in statement for statement in statements)
+
+
+@pytest.mark.usefixtures("read_path")
+def test_cursor_follows_sort_column_outside_fieldset(client, seeded):
+    first = client.get("/api/v1/tasks?fields=title&limit=1").json
+    second = client.get(f"/api/v1/tasks?fields=title&limit=1&cursor={first['next_cursor']}")
+    assert second.json["data"] == [{"id": 1, "title": "First"}]
+
+
+def test_orm_list_defers_description(seeded):
+    tasks = TaskService.get_all_tasks(fields=("id", "title"))
+    assert all("description" in inspect(task).unloaded for task in tasks)
+
+
+def test_unknown_field_is_rejected(client, db):
+    response = client.get("/api/v1/tasks?fields=title,secret")
+    assert response.status_code == 422
+    assert client.get("/api/v1/tasks/1?fields=secret").status_code == 422
@@ -0,0 +1,140 @@
+"""Test server-side filtering and sorting of the task list."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.utils.constants import ERR_CURSOR_MISMATCH
+from app.utils.query_metrics import capture_queries
+
+
+def _titles(client, **params):
+    response = client.get("/api/v1/tasks", query_string=params)
+    assert response.status_code == 200
+    return [task["title"] for task in response.json["data"]]
+
+
+@pytest.fixture
+def tasks(client, db):
+    for title in ("A", "B", "C"):
+        client.post("/api/v1/tasks", json={"title": title})
+    client.put("/api/v1/tasks/2", json={"completed": True})
+    return client
+
+
+def test_filter_by_status(tasks):
+    assert _titles(tasks, completed="false") == ["C", "A"]
+    assert _titles(tasks, completed="true") == ["B"]
+
+
+def test_filter_by_time_ranges(tasks):
+    created = tasks.get("/api/v1/tasks/2").json["data"]
+    assert _titles(tasks, created_after=created["created_at"]) == ["C"]
+    assert _titles(tasks, created_before=created["created_at"]) == ["A"]
+    assert _titles(tasks, updated_after=created["updated_at"]) == []
+    earlier = datetime.fromisoformat(created["updated_at"]) - timedelta(microseconds=1)
+    assert _titles(tasks, updated_after=earlier.isoformat()) == ["B"]
+
+
+def test_sort_ascending_paginates_with_cursor(tasks):
+    first = tasks.get("/api/v1/tasks", query_string={"sort": "created_at", "limit": 2})
+    assert [t["title"] for t in first.json["data"]] == ["A", "B"]
+    assert _titles(
+        tasks, sort="created_at", limit=2, cursor=first.json["next_cursor"]
+    ) == ["C"]
+
+
+def test_sort_by_updated_at(tasks):
+    assert _titles(tasks, sort="-updated_at") == ["B", "C", "A"]
+
+
+def test_invalid_filter_values_are_rejected(client, db):
+    assert client.get("/api/v1/tasks?sort=title").status_code == 422
+    assert client.get("/api/v1/tasks?completed=maybe").status_code == 422
+    assert client.get("/api/v1/tasks?created_after=yesterday").status_code == 422
+
+
+def _list_query_plan(client, db, **params):
+    """EXPLAIN QUERY PLAN of the list statement issued for ``params``."""
+    with capture_queries(db.engine, with_parameters=True) as statements:
+        assert client.get("/api/v1/tasks", query_string=params).status_code == 200
+    statement, parameters = [s for s in statements if "ORDER BY" in s[0]][-1]
+    rows = db.session.connection().exec_driver_sql(
+        "EXPLAIN QUERY PLAN " + statement, parameters
+    )
+    return " | ".join(row[3] for row in rows)
+
+
+_SINCE = datetime(2024, 1, 1, tzinfo=timezone.utc).isoformat()
+
+
+@pytest.mark.parametrize(
+    "params, expected",
+    [
+        ({"completed": "false", "created_after": _SINCE},
+         "SEARCH tasks USING INDEX ix_tasks_open_created_at (created_at>?)"),
+        ({"created_after": _SINCE},
+         "SEARCH tasks USING INDEX ix_tasks_created_at_id (created_at>?)"),
+        ({"created_before": _SINCE},
+         "SEARCH tasks USING INDEX ix_tasks_created_at_id (created_at<?)"),
+        ({"updated_after": _SINCE, "sort": "-updated_at"},
+         "SEARCH tasks USING INDEX ix_tasks_updated_at_id (updated_at>?)"),
+        # Another sort only orders the rows found in the updated_at range
+        ({"updated_after": _SINCE},
+         "SEARCH tasks USING INDEX ix_tasks_updated_at_id (updated_at>?)"
+         " | USE TEMP B-TREE FOR ORDER BY"),
+        ({"updated_after": _SINCE, "completed": "false", "sort": "created_at"},
+         "SEARCH tasks USING INDEX ix_tasks_updated_at_id (updated_at>?)"
+         " | USE TEMP B-TREE FOR ORDER BY"),
+    ],
+)
+def test_filters_are_answered_by_an_index_range(client, db, params, expected):
+    # A range search of the index, never a full scan
+    assert _list_query_plan(client, db, **params) == expected
+
+
+def test_updated_after_pages_keep_the_sort(tasks):
+    since = tasks.get("/api/v1/tasks").json["data"][-1]["updated_at"]
+    tasks.put("/api/v1/tasks/1", json={"title": "A2"})
+    params, titles = {"updated_after": since, "limit": 1}, []
+    while True:
+        page = tasks.get("/api/v1/tasks", query_string=params).json
+        titles += [task["title"] for task in page["data"]]
+        if not page["next_cursor"]:
+            break
+        params["cursor"] = page["next_cursor"]
+    # Newest created first, as without the filter
+    assert titles == ["C", "B", "A2"]
+
+
+@pytest.mark.parametrize(
+    "params, expected",
+    [
+        ({}, "SEARCH tasks USING INDEX ix_tasks_created_at_id (created_at<?)"),
+        ({"sort": "created_at"},
+         "SEARCH tasks USING INDEX ix_tasks_created_at_id (created_at>?)"),
+        ({"completed": "false"},
+         "SEARCH tasks USING INDEX ix_tasks_open_created_at (created_at<?)"),
+        ({"completed": "true"},
+         "SEARCH tasks USING INDEX ix_tasks_done_created_at (created_at<?)"),
+        ({"sort": "-updated_at"},
+         "SEARCH tasks USING INDEX ix_tasks_updated_at_id (updated_at<?)"),
+    ],
+)
+def test_next_pages_seek_with_an_index_range(tasks, db, params, expected):
+    # Two open and two completed tasks, so each listing has a second page
+    tasks.put("/api/v1/tasks/1", json={"completed": True})
+    tasks.post("/api/v1/tasks", json={"title": "D"})
+    first = tasks.get("/api/v1/tasks", query_string={**params, "limit": 1})
+    cursor = first.json["next_cursor"]
+    assert _list_query_plan(tasks, db, **params, limit=1, cursor=cursor) == expected
+
+
+def test_cursor_is_bound_to_its_sort_and_filter(tasks):
+    cursor = tasks.get("/api/v1/tasks", query_string={"limit": 1}).json["next_cursor"]
+    # The page size and fields may change between pages
+    assert _titles(tasks, limit=5, cursor=cursor, fields="title") == ["B", "A"]
+
+    for params in ({"sort": "created_at"}, {"completed": "false"}, {"created_after": _SINCE}):
+        response = tasks.get("/api/v1/tasks", query_string={**params, "cursor": cursor})
+        assert response.status_code == 422
+        assert ERR_CURSOR_MISMATCH in response.json["error"]
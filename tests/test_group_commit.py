@@ -0,0 +1,132 @@
+"""Test group commit of concurrent task creations."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app import create_app
+from app.extensions import db as _db
+from app.services.events import get_event_broker
+from app.services.task_service import TaskService
+from config.settings import TestingConfig
+
+
+@pytest.fixture
+def grouped(monkeypatch, tmp_path):
+    """App with group commit on a file database, with a generous delay."""
+    monkeypatch.setattr(
+        TestingConfig, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{tmp_path / 'tasks.db'}"
+    )
+    monkeypatch.setattr(TestingConfig, "TASK_GROUP_COMMIT_ENABLED", True)
+    monkeypatch.setattr(TestingConfig, "TASK_GROUP_COMMIT_MAX_DELAY_MS", 50)
+    app = create_app("testing")
+    yield app
+    with app.app_context():
+        _db.session.remove()
+        _db.drop_all()
+
+
+def _post_all(app, payloads):
+    def post(payload):
+        return app.test_client().post("/api/v1/tasks", json=payload)
+
+    with ThreadPoolExecutor(len(payloads)) as pool:
+        return list(pool.map(post, payloads))
+
+
+def _groups():
+    return (
+        REGISTRY.get_sample_value("todo_api_group_commit_size_count") or 0,
+        REGISTRY.get_sample_value("todo_api_group_commit_size_sum") or 0,
+    )
+
+
+def test_disabled_by_default(client):
+    assert "task_group_commit" not in client.application.extensions
+
+
+def test_concurrent_creates_share_commits(grouped):
+    groups, items = _groups()
+    responses = _post_all(grouped, [{"title": f"Task {i}"} for i in range(20)])
+
+    assert [response.status_code for response in responses] == [201] * 20
+    tasks = [response.json["data"] for response in responses]
+    # Every caller got its own row back
+    assert [task["title"] for task in tasks] == [f"Task {i}" for i in range(20)]
+    assert len({task["id"] for task in tasks}) == 20
+
+    new_groups, new_items = _groups()
+    assert new_items - items == 20
+    assert new_groups - groups < 20
+    with grouped.app_context():
+        assert TaskService.get_stats()["total"] == 20
+
+
+def test_duplicates_in_one_group_resolve_to_one_task(grouped):
+    grouped.config["TASK_DEDUP_WINDOW_SECONDS"] = 2
+    responses = _post_all(grouped, [{"title": "Same", "description": "x"}] * 5)
+    assert len({response.json["data"]["id"] for response in responses}) == 1
+    with grouped.app_context():
+        assert TaskService.get_stats()["total"] == 1
+
+
+def test_a_failed_group_fails_its_callers_only(grouped, monkeypatch):
+    def broken(tasks_data, announce_each=False):
+        raise RuntimeError("disk full")
+
+    original = TaskService.create_tasks
+    monkeypatch.setattr(TaskService, "create_tasks", staticmethod(broken))
+    response = grouped.test_client().post("/api/v1/tasks", json={"title": "Lost"})
+    assert response.status_code == 500 and "disk full" in response.json["error"]
+
+    monkeypatch.setattr(TaskService, "create_tasks", staticmethod(original))
+    response = grouped.test_client().post("/api/v1/tasks", json={"title": "Kept"})
+    assert response.status_code == 201
+
+
+class _Crash(BaseException):
+    """Escapes ``except Exception``, like SystemExit would."""
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_a_dead_flusher_fails_its_group_then_falls_back(grouped, monkeypatch):
+    def crash(tasks_data, announce_each=False):
+        raise _Crash()
+
+    original = TaskService.create_tasks
+    monkeypatch.setattr(TaskService, "create_tasks", staticmethod(crash))
+    response = grouped.test_client().post("/api/v1/tasks", json={"title": "Lost"})
+    assert response.status_code == 500
+
+    # Later creates no longer wait for the dead thread
+    monkeypatch.setattr(TaskService, "create_tasks", staticmethod(original))
+    response = grouped.test_client().post("/api/v1/tasks", json={"title": "Direct"})
+    assert response.status_code == 201
+    with grouped.app_context():
+        assert TaskService.get_stats()["total"] == 1
+
+
+def test_callers_stop_waiting_for_a_stuck_group(grouped, monkeypatch):
+    release = threading.Event()
+    original = TaskService.create_tasks
+
+    def stuck(tasks_data, announce_each=False):
+        release.wait(5)
+        return original(tasks_data, announce_each)
+
+    grouped.extensions["task_group_commit"].timeout = 0.1
+    monkeypatch.setattr(TaskService, "create_tasks", staticmethod(stuck))
+    try:
+        response = grouped.test_client().post("/api/v1/tasks", json={"title": "Slow"})
+        assert response.status_code == 500
+    finally:
+        release.set()
+
+
+def test_each_grouped_task_is_announced(grouped):
+    with grouped.app_context():
+        subscription = get_event_broker().subscribe()
+    grouped.test_client().post("/api/v1/tasks", json={"title": "Announced"})
+    _, event_type, payload = subscription.get(timeout=1)
+    assert (event_type, payload["title"]) == ("task.created", "Announced")
@@ -0,0 +1,141 @@
+"""Test Idempotency-Key handling of task writes."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app import create_app
+from app.extensions import db as _db
+from app.models.task import Task
+from app.services.idempotency import IdempotencyStore, SQLiteIdempotencyBackend
+from app.services.task_service import TaskService
+from app.utils.error_handlers import APIError
+from config.settings import TestingConfig
+
+
+def _post(client, key, payload):
+    return client.post("/api/v1/tasks", json=payload, headers={"Idempotency-Key": key})
+
+
+def test_retry_replays_the_stored_response_without_queries(client, db, query_counter):
+    first = _post(client, "k1", {"title": "Pay invoice"})
+    with query_counter() as statements:
+        retry = _post(client, "k1", {"title": "Pay invoice"})
+
+    assert statements == []
+    assert (retry.status_code, retry.json) == (201, first.json)
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert "Idempotent-Replayed" not in first.headers
+    assert Task.query.count() == 1
+
+    # A new key (or none) is a new request
+    other = _post(client, "k2", {"title": "Pay invoice"})
+    assert other.json["data"]["id"] != first.json["data"]["id"]
+    assert Task.query.count() == 2
+
+
+def test_key_reused_for_another_request_is_rejected(client, db):
+    _post(client, "k1", {"title": "One"})
+    assert _post(client, "k1", {"title": "Two"}).status_code == 422
+    response = client.put(
+        "/api/v1/tasks/1", json={"title": "One"}, headers={"Idempotency-Key": "k1"}
+    )
+    assert response.status_code == 422
+    assert _post(client, "x" * 256, {"title": "Long key"}).status_code == 400
+
+
+def test_retry_while_the_first_attempt_runs_conflicts(client, db, monkeypatch):
+    started, release = threading.Event(), threading.Event()
+    original = TaskService.create_task
+
+    def slow(task_data):
+        started.set()
+        release.wait(5)
+        return original(task_data)
+
+    monkeypatch.setattr(TaskService, "create_task", staticmethod(slow))
+    with ThreadPoolExecutor(1) as pool:
+        first = pool.submit(_post, client.application.test_client(), "k1", {"title": "Slow"})
+        assert started.wait(5)
+        assert _post(client, "k1", {"title": "Slow"}).status_code == 409
+        release.set()
+        assert first.result().status_code == 201
+    assert _post(client, "k1", {"title": "Slow"}).headers["Idempotent-Replayed"] == "true"
+
+
+def test_server_errors_are_not_stored(client, db, monkeypatch):
+    def broken(task_data):
+        raise RuntimeError("database is locked")
+
+    original = TaskService.create_task
+    monkeypatch.setattr(TaskService, "create_task", staticmethod(broken))
+    assert _post(client, "k1", {"title": "Flaky"}).status_code == 500
+
+    monkeypatch.setattr(TaskService, "create_task", staticmethod(original))
+    response = _post(client, "k1", {"title": "Flaky"})
+    assert response.status_code == 201 and "Idempotent-Replayed" not in response.headers
+
+
+def test_update_and_delete_replay(client, db):
+    task_id = client.post("/api/v1/tasks", json={"title": "Draft"}).json["data"]["id"]
+    headers = {"Idempotency-Key": "done"}
+    first = client.put(f"/api/v1/tasks/{task_id}", json={"completed": True}, headers=headers)
+    retry = client.put(f"/api/v1/tasks/{task_id}", json={"completed": True}, headers=headers)
+    assert retry.json == first.json and retry.headers["ETag"] == first.headers["ETag"]
+
+    headers = {"Idempotency-Key": "gone"}
+    assert client.delete(f"/api/v1/tasks/{task_id}", headers=headers).status_code == 204
+    # Without the key, the retry would be a 404
+    assert client.delete(f"/api/v1/tasks/{task_id}", headers=headers).status_code == 204
+
+
+def test_disabled(monkeypatch):
+    monkeypatch.setattr(TestingConfig, "IDEMPOTENCY_ENABLED", False)
+    app = create_app("testing")
+    with app.app_context():
+        _db.create_all()
+        client = app.test_client()
+        _post(client, "k1", {"title": "Twice"})
+        _post(client, "k1", {"title": "Twice"})
+        assert Task.query.count() == 2
+        _db.drop_all()
+
+
+def test_sqlite_backend_is_shared_between_workers(tmp_path):
+    path = str(tmp_path / "keys.db")
+    first = IdempotencyStore(SQLiteIdempotencyBackend(path, ttl_seconds=60, max_entries=10))
+    second = IdempotencyStore(SQLiteIdempotencyBackend(path, ttl_seconds=60, max_entries=10))
+
+    assert first.begin("k1", "fp") is None
+    with pytest.raises(APIError) as in_progress:
+        second.begin("k1", "fp")
+    assert in_progress.value.status_code == 409
+
+    headers = {"Content-Type": "application/json", "Content-Length": "2"}
+    first.finish("k1", "fp", (201, headers, b"{}"))
+    status, headers, body = second.begin("k1", "fp")
+    assert (status, body) == (201, b"{}")
+    assert headers == {"Content-Type": "application/json", "Idempotent-Replayed": "true"}
+
+    # A failed attempt frees the key for the next worker
+    assert first.begin("k2", "fp") is None
+    first.finish("k2", "fp", (500, {}, b""))
+    assert second.begin("k2", "fp") is None
+
+
+def test_sqlite_backend_is_bounded(tmp_path):
+    now = [1000.0]
+    backend = SQLiteIdempotencyBackend(
+        str(tmp_path / "keys.db"), ttl_seconds=60, max_entries=3, clock=lambda: now[0]
+    )
+    for i in range(5):
+        assert backend.claim(f"k{i}", "fp") is None
+        backend.complete(f"k{i}", "fp", (204, {}, b""))
+    rows = backend._connection().execute("SELECT key FROM idempotency_keys").fetchall()
+    assert sorted(key for key, in rows) == ["k2", "k3", "k4"]
+
+    now[0] += 61
+    assert backend.claim("k4", "other") is None
+    # Unfinished claims lapse after their lease
+    now[0] += backend.lease_seconds + 1
+    assert backend.claim("k4", "fp") is None
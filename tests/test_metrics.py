@@ -0,0 +1,42 @@
+"""Test request metrics recording and multiprocess exposition."""
+from prometheus_client import REGISTRY
+
+from app import create_app
+from app.utils.metrics import collect_metrics
+from config.settings import TestingConfig
+
+
+def _count(metric, **labels):
+    return REGISTRY.get_sample_value(metric, labels) or 0.0
+
+
+def test_requests_are_counted_by_route_and_method(client, db):
+    labels = {"method": "GET", "endpoint": "/api/v1/tasks/<int:task_id>"}
+    before = _count("todo_api_request_count_total", http_status="404", **labels)
+    errors = _count("todo_api_error_count_total", http_status="404", **labels)
+    latency = _count("todo_api_request_latency_seconds_count", **labels)
+
+    client.get("/api/v1/tasks/424242")
+
+    assert _count("todo_api_request_count_total", http_status="404", **labels) == before + 1
+    assert _count("todo_api_error_count_total", http_status="404", **labels) == errors + 1
+    assert _count("todo_api_request_latency_seconds_count", **labels) == latency + 1
+
+
+def test_label_values_are_bounded(client):
+    labels = {"method": "OTHER", "endpoint": "<unmatched>", "http_status": "404"}
+    before = _count("todo_api_request_count_total", **labels)
+    client.open("/no/such/path/123", method="BREW")
+    assert _count("todo_api_request_count_total", **labels) == before + 1
+
+
+def test_metrics_can_be_disabled(monkeypatch):
+    monkeypatch.setattr(TestingConfig, "METRICS_ENABLED", False)
+    assert "request_metrics" not in create_app("testing").extensions
+
+
+def test_multiprocess_collection_reads_the_shared_directory(monkeypatch, tmp_path):
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    # No worker has written samples yet, so none of this process's
+    # in-memory metrics may leak into the aggregated output
+    assert b"python_gc_objects_collected_total" not in collect_metrics()
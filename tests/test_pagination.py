@@ -0,0 +1,100 @@
+"""Test keyset pagination of the task list."""
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+
+from app.models.task import Task
+from app.utils.constants import MAX_PAGE_SIZE
+
+
+def _seed(db, count):
+    base = datetime(2025, 1, 1)
+    for i in range(count):
+        # Pairs of tasks share a timestamp to exercise the id tie-breaker
+        db.session.add(Task(title=f"Task {i}", created_at=base + timedelta(seconds=i // 2)))
+    db.session.commit()
+
+
+def test_pages_cover_all_tasks_once(client, db):
+    """Following next_cursor visits every task exactly once, newest first."""
+    _seed(db, 7)
+
+    seen = []
+    cursor = None
+    while True:
+        url = "/api/v1/tasks?limit=3" + (f"&cursor={cursor}" if cursor else "")
+        response = client.get(url)
+        assert response.status_code == 200
+        seen.extend(task["id"] for task in response.json["data"])
+        cursor = response.json["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == 7
+    assert len(set(seen)) == 7
+    assert seen == sorted(seen, reverse=True)
+
+
+def test_last_page_has_no_cursor(client, db):
+    _seed(db, 2)
+    response = client.get("/api/v1/tasks?limit=2")
+    assert len(response.json["data"]) == 2
+    assert response.json["next_cursor"] is None
+
+
+def test_limit_above_maximum_is_rejected(client, db):
+    response = client.get(f"/api/v1/tasks?limit={MAX_PAGE_SIZE + 1}")
+    assert response.status_code == 422
+
+
+def test_invalid_cursor_is_rejected(client, db):
+    response = client.get("/api/v1/tasks?cursor=not-a-cursor")
+    assert response.status_code == 422
+
+
+def _follow(client, limit):
+    """Ids of every page, failing instead of looping on a repeated cursor."""
+    seen, cursor = [], None
+    for _ in range(20):
+        url = f"/api/v1/tasks?limit={limit}" + (f"&cursor={cursor}" if cursor else "")
+        body = client.get(url).json
+        seen.extend(task["id"] for task in body["data"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return seen
+    raise AssertionError(f"pagination did not terminate: {seen}")
+
+
+def test_raw_inserts_page_and_validate(client, db):
+    """Rows timestamped by the server default page like ORM-written rows."""
+    for i in range(5):
+        db.session.execute(
+            text("INSERT INTO tasks (title, completed) VALUES (:t, 0)"), {"t": f"Raw {i}"}
+        )
+    db.session.commit()
+
+    assert sorted(_follow(client, 2)) == [1, 2, 3, 4, 5]
+    etag = client.get("/api/v1/tasks/1").headers["ETag"]
+    response = client.put(
+        "/api/v1/tasks/1", json={"completed": True}, headers={"If-Match": etag}
+    )
+    assert response.status_code == 200
+
+
+def test_migrate_normalizes_second_precision_timestamps(client, runner, db):
+    """Rows written with CURRENT_TIMESTAMP by older releases are fixed up."""
+    for i in range(5):
+        db.session.execute(
+            text(
+                "INSERT INTO tasks (title, completed, created_at, updated_at) "
+                "VALUES (:t, 0, '2025-01-01 12:00:00', '2025-01-01 12:00:00')"
+            ),
+            {"t": f"Legacy {i}"},
+        )
+    db.session.commit()
+
+    result = runner.invoke(args=["tasks", "migrate"])
+    assert "Normalized timestamps of 5 task(s)" in result.output
+    assert sorted(_follow(client, 2)) == [1, 2, 3, 4, 5]
+    etag = client.get("/api/v1/tasks/3").headers["ETag"]
+    assert client.delete("/api/v1/tasks/3", headers={"If-Match": etag}).status_code == 204
@@ -0,0 +1,87 @@
+"""Test sampled request profiling and the admin profile endpoints."""
+import pstats
+import time
+
+import pytest
+
+from app import create_app
+from app.extensions import db as _db
+from app.utils.profiling import (
+    PROFILE_HEADER, RequestProfiler, sign_profile_request, verify_profile_request,
+)
+from config.settings import TestingConfig
+
+SECRET = "profiling-secret"
+ADMIN = {"Authorization": "Bearer admin-token"}
+
+
+@pytest.fixture
+def profiled(monkeypatch, tmp_path):
+    """Client of an app with profiling on and random sampling off."""
+    monkeypatch.setattr(TestingConfig, "PROFILING_ENABLED", True)
+    monkeypatch.setattr(TestingConfig, "PROFILING_DIR", str(tmp_path))
+    monkeypatch.setattr(TestingConfig, "PROFILING_SECRET", SECRET)
+    monkeypatch.setattr(TestingConfig, "PROFILING_MAX_FILES", 3)
+    monkeypatch.setattr(TestingConfig, "ADMIN_TOKEN", "admin-token")
+    app = create_app("testing")
+    with app.app_context():
+        _db.create_all()
+        yield app.test_client()
+        _db.session.remove()
+        _db.drop_all()
+
+
+def _signed():
+    return {PROFILE_HEADER: sign_profile_request(SECRET, int(time.time()) + 60)}
+
+
+def test_disabled_profiling_registers_nothing(client):
+    assert "request_profiler" not in client.application.extensions
+    assert client.get("/api/v1/admin/profiles", headers=ADMIN).status_code == 404
+
+
+def test_signature_is_checked():
+    header = sign_profile_request(SECRET, int(time.time()) + 60)
+    assert verify_profile_request(SECRET, header)
+    assert not verify_profile_request("other", header)
+    assert not verify_profile_request(SECRET, sign_profile_request(SECRET, 1))
+    assert not verify_profile_request(SECRET, "garbage")
+
+
+def test_signed_request_is_profiled_and_listed(profiled):
+    profiled.get("/api/v1/tasks")
+    assert profiled.get("/api/v1/admin/profiles", headers=ADMIN).json["data"] == []
+
+    profiled.get("/api/v1/tasks", headers=_signed())
+
+    profiles = profiled.get("/api/v1/admin/profiles", headers=ADMIN).json["data"]
+    assert [(p["method"], p["endpoint"]) for p in profiles] == [("GET", "api-v1-tasks")]
+
+    name = profiles[0]["name"]
+    text = profiled.get(f"/api/v1/admin/profiles/{name}?format=text", headers=ADMIN)
+    assert "get_tasks" in text.get_data(as_text=True)
+    raw = profiled.get(f"/api/v1/admin/profiles/{name}", headers=ADMIN)
+    assert raw.status_code == 200 and raw.data
+
+
+def test_profiles_are_rotated(profiled, tmp_path):
+    for _ in range(5):
+        profiled.get("/api/v1/tasks", headers=_signed())
+        time.sleep(0.002)  # Distinct millisecond timestamps
+    assert len(list(tmp_path.glob("*.prof"))) == 3
+    pstats.Stats(str(next(tmp_path.glob("*.prof"))))
+
+
+def test_sample_rate(tmp_path):
+    assert RequestProfiler(str(tmp_path), sample_rate=1.0).wants(None)
+    assert not RequestProfiler(str(tmp_path), sample_rate=0.0).wants(None)
+
+
+def test_admin_endpoints_require_token(profiled):
+    assert profiled.get("/api/v1/admin/profiles").status_code == 401
+    wrong = {"Authorization": "Bearer nope"}
+    assert profiled.get("/api/v1/admin/profiles", headers=wrong).status_code == 401
+    missing = profiled.get("/api/v1/admin/profiles/../../etc/passwd", headers=ADMIN)
+    assert missing.status_code == 404
+    unknown = profiled.get("/api/v1/admin/profiles/1_GET_1_x.prof", headers=ADMIN)
+    assert unknown.status_code == 404
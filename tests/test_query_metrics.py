@@ -0,0 +1,88 @@
+"""Test per-request SQL instrumentation and per-endpoint query budgets."""
+import logging
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.models.task import Task
+
+
+@pytest.fixture
+def seeded(db):
+    db.session.add_all([Task(title="First"), Task(title="Second")])
+    db.session.commit()
+    return db
+
+
+def _statements_observed(endpoint):
+    return REGISTRY.get_sample_value(
+        "todo_api_db_statements_sum", {"endpoint": endpoint}
+    ) or 0
+
+
+@pytest.mark.parametrize(
+    "method, url, body, expected",
+    [
+        ("get", "/api/v1/tasks", None, 2),
+        ("get", "/api/v1/tasks/1", None, 1),
+        ("get", "/api/v1/tasks/stats", None, 1),
+        ("put", "/api/v1/tasks/1", {"title": "Renamed", "description": None}, 1),
+        ("put", "/api/v1/tasks/1", {"title": "Renamed"}, 2),
+        ("put", "/api/v1/tasks/1", {"completed": True}, 3),
+        ("delete", "/api/v1/tasks/1", None, 3),
+        ("post", "/api/v1/tasks", {"title": "New"}, 3),
+    ],
+)
+def test_endpoint_query_counts(client, seeded, query_counter, method, url, body, expected):
+    with query_counter() as statements:
+        response = getattr(client, method)(url, json=body)
+    assert response.status_code < 300
+    assert len(statements) == expected
+
+
+def test_batch_create_is_not_one_insert_per_row(client, seeded, query_counter):
+    tasks = [{"title": f"Task {i}"} for i in range(2500)]
+    with query_counter() as statements:
+        response = client.post("/api/v1/tasks/batch", json={"tasks": tasks})
+    assert response.json["data"]["summary"]["created"] == 2500
+    inserts = [s for s in statements if s.startswith("INSERT INTO tasks")]
+    assert len(inserts) <= 3
+    assert [r["data"]["title"] for r in response.json["data"]["results"]] == [
+        t["title"] for t in tasks
+    ]
+
+
+def test_statement_histogram_is_labelled_by_endpoint(client, seeded):
+    before = _statements_observed("/api/v1/tasks/<int:task_id>")
+    client.get("/api/v1/tasks/1")
+    assert _statements_observed("/api/v1/tasks/<int:task_id>") == before + 1
+
+
+def test_server_timing_header(app, client, seeded):
+    assert "Server-Timing" not in client.get("/api/v1/tasks/1").headers
+    app.config["SQL_SERVER_TIMING"] = True
+    header = client.get("/api/v1/tasks/1").headers["Server-Timing"]
+    assert header.startswith("db;dur=")
+    assert header.endswith('desc="1 queries"')
+
+
+def test_statement_budget_warning(app, client, seeded, caplog):
+    app.config["SQL_STATEMENT_BUDGET"] = 1
+    with caplog.at_level(logging.WARNING):
+        client.get("/api/v1/tasks/1")
+        assert "budget" not in caplog.text
+        client.get("/api/v1/tasks")
+    assert "GET /api/v1/tasks executed 2 SQL statements (budget 1)" in caplog.text
+
+
+def test_repeated_statement_warning(app, client, seeded, caplog):
+    db = seeded
+    app.config["SQL_REPEAT_THRESHOLD"] = 2
+
+    @app.route("/n-plus-one")
+    def n_plus_one():
+        return {"titles": [db.session.get(Task, i).title for i in (1, 2)]}
+
+    with caplog.at_level(logging.WARNING):
+        client.get("/n-plus-one")
+    assert "repeated a SQL statement 2 times (possible N+1)" in caplog.text
@@ -0,0 +1,69 @@
+"""Test full-text search over tasks."""
+from sqlalchemy import text
+
+from app.migrations import upgrade
+
+
+def _search(client, q, **params):
+    response = client.get("/api/v1/tasks", query_string={"q": q, **params})
+    assert response.status_code == 200
+    return [task["title"] for task in response.json["data"]]
+
+
+def test_search_ranks_title_matches_first(client, db):
+    client.post("/api/v1/tasks", json={"title": "Groceries", "description": "buy milk"})
+    client.post("/api/v1/tasks", json={"title": "Milk the cow"})
+    client.post("/api/v1/tasks", json={"title": "Unrelated"})
+    assert _search(client, "milk") == ["Milk the cow", "Groceries"]
+    assert _search(client, "milk", limit=1) == ["Milk the cow"]
+
+
+def test_search_ranks_older_matches_too(client, db):
+    client.post("/api/v1/tasks", json={"title": "Milk run"})
+    for i in range(30):
+        client.post("/api/v1/tasks", json={"title": f"Chore {i}", "description": "milk"})
+    assert _search(client, "milk", limit=3)[0] == "Milk run"
+
+    # Filters are applied before ranking and limiting
+    done = client.post("/api/v1/tasks", json={"title": "Milk the cow"}).json["data"]["id"]
+    client.put(f"/api/v1/tasks/{done}", json={"completed": True})
+    assert _search(client, "milk", limit=3, completed="true") == ["Milk the cow"]
+    assert _search(client, "milk", limit=3, completed="false")[0] == "Milk run"
+
+
+def test_search_requires_every_word(client, db):
+    client.post("/api/v1/tasks", json={"title": "Buy milk", "description": "oat"})
+    client.post("/api/v1/tasks", json={"title": "Buy bread"})
+    assert _search(client, "buy OAT") == ["Buy milk"]
+
+
+def test_search_treats_operators_as_text(client, db):
+    client.post("/api/v1/tasks", json={"title": "Call NEAR office"})
+    assert _search(client, 'office" NEAR(*') == ["Call NEAR office"]
+    assert _search(client, "***") == []
+
+
+def test_search_follows_updates_and_deletes(client, db):
+    task_id = client.post("/api/v1/tasks", json={"title": "Old title"}).json["data"]["id"]
+    client.put(f"/api/v1/tasks/{task_id}", json={"title": "New title"})
+    assert _search(client, "old") == []
+    assert _search(client, "new") == ["New title"]
+    client.delete(f"/api/v1/tasks/{task_id}")
+    assert _search(client, "new") == []
+
+
+def test_search_rejects_cursor(client, db):
+    response = client.get("/api/v1/tasks", query_string={"q": "x", "cursor": "abc"})
+    assert response.status_code == 422
+
+
+def test_migrate_builds_index_for_existing_rows(app, client, db):
+    client.post("/api/v1/tasks", json={"title": "Existing task"})
+    with db.engine.begin() as conn:
+        conn.execute(text("DROP TABLE tasks_fts"))
+        for trigger in ("tasks_fts_ai", "tasks_fts_ad", "tasks_fts_au"):
+            conn.execute(text(f"DROP TRIGGER {trigger}"))
+
+    assert "Created full-text search index" in upgrade()
+    assert _search(client, "existing") == ["Existing task"]
+    assert "Created full-text search index" not in upgrade()
@@ -0,0 +1,52 @@
+"""Test synthetic task seeding (``flask tasks seed``)."""
+from sqlalchemy import select
+
+from app.models.task import Task
+from app.seeding import seed_tasks
+from app.services.task_service import TaskService
+
+
+def _rows(db):
+    table = Task.__table__
+    return db.session.execute(
+        select(table.c.title, table.c.description, table.c.completed).order_by(table.c.id)
+    ).all()
+
+
+def test_seed_is_deterministic_and_keeps_counters(db):
+    report = seed_tasks(250, completed_ratio=0.4, description_size=50, seed=7, chunk_size=100)
+    first = _rows(db)
+    assert report["rows"] == 250 and report["method"] == "insert"
+    assert len(first) == 250
+    assert all(len(description) <= 50 for _, description, _ in first)
+
+    stats = TaskService.get_stats()
+    assert stats["total"] == 250
+    assert stats["completed"] == sum(completed for _, _, completed in first)
+    assert 50 < stats["completed"] < 150
+
+    db.session.execute(Task.__table__.delete())
+    db.session.commit()
+    seed_tasks(250, completed_ratio=0.4, description_size=50, seed=7, chunk_size=50)
+    assert _rows(db) == first
+
+
+def test_seeded_rows_are_ordered_and_searchable(client, db):
+    seed_tasks(20, description_size=0, seed=1)
+    tasks = client.get("/api/v1/tasks?limit=20").json["data"]
+    assert [task["id"] for task in tasks] == list(range(20, 0, -1))
+    assert all(task["description"] is None for task in tasks)
+    assert all(task["updated_at"] >= task["created_at"] for task in tasks)
+
+    word = tasks[0]["title"].split()[0]
+    assert client.get(f"/api/v1/tasks?q={word}").json["data"]
+    # The search triggers are back in place for regular writes
+    client.post("/api/v1/tasks", json={"title": "Zanzibar"})
+    assert len(client.get("/api/v1/tasks?q=zanzibar").json["data"]) == 1
+
+
+def test_seed_command(runner, db):
+    result = runner.invoke(args=["tasks", "seed", "--count", "30", "--seed", "3"])
+    assert result.exit_code == 0, result.output
+    assert "Inserted 30 tasks" in result.output and "rows/s" in result.output
+    assert TaskService.get_stats()["total"] == 30
@@ -0,0 +1,91 @@
+"""Test the SQLite connection profile (WAL and friends)."""
+import pytest
+from sqlalchemy import text
+
+from app import create_app
+from app.extensions import db as _db, sqlite_pragma_statements
+from config.settings import TestingConfig, _optional_number
+
+
+@pytest.fixture
+def file_app(monkeypatch, tmp_path):
+    """Factory of apps on a file-backed SQLite database."""
+    monkeypatch.setattr(
+        TestingConfig, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{tmp_path / 'tasks.db'}"
+    )
+
+    def make(**settings):
+        for key, value in settings.items():
+            monkeypatch.setattr(TestingConfig, key, value)
+        return create_app("testing")
+
+    return make
+
+
+def _pragma(name):
+    return _db.session.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_profile_is_applied_to_new_connections(file_app):
+    app = file_app(SQLITE_MMAP_SIZE=1048576, SQLITE_CACHE_SIZE=-2000)
+    with app.app_context():
+        assert _pragma("journal_mode") == "wal"
+        assert _pragma("synchronous") == 1  # NORMAL
+        assert _pragma("mmap_size") == 1048576
+        assert _pragma("cache_size") == -2000
+        assert _pragma("busy_timeout") == 5000
+        assert _pragma("temp_store") == 2  # MEMORY
+        _db.session.remove()
+
+
+def test_profile_can_be_disabled(file_app):
+    app = file_app(SQLITE_PRAGMAS_ENABLED=False)
+    with app.app_context():
+        assert _pragma("journal_mode") == "delete"
+        _db.session.remove()
+
+
+def test_open_reads_do_not_block_commits(file_app):
+    app = file_app(SQLITE_BUSY_TIMEOUT_MS=100)
+    with app.app_context():
+        with _db.engine.connect() as reader, _db.engine.connect() as writer:
+            reader.execute(text("BEGIN"))
+            assert reader.execute(text("SELECT count(*) FROM tasks")).scalar() == 0
+            # Under the rollback journal this commit waits for the reader
+            # and fails with "database is locked" after busy_timeout
+            writer.execute(text("INSERT INTO tasks (title, completed) VALUES ('w', 0)"))
+            writer.commit()
+            # The open read transaction keeps its snapshot
+            assert reader.execute(text("SELECT count(*) FROM tasks")).scalar() == 0
+            reader.execute(text("COMMIT"))
+
+
+def test_statements_skip_empty_and_reject_unsafe_values():
+    config = {
+        "SQLITE_PRAGMAS_ENABLED": True,
+        "SQLITE_JOURNAL_MODE": "WAL",
+        "SQLITE_SYNCHRONOUS": "",
+        "SQLITE_CACHE_SIZE": -64,
+    }
+    assert sqlite_pragma_statements(config) == [
+        "PRAGMA journal_mode = WAL", "PRAGMA cache_size = -64",
+    ]
+    assert sqlite_pragma_statements({**config, "SQLITE_PRAGMAS_ENABLED": False}) == []
+    with pytest.raises(ValueError):
+        sqlite_pragma_statements({**config, "SQLITE_JOURNAL_MODE": "WAL; DROP TABLE tasks"})
+
+
+
+def test_empty_numeric_settings_skip_and_zero_is_applied(monkeypatch):
+    monkeypatch.setenv("SQLITE_MMAP_SIZE", "0")
+    monkeypatch.setenv("SQLITE_CACHE_SIZE", "")
+    assert _optional_number("SQLITE_MMAP_SIZE", default="268435456") == 0
+    assert _optional_number("SQLITE_CACHE_SIZE", default="-65536") is None
+    assert _optional_number("SQLITE_BUSY_TIMEOUT_MS", default="5000") == 5000
+
+    statements = sqlite_pragma_statements({
+        "SQLITE_PRAGMAS_ENABLED": True,
+        "SQLITE_MMAP_SIZE": 0,
+        "SQLITE_CACHE_SIZE": None,
+    })
+    assert statements == ["PRAGMA mmap_size = 0"]
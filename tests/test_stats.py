@@ -0,0 +1,70 @@
+"""Test the counter-backed task statistics."""
+from app.models.task import Task
+
+
+def _stats(client):
+    response = client.get("/api/v1/tasks/stats")
+    assert response.status_code == 200
+    return response.json["data"]
+
+
+def test_stats_follow_every_write_path(client, db):
+    assert _stats(client) == {"total": 0, "open": 0, "completed": 0}
+
+    task_id = client.post("/api/v1/tasks", json={"title": "A"}).json["data"]["id"]
+    client.post("/api/v1/tasks/batch", json={"tasks": [{"title": "B"}, {"title": "C"}]})
+    assert _stats(client) == {"total": 3, "open": 3, "completed": 0}
+
+    client.put(f"/api/v1/tasks/{task_id}", json={"completed": True})
+    client.put(f"/api/v1/tasks/{task_id}", json={"completed": True})  # no transition
+    client.put(f"/api/v1/tasks/{task_id}", json={"title": "A2"})
+    assert _stats(client) == {"total": 3, "open": 2, "completed": 1}
+
+    response = client.patch(
+        "/api/v1/tasks", json={"filter": {}, "ids": [1, 2, 3], "changes": {"completed": True}}
+    )
+    assert response.json["data"] == {"affected": 2}
+    assert _stats(client) == {"total": 3, "open": 0, "completed": 3}
+
+    client.delete(f"/api/v1/tasks/{task_id}")
+    assert _stats(client) == {"total": 2, "open": 0, "completed": 2}
+    client.delete("/api/v1/tasks", json={"filter": {"completed": True}})
+    assert _stats(client) == {"total": 0, "open": 0, "completed": 0}
+
+
+def test_reconcile_reports_and_repairs_drift(runner, client, db):
+    client.post("/api/v1/tasks", json={"title": "A"})
+    # Writes that bypass TaskService leave the counters stale
+    db.session.execute(Task.__table__.insert().values(title="Raw", completed=True))
+    db.session.commit()
+
+    result = runner.invoke(args=["tasks", "reconcile"])
+    assert result.exit_code == 0
+    assert "total: stored 1, actual 2 (drift -1)" in result.output
+    assert "completed: stored 0, actual 1 (drift -1)" in result.output
+    assert _stats(client) == {"total": 2, "open": 1, "completed": 1}
+
+    result = runner.invoke(args=["tasks", "reconcile"])
+    assert "Counters are accurate" in result.output
+
+
+def test_null_status_is_rejected_and_never_corrupts_counters(runner, client, db):
+    task_id = client.post("/api/v1/tasks", json={"title": "A"}).json["data"]["id"]
+    for payload in ({"completed": None}, {"title": None}):
+        response = client.put(f"/api/v1/tasks/{task_id}", json=payload)
+        assert response.status_code == 422
+    # description may still be cleared explicitly
+    assert client.put(f"/api/v1/tasks/{task_id}", json={"description": None}).status_code == 200
+    assert _stats(client) == {"total": 1, "open": 1, "completed": 0}
+
+    # Rows written around the API with a NULL status count as open
+    db.session.execute(Task.__table__.insert().values(title="Raw", completed=None))
+    db.session.commit()
+    raw_id = db.session.query(Task.id).filter(Task.title == "Raw").scalar()
+    runner.invoke(args=["tasks", "reconcile"])
+    assert _stats(client) == {"total": 2, "open": 2, "completed": 0}
+
+    assert client.put(f"/api/v1/tasks/{raw_id}", json={"completed": False}).status_code == 200
+    assert _stats(client) == {"total": 2, "open": 2, "completed": 0}
+    assert client.delete(f"/api/v1/tasks/{raw_id}").status_code == 204
+    assert _stats(client) == {"total": 1, "open": 1, "completed": 0}
@@ -58,3 +58,64 @@ def test_update_task(client, db, app):
         assert response.status_code == 200
         assert response.json["data"]["title"] == "Updated Task"
         assert response.json["data"]["completed"] is True
+
+
+def test_create_task_returns_recent_duplicate(client, db):
+    """Test an identical task posted within the window is not duplicated."""
+    client.application.config["TASK_DEDUP_WINDOW_SECONDS"] = 2
+    payload = {"title": "Dup Task", "description": "Same"}
+    first = client.post("/api/v1/tasks", json=payload)
+    second = client.post("/api/v1/tasks", json=payload)
+    assert first.json["data"]["id"] == second.json["data"]["id"]
+    assert Task.query.count() == 1
+
+
+def test_create_task_without_dedup_window_inserts_every_post(client, db):
+    """Test identical posts are separate tasks when dedup is off (default)."""
+    payload = {"title": "Dup Task", "description": "Same"}
+    first = client.post("/api/v1/tasks", json=payload)
+    second = client.post("/api/v1/tasks", json=payload)
+    assert first.json["data"]["id"] != second.json["data"]["id"]
+    assert Task.query.count() == 2
+
+
+def test_migrate_backfills_content_hash(runner, db):
+    """Test `flask tasks migrate` fills content_hash for legacy rows."""
+    task = Task(title="Legacy", description="Old row")
+    db.session.add(task)
+    db.session.commit()
+    db.session.execute(Task.__table__.update().values(content_hash=None))
+    db.session.commit()
+    updated_at = task.updated_at
+
+    result = runner.invoke(args=["tasks", "migrate"])
+    assert result.exit_code == 0
+    assert "Backfilled content_hash for 1 task(s)" in result.output
+    db.session.expire_all()
+    assert task.content_hash == Task.compute_content_hash("Legacy", "Old row")
+    assert task.updated_at == updated_at
+
+
+def test_update_missing_task_returns_404(client, db):
+    """Test PUT on an unknown id is reported from the empty RETURNING result."""
+    response = client.put("/api/v1/tasks/12345", json={"completed": True})
+    assert response.status_code == 404
+
+
+def test_delete_missing_task_returns_404(client, db):
+    """Test DELETE on an unknown id returns 404."""
+    response = client.delete("/api/v1/tasks/12345")
+    assert response.status_code == 404
+
+
+def test_partial_update_recomputes_content_hash(client, db):
+    """Test a title-only edit keeps the task matching duplicate checks."""
+    client.application.config["TASK_DEDUP_WINDOW_SECONDS"] = 60
+    payload = {"title": "Old", "description": "Kept"}
+    task_id = client.post("/api/v1/tasks", json=payload).json["data"]["id"]
+    client.put(f"/api/v1/tasks/{task_id}", json={"title": "New"})
+    assert db.session.get(Task, task_id).content_hash == Task.compute_content_hash("New", "Kept")
+
+    duplicate = client.post("/api/v1/tasks", json={"title": "New", "description": "Kept"})
+    assert duplicate.json["data"]["id"] == task_id
+    assert client.put("/api/v1/tasks/12345", json={"description": "x"}).status_code == 404